@@ -0,0 +1,147 @@
+"""
+Micro-benchmark: row-wise vs vectorized birthdate parsing on the real raw Madden CSVs.
+
+Re-implements the original per-row parsers as the reference, checks the vectorized parsers produce identical output
+for every season that goes through them (plus a set of edge cases), and reports the per-season speedup.
+
+Run from the project root:
+    python -m benchmarks.birthdate_parsing
+"""
+import time
+
+import pandas as pd
+
+from src.transforms.madden import (
+    MADDEN_DIR,
+    MONTH_TO_NUM,
+    _madden_column_normalizer,
+    _parse_birthdate_cells,
+    _parse_day_month_year,
+)
+
+REPEATS = 5
+
+
+# ---------- Reference (original row-wise) implementation -------------------
+def _month_to_int(m):
+    if pd.isna(m):
+        return None
+    key = str(m).strip().lower()
+    if key in MONTH_TO_NUM:
+        return MONTH_TO_NUM[key]
+    try:
+        num = int(float(key))
+        if 1 <= num <= 12:
+            return num
+    except ValueError:
+        pass
+    return None
+
+
+def _row_to_date(r):
+    d_raw, m_raw, y_raw = r['birthday'], r['birthmonth'], r['birthyear']
+    if pd.isna(d_raw) or pd.isna(m_raw) or pd.isna(y_raw):
+        return pd.NaT
+    try:
+        day = int(float(d_raw))
+        year = int(float(y_raw))
+        month = _month_to_int(m_raw)
+        if month is None:
+            return pd.NaT
+        return pd.Timestamp(year=year, month=month, day=day)
+    except Exception:
+        return pd.NaT
+
+
+def _century_fix(yy):
+    return 2000 + yy if yy < 35 else 1900 + yy
+
+
+def _safe_ts(y, m, d):
+    try:
+        return pd.Timestamp(year=y, month=m, day=d)
+    except ValueError:
+        return pd.NaT
+
+
+def _parse_cell(x):
+    if pd.isna(x):
+        return pd.NaT
+    x_str = str(x).strip()
+    if x_str.isdigit():
+        n = len(x_str)
+        if n == 6:
+            return _safe_ts(_century_fix(int(x_str[4:])), int(x_str[:2]), int(x_str[2:4]))
+        if n == 5:
+            return _safe_ts(_century_fix(int(x_str[3:])), int(x_str[0]), int(x_str[1:3]))
+        if n == 4:
+            return _safe_ts(_century_fix(int(x_str[2:])), int(x_str[0]), int(x_str[1]))
+    try:
+        return pd.to_datetime(x, errors="raise").normalize()
+    except Exception:
+        return pd.NaT
+
+
+def _legacy_day_month_year(df):
+    return pd.to_datetime(df.apply(_row_to_date, axis=1))
+
+
+def _legacy_cells(s):
+    return pd.to_datetime(s.apply(_parse_cell))
+
+
+# ---------- Harness ---------------------------------------------------------
+def _best_of(func, *args):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _read_raw_columns(season):
+    df = pd.read_csv(f'{MADDEN_DIR}/raw/{season}.csv', low_memory=False)
+    df.columns = [_madden_column_normalizer(i) for i in df.columns]
+    return df
+
+
+def _assert_same(season, expected, actual):
+    expected = expected.astype('datetime64[ns]')
+    if not expected.equals(actual):
+        diff = expected.ne(actual) & ~(expected.isna() & actual.isna())
+        raise AssertionError(f"{season}: vectorized output differs on {int(diff.sum())} rows")
+
+
+def check_edge_cases():
+    cells = pd.Series(['32589', '123199', '1299', '022930', '7/4/96', '1988-05-14 00:00:00', 'garbage', None, '1234567', 81599])
+    _assert_same('edge cells', _legacy_cells(cells), _parse_birthdate_cells(cells))
+    dmy = pd.DataFrame({
+        'birthday': [23.0, '5', 31, 30, None, 1.9, 12],
+        'birthmonth': ['July', 'jul', 'Feb', 13, 'March', '3.000', 'nan'],
+        'birthyear': [1976.0, '1980', 1990, 1990, 1985, 1991.0, 1999],
+    })
+    _assert_same('edge dmy', _legacy_day_month_year(dmy), _parse_day_month_year(dmy['birthday'], dmy['birthmonth'], dmy['birthyear']))
+
+
+def run():
+    check_edge_cases()
+    print(f"{'season':>6} {'format':<16} {'rows':>6} {'row-wise ms':>12} {'vectorized ms':>14} {'speedup':>8}")
+    for season in range(2001, 2026):
+        df = _read_raw_columns(season)
+        if 'birthday' in df.columns:
+            fmt = 'day/month/year'
+            legacy_t, expected = _best_of(_legacy_day_month_year, df)
+            vector_t, actual = _best_of(_parse_day_month_year, df['birthday'], df['birthmonth'], df['birthyear'])
+        elif 'birthdate' in df.columns and season in [2018, 2019]:
+            fmt = 'mixed cells'
+            legacy_t, expected = _best_of(_legacy_cells, df['birthdate'])
+            vector_t, actual = _best_of(_parse_birthdate_cells, df['birthdate'])
+        else:
+            continue
+        _assert_same(season, expected, actual)
+        print(f"{season:>6} {fmt:<16} {len(df):>6} {legacy_t * 1000:>12.1f} {vector_t * 1000:>14.1f} {legacy_t / vector_t:>7.1f}x")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,113 @@
+"""
+Benchmark: imputer backends on masked processed Madden ratings.
+
+Hides a random share of the known Madden attributes of every position group, imputes the group with each backend
+through the same passes as the dataset stage (ImputationPlan) and scores the hidden values. Reports the RMSE of every
+attribute per backend and the wall time per position group per backend. archetype / runningstyle are codes, they are
+imputed but not scored.
+
+Run from the project root:
+    python -m benchmarks.imputer_backends
+    python -m benchmarks.imputer_backends --groups o_rush quarterback --backends knn softimpute --mask 0.2
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from nfl_data_loader.schemas.players.madden import MADDEN_ATTRIBUTE_MAP
+
+from src.modeling.imputer import PASS_STARTS, PASS_TARGET_COLUMNS, STYLE_COLUMNS, ImputationPlan, MaddenImputationRunner
+from src.modeling.imputer_backends import IMPUTER_BACKENDS
+
+SCORED_ATTRIBUTES = [col for col in MADDEN_ATTRIBUTE_MAP.keys() if col not in ['archetype', 'runningstyle']]
+
+
+def _plan(runner, group_df):
+    # Same row order as MaddenImputationRunner.impute_position_group
+    return ImputationPlan(
+        group_df.sort_values(by=['season', 'overallrating'], ascending=[False, False]),
+        columns=STYLE_COLUMNS,
+        find_bins=runner.find_optimal_bins
+    )
+
+
+def _hidden_cells(plan, mask_fraction, seed):
+    """Random share of the known scored cells of a plan matrix."""
+    scored = np.isin(plan.columns, SCORED_ATTRIBUTES)
+    known = ~np.isnan(plan.matrix) & scored[None, :]
+    return known & (np.random.default_rng(seed).random(plan.matrix.shape) < mask_fraction)
+
+
+def impute_masked(runner, group_df, backend, mask_fraction, seed):
+    """
+    Impute one group with `mask_fraction` of its known attributes hidden.
+
+    :return: (seconds, long frame of hidden cells with attribute, truth and imputed value)
+    """
+    plan = _plan(runner, group_df)
+    hidden = _hidden_cells(plan, mask_fraction, seed)
+    truth = plan.matrix[hidden]
+    plan.matrix[hidden] = np.nan
+
+    start = time.perf_counter()
+    for pass_key, first_season in PASS_STARTS.items():
+        plan.run_pass(first_season, PASS_TARGET_COLUMNS[pass_key], backend=backend)
+    seconds = time.perf_counter() - start
+
+    cols = np.nonzero(hidden)[1]
+    cells = pd.DataFrame({
+        'attribute': np.asarray(plan.columns)[cols],
+        'truth': truth.astype(np.float64),
+        'imputed': plan.matrix[hidden].astype(np.float64),
+    })
+    return seconds, cells
+
+
+def run(groups=None, backends=None, mask_fraction=0.1, seed=0):
+    runner = MaddenImputationRunner()
+    runner.load_base_ratings()
+    runner.group_base_ratings()
+    groups = groups or list(runner.base_rating_groups)
+    backends = backends or list(IMPUTER_BACKENDS)
+
+    timings, errors = [], []
+    for position_group in groups:
+        group_df = runner.base_rating_groups[position_group]
+        for backend in backends:
+            seconds, cells = impute_masked(runner, group_df, backend, mask_fraction, seed)
+            # Rows without a last_season_av bin are never imputed
+            unscored = int(cells['imputed'].isna().sum())
+            cells = cells.dropna(subset=['imputed'])
+            squared = (cells['imputed'] - cells['truth']) ** 2
+            timings.append({
+                'position_group': position_group, 'backend': backend, 'rows': len(group_df), 'seconds': seconds,
+                'hidden': len(cells), 'unscored': unscored, 'rmse': float(np.sqrt(squared.mean())),
+            })
+            errors.append(squared.groupby(cells['attribute']).agg(['sum', 'count']).assign(backend=backend))
+            print(f"{position_group:<14} {backend:<16} {seconds:>8.1f}s  rmse {timings[-1]['rmse']:.3f}")
+
+    timings = pd.DataFrame(timings)
+    errors = pd.concat(errors).reset_index().groupby(['attribute', 'backend'])[['sum', 'count']].sum()
+    rmse = np.sqrt(errors['sum'] / errors['count']).unstack('backend')[backends]
+    overall = errors.groupby('backend').sum()
+    rmse.loc['ALL'] = np.sqrt(overall['sum'] / overall['count'])[backends]
+    wall = timings.pivot(index='position_group', columns='backend', values='seconds')[backends].loc[groups]
+    wall.loc['TOTAL'] = wall.sum()
+
+    pd.set_option('display.width', 200)
+    print(f"\nRMSE on {int(errors['count'].sum() / len(backends))} hidden attribute values ({mask_fraction:.0%} of known)")
+    print(rmse.round(3).to_string())
+    print("\nWall seconds per position group")
+    print(wall.round(1).to_string())
+    return rmse, timings
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--groups', nargs='+', default=None, help='Position groups (default: every group)')
+    parser.add_argument('--backends', nargs='+', default=None, choices=list(IMPUTER_BACKENDS), help='Backends (default: every backend)')
+    parser.add_argument('--mask', type=float, default=0.1, help='Share of the known attribute values hidden')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the hidden cells')
+    args = parser.parse_args()
+    run(groups=args.groups, backends=args.backends, mask_fraction=args.mask, seed=args.seed)
@@ -0,0 +1 @@
+# Puts the project root on sys.path so tests import `src` and the runners like the pipeline does
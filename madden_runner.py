@@ -1,33 +1,62 @@
-import os
-
-import pandas as pd
-from nfl_data_loader.utils.utils import get_seasons_to_update, find_year_for_season
+import argparse
 
+from src.extracts.http_cache import set_offline
 from src.extracts.madden import make_raw_madden
 from src.modeling.imputer import make_dataset_madden
+from src.pipeline.executor import write_season_frames
+from src.pipeline.manifest import builder_modules, plan_stage, record_stage_build, stage_fingerprints
 from src.transforms.madden import make_stage_madden
 from src.transforms.madden_registry import make_processed_madden
 
+## Stage DAG: raw -> stage -> processed -> dataset (+ data/pfr/approximate_value feeding processed)
+## `upstream` lists the per-season inputs of a stage, `code` the files whose edits invalidate every season (the import
+## closure of the builder, see src.pipeline.manifest.builder_modules). `cross_season` stages compute every season from
+## all seasons (registry matching across seasons, imputers fitted on every season): every season the builder returns is
+## written and recorded, not only the planned ones, so no season file is left behind the rebuilt registry / imputers.
+## `refresh_latest_season` stages also join live sources (nflverse rosters) that no upstream file fingerprints: their
+## latest season is rebuilt on every run.
 raw_madden_meta = {
     "name":'raw',
     "start_season": 2001,
     "raw_obj": make_raw_madden,
+    "file_format": 'csv',
     }
 stage_madden_meta = {
     "name":'stage',
     "start_season": 2001,
     "raw_obj": make_stage_madden,
+    "file_format": 'parquet',
+    "upstream": [
+        {"path": './data/madden/raw/{season}.csv'},
+    ],
+    "code": builder_modules(make_stage_madden, data_files=["src/transforms/madden_overrides.csv"]),
     }
 processed_madden_meta = {
     "name":'processed',
     "start_season": 2001,
     "raw_obj": make_processed_madden,
+    "file_format": 'parquet',
+    "exports": ['csv'], # published csv consumed via github raw (src.extracts.madden.get_madden_ratings)
+    "upstream": [
+        {"path": './data/madden/stage/{season}.parquet'},
+        {"path": './data/pfr/approximate_value/{season}.csv', "season_offset": -1},
+    ],
+    "code": builder_modules(make_processed_madden),
+    "cross_season": True,
+    "refresh_latest_season": True,
     }
 
 dataset_madden_meta = {
     "name": 'dataset',
     "start_season": 2001,
     "raw_obj": make_dataset_madden,
+    "file_format": 'parquet',
+    "upstream": [
+        {"path": './data/madden/processed/{season}.parquet'},
+        {"path": './data/madden/missed/missed.csv', "season_column": 'season', "required": False},
+    ],
+    "code": builder_modules(make_dataset_madden),
+    "cross_season": True,
 }
 
 FEATURE_STORE_METAS = [
@@ -39,31 +68,40 @@ FEATURE_STORE_METAS = [
 
 
 
-def madden_runner():
-    root_path = './data/madden'
-    for fs_meta_obj in FEATURE_STORE_METAS:
-        feature_store_name = fs_meta_obj['name']
-        start_season = fs_meta_obj['start_season']
-        ## Determine pump mode
-        update_seasons = get_seasons_to_update(root_path, feature_store_name)
-        current_season = find_year_for_season()
-        update_seasons = list(range(2001, 2026))
-        skip_raw = False
-        if len(update_seasons) == 1 and update_seasons[0] == current_season:
-            try:
-                a = pd.read_csv(f"{root_path}/{feature_store_name}/{update_seasons[0]}.csv")
-                print('Madden Data Up to Date Skipping Raw...')
-                skip_raw = True
+def madden_runner(full_rebuild=False, workers=None, root_path='./data/madden', metas=None):
+    """
+    Walk the stage DAG in order and rebuild only the seasons whose upstream inputs or builder code changed since
+    their last build (see src.pipeline.manifest.plan_stage).
 
-            except Exception as e:
-                 skip_raw = False # File does not exist yet
-        if not skip_raw:
-            frames = fs_meta_obj['raw_obj'](update_seasons)
-            for season, df in frames.items():
-                if feature_store_name == 'dataset':
-                    df.to_parquet(f"{root_path}/{feature_store_name}/{season}.parquet", index=False)
-                else:
-                    df.to_csv(f"{root_path}/{feature_store_name}/{season}.csv", index=False)
+    :param full_rebuild: ignore recorded fingerprints and rebuild every season
+    :param workers: process pool size for per-season work (see src.pipeline.executor.resolve_workers)
+    :param root_path: feature store root
+    :param metas: stage metas in DAG order (default FEATURE_STORE_METAS)
+    """
+    for fs_meta_obj in metas if metas is not None else FEATURE_STORE_METAS:
+        feature_store_name = fs_meta_obj['name']
+        plan = plan_stage(root_path, fs_meta_obj, full_rebuild=full_rebuild)
+        update_seasons = sorted(plan.keys())
+        if len(update_seasons) == 0:
+            print(f'Madden {feature_store_name} Data Up to Date Skipping...')
+            continue
+        print(f'Rebuilding Madden {feature_store_name} for seasons: {update_seasons}')
+        frames = fs_meta_obj['raw_obj'](update_seasons, workers=workers)
+        if fs_meta_obj.get('cross_season'):
+            # Seasons outside the plan were recomputed as well and may differ from their files now
+            plan = {**stage_fingerprints(fs_meta_obj, frames.keys()), **plan}
+        frames = {season: df for season, df in frames.items() if season in plan}
+        built_seasons = write_season_frames(
+            frames, root_path, feature_store_name, fs_meta_obj['file_format'], exports=fs_meta_obj.get('exports', ()), workers=workers
+        )
+        record_stage_build(root_path, fs_meta_obj, plan, built_seasons)
 
 if __name__ == '__main__':
-    madden_runner()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--full', action='store_true', help='Rebuild every season regardless of recorded fingerprints')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes for per-season work (0 = one per core, default MADDEN_WORKERS or 1)')
+    parser.add_argument('--offline', action='store_true', help='Replay external fetches from the http cache only')
+    args = parser.parse_args()
+    if args.offline:
+        set_offline()
+    madden_runner(full_rebuild=args.full, workers=args.workers)
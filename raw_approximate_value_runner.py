@@ -1,9 +1,11 @@
+import argparse
 import os
 
 import pandas as pd
 from nfl_data_loader.utils.utils import get_seasons_to_update, find_year_for_season
 
-from src.extracts.pfr import get_approximate_values
+from src.extracts.http_cache import set_offline
+from src.extracts.pfr import clear_checkpoints, get_approximate_values
 
 approximate_value_meta = {
     "name":'approximate_value',
@@ -16,11 +18,13 @@ FEATURE_STORE_METAS = [
 
 
 
-def raw_pfr_runner():
+def raw_pfr_runner(requests_per_minute=None, workers=3):
     """
     At the start of a new season we will pull the previous year's rosters to get the approximate values. Acts as an
     initial rating for the next season for the player. Rookie and missing player av's will be imputed using a KNNImputer in a later step.
 
+    :param requests_per_minute: PFR request budget shared by all workers
+    :param workers: concurrent fetch workers
     :return:
     """
     root_path = './data/pfr'
@@ -41,11 +45,19 @@ def raw_pfr_runner():
                 skip_raw = False # File does not exist yet
                 update_seasons = [update_seasons[0]-1, update_seasons[0]]
         if not skip_raw:
-            frames = fs_meta_obj['raw_obj'](update_seasons)
+            frames = fs_meta_obj['raw_obj'](update_seasons, requests_per_minute=requests_per_minute, workers=workers)
             for season, df in frames.items():
                 df.to_csv(f"{root_path}/{feature_store_name}/{season}.csv", index=False)
+                clear_checkpoints(season)
 
 
 
 if __name__ == '__main__':
-    raw_pfr_runner()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--offline', action='store_true', help='Replay PFR pages from the http cache only')
+    parser.add_argument('--rpm', type=float, default=None, help='PFR requests per minute (default PFR_REQUESTS_PER_MINUTE or 10)')
+    parser.add_argument('--workers', type=int, default=3, help='Concurrent PFR fetch workers')
+    args = parser.parse_args()
+    if args.offline:
+        set_offline()
+    raw_pfr_runner(requests_per_minute=args.rpm, workers=args.workers)
\ No newline at end of file
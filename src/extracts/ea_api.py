@@ -1,12 +1,15 @@
 
 from __future__ import annotations
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import List, Tuple, Dict, Any
 from dataclasses import dataclass, field
 from typing import Any, Dict, Iterator, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 __all__ = [
     "MaddenRatingsClient",
@@ -17,6 +20,7 @@ __all__ = [
     "Position",
 ]
 
+from src.extracts.http_cache import MINUTE, cached_get
 from src.utils import find_year_for_season
 
 BASE_URL = "https://drop-api.ea.com"
@@ -175,10 +179,32 @@ class MaddenRatingsClient:
             locale: str = "en",
             timeout: float | tuple = 30,
             session: Optional[requests.Session] = None,
+            cache_ttl: float | None = 15 * MINUTE,
+            max_connections: int = 8,
+            max_retries: int = 3,
+            backoff_factor: float = 0.5,
     ) -> None:
         self.locale = locale
         self.timeout = timeout
-        self.session = session or requests.Session()
+        self.cache_ttl = cache_ttl
+        self.max_connections = max_connections
+        self.session = session
+        if session is None:
+            self.session = requests.Session()
+            # Pooled keep-alive connections sized for concurrent paging, retrying throttled / flaky responses with
+            # backoff. A session passed in by the caller keeps its own adapters.
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=max_connections,
+                max_retries=Retry(
+                    total=max_retries,
+                    backoff_factor=backoff_factor,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(["GET"]),
+                    respect_retry_after_header=True,
+                ),
+            )
+            self.session.mount("https://", adapter)
 
         # Base headers
         self.session.headers.update(
@@ -194,12 +220,28 @@ class MaddenRatingsClient:
     def _request(self, path: str, **params):
         params.setdefault("locale", self.locale)
         url = f"{BASE_URL}{path}"
-        resp = self.session.get(url, params=params, timeout=self.timeout)
+        resp = cached_get(url, params=params, session=self.session, ttl=self.cache_ttl, timeout=self.timeout)
         resp.raise_for_status()
         return resp.json()
 
     # ---------------- High‑level ---------------- #
 
+    def _players_page(self, limit, iteration, offset, filters, extra_query) -> Dict[str, Any]:
+        return self._request(
+            "/rating/madden-nfl",
+            limit=limit,
+            iteration=iteration,
+            offset=offset,
+            **(filters or {}),
+            **extra_query,
+        )
+
+    @staticmethod
+    def _total_from_payload(payload: Dict[str, Any]) -> Optional[int]:
+        # totalItems is the size of the whole listing; no other field is trusted as a total
+        total = payload.get("totalItems")
+        return total if isinstance(total, int) else None
+
     def list_players(
             self,
             *,
@@ -209,14 +251,7 @@ class MaddenRatingsClient:
             filters: Optional[Dict[str, Any]] = None,
             **extra_query,
     ) -> List[Player]:
-        payload = self._request(
-            "/rating/madden-nfl",
-            limit=limit,
-            iteration=iteration,
-            offset=offset,
-            **(filters or {}),
-            **extra_query,
-        )
+        payload = self._players_page(limit, iteration, offset, filters, extra_query)
         return [Player.from_json(i) for i in payload.get("items", [])]
 
     def iter_players(
@@ -237,6 +272,57 @@ class MaddenRatingsClient:
             yield from page
             offset += limit
 
+    def fetch_all_players(
+            self,
+            *,
+            limit: int = 100,
+            iteration: str = "1-base",
+            filters: Optional[Dict[str, Any]] = None,
+            max_concurrency: Optional[int] = None,
+            **extra_query,
+    ) -> List[Player]:
+        """
+        Concurrent equivalent of `list(iter_players(...))`.
+
+        The first page tells us the total item count, the remaining offsets are then fetched in parallel with at most
+        `max_concurrency` requests in flight over the pooled session. If the API does not report a total, or the pages
+        do not add up to it, pages are fetched in waves of `max_concurrency` until an empty page comes back. Pages are
+        reassembled in offset order so the result matches the sequential iterator; fewer players than the reported
+        total raises instead of returning a truncated listing.
+        """
+        max_concurrency = max_concurrency or self.max_connections
+        first = self._players_page(limit, iteration, 0, filters, extra_query)
+        pages = {0: first.get("items", [])}
+        if not pages[0]:
+            return []
+
+        def fetch(offset: int) -> List[Dict[str, Any]]:
+            return self._players_page(limit, iteration, offset, filters, extra_query).get("items", [])
+
+        total = self._total_from_payload(first)
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            next_offset = limit
+            complete = False
+            if total is not None:
+                offsets = list(range(limit, total, limit))
+                pages.update(zip(offsets, pool.map(fetch, offsets)))
+                next_offset += len(offsets) * limit
+                complete = sum(len(page) for page in pages.values()) == total
+            # No total, or the listing changed while paging: continue until an empty page
+            while not complete and all(pages.values()):
+                offsets = [next_offset + i * limit for i in range(max_concurrency)]
+                pages.update(zip(offsets, pool.map(fetch, offsets)))
+                next_offset = offsets[-1] + limit
+
+        players: List[Player] = []
+        for offset in sorted(pages):
+            if not pages[offset]:
+                break
+            players.extend(Player.from_json(i) for i in pages[offset])
+        if total is not None and len(players) < total:
+            raise RuntimeError(f"EA ratings API reported {total} players, paging returned only {len(players)}")
+        return players
+
     def get_player(self, player_id: int) -> Player:
         return Player.from_json(self._request(f"/rating/madden-nfl/{player_id}"))
 
@@ -325,8 +411,6 @@ if __name__ == '__main__':
     root_path = '../../data/madden'
     feature_store_name='raw'
     current_season = find_year_for_season()
-    players = []
-    for p in mrc.iter_players(limit=100, iteration="1-base"):
-        players.append(p)
+    players = mrc.fetch_all_players(limit=100, iteration="1-base")
     df, b = mrc.flatten_players(players)
     df.to_csv(f"{root_path}/{feature_store_name}/{current_season}.csv", index=False)
\ No newline at end of file
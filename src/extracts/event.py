@@ -3,9 +3,11 @@ from nfl_data_loader.utils.formatters.general import df_rename_fold
 from nfl_data_loader.utils.formatters.reformat_game_scores import score_clean
 from nfl_data_loader.utils.formatters.reformat_team_name import team_id_repl
 
+from src.extracts.http_cache import HOUR, read_csv_cached
+
 
 def get_event_infos(season):
-    df = pd.read_csv('http://www.habitatring.com/games.csv')
+    df = read_csv_cached('http://www.habitatring.com/games.csv', ttl=6 * HOUR)
     df = score_clean(df)
     df = df[df.season == season].copy()
     df = team_id_repl(df)
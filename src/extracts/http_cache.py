@@ -0,0 +1,165 @@
+"""
+On-disk HTTP response cache shared by every external fetch in the pipeline.
+
+Responses are keyed by URL + query params and stored under `.cache/http` (override with MADDEN_CACHE_DIR) as a body
+file plus a small JSON meta file. A cached response is served as-is while younger than its TTL; after that it is
+revalidated with If-None-Match / If-Modified-Since when the server gave an ETag / Last-Modified. With MADDEN_OFFLINE=1
+nothing touches the network and only cached responses are replayed.
+"""
+import hashlib
+import io
+import json
+import os
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+import pandas as pd
+import requests
+
+CACHE_DIR = Path(os.environ.get('MADDEN_CACHE_DIR', Path(__file__).resolve().parents[2] / '.cache')) / 'http'
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+FOREVER = None  # Never expires, still served when offline
+
+
+class OfflineCacheMiss(requests.ConnectionError):
+    """Raised in offline mode when a URL has never been cached."""
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response backed by a cache entry."""
+
+    def __init__(self, url, status_code, content, headers, from_cache):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.from_cache = from_cache
+
+    @property
+    def text(self):
+        return self.content.decode(self.headers.get('encoding') or 'utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+def is_offline():
+    return os.environ.get('MADDEN_OFFLINE', '0').lower() in ('1', 'true', 'yes')
+
+
+def set_offline(offline=True):
+    """Toggle offline replay for this process and any worker processes it spawns."""
+    os.environ['MADDEN_OFFLINE'] = '1' if offline else '0'
+
+
+def cache_key(url, params=None):
+    full_url = f"{url}?{urlencode(sorted((params or {}).items()), doseq=True)}" if params else url
+    return hashlib.sha256(full_url.encode()).hexdigest()
+
+
+def _load_entry(key):
+    meta_path = CACHE_DIR / f"{key}.json"
+    body_path = CACHE_DIR / f"{key}.body"
+    if not meta_path.exists() or not body_path.exists():
+        return None, None
+    with open(meta_path) as f:
+        meta = json.load(f)
+    return meta, body_path.read_bytes()
+
+
+def _store_entry(key, meta, content=None):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    if content is not None:
+        tmp = CACHE_DIR / f"{key}.body.tmp"
+        tmp.write_bytes(content)
+        os.replace(tmp, CACHE_DIR / f"{key}.body")
+    with open(CACHE_DIR / f"{key}.json", 'w') as f:
+        json.dump(meta, f)
+
+
+def _response_from_entry(meta, content):
+    return CachedResponse(meta['url'], meta['status_code'], content, meta['headers'], from_cache=True)
+
+
+def cached_get(url, params=None, session=None, ttl=DAY, timeout=30, headers=None, before_request=None):
+    """
+    GET through the on-disk cache.
+
+    :param url: request url
+    :param params: query params (part of the cache key)
+    :param session: requests.Session to use for network calls (defaults to requests.get)
+    :param ttl: seconds a cached response is served without revalidation; FOREVER never revalidates
+    :param timeout: network timeout
+    :param headers: extra request headers
+    :param before_request: callable invoked right before an actual network request (e.g. politeness throttling),
+        skipped entirely when the response is served from cache
+    :return: CachedResponse
+    """
+    key = cache_key(url, params)
+    meta, content = _load_entry(key)
+
+    if meta is not None and (is_offline() or ttl is FOREVER or time.time() - meta['fetched_at'] < ttl):
+        return _response_from_entry(meta, content)
+    if is_offline():
+        raise OfflineCacheMiss(f"Offline mode: no cached response for {url}")
+
+    request_headers = dict(headers or {})
+    if meta is not None:
+        if meta['headers'].get('ETag'):
+            request_headers['If-None-Match'] = meta['headers']['ETag']
+        if meta['headers'].get('Last-Modified'):
+            request_headers['If-Modified-Since'] = meta['headers']['Last-Modified']
+
+    if before_request is not None:
+        before_request()
+    getter = session.get if session is not None else requests.get
+    try:
+        resp = getter(url, params=params, headers=request_headers, timeout=timeout)
+    except requests.RequestException as e:
+        if meta is not None:
+            print(f"Request failed ({e}); serving stale cache for {url}")
+            return _response_from_entry(meta, content)
+        raise
+
+    if resp.status_code == 304 and meta is not None:
+        meta['fetched_at'] = time.time()
+        _store_entry(key, meta)
+        return _response_from_entry(meta, content)
+
+    response = CachedResponse(
+        url,
+        resp.status_code,
+        resp.content,
+        {
+            'ETag': resp.headers.get('ETag'),
+            'Last-Modified': resp.headers.get('Last-Modified'),
+            'Content-Type': resp.headers.get('Content-Type'),
+            'encoding': resp.encoding,
+        },
+        from_cache=False,
+    )
+    if resp.ok:
+        _store_entry(key, {'url': url, 'status_code': resp.status_code, 'headers': response.headers, 'fetched_at': time.time()}, resp.content)
+    return response
+
+
+def read_csv_cached(url, ttl=DAY, **kwargs):
+    """pd.read_csv for a remote file, fetched through the cache."""
+    resp = cached_get(url, ttl=ttl)
+    resp.raise_for_status()
+    return pd.read_csv(io.BytesIO(resp.content), **kwargs)
+
+
+def read_excel_cached(url, ttl=FOREVER, **kwargs):
+    """pd.read_excel for a remote file, fetched through the cache. Uploaded rating sheets never change."""
+    resp = cached_get(url, ttl=ttl)
+    resp.raise_for_status()
+    return pd.read_excel(io.BytesIO(resp.content), **kwargs)
@@ -1,11 +1,18 @@
 import datetime
+from pathlib import Path
+
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 import re
 
 from nfl_data_loader.utils.utils import name_filter
 
+from src.extracts.http_cache import DAY, HOUR, cached_get, read_csv_cached, read_excel_cached
+from src.pipeline.executor import map_seasons
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+PUBLISHED_DATA_URL = 'https://github.com/theedgepredictor/nfl-madden-data/raw/main/data'
+
 
 def apply_merge_id(df):
     first = name_filter(df['name'].split(' ')[0])
@@ -19,7 +26,7 @@ def madden_link_scraper(year, keyword):
     madden_ratings = f"https://maddenratings.weebly.com/madden-nfl-{str(year)[2:]}.html"
 
     url = madden_ratings
-    grab = requests.get(url)
+    grab = cached_get(url, ttl=DAY)
     soup = BeautifulSoup(grab.text, 'html.parser')
     sub_url = '/uploads/'
     #Get all sub pages
@@ -46,7 +53,7 @@ def get_madden_ratings_from_web(year):
             links = madden_link_scraper(year, '_madden_nfl_')
             dfs = []
             for link in links:
-                df = pd.read_excel(base+link)
+                df = read_excel_cached(base+link)
                 if 'Team' not in df.columns:
                     team = link.split('/')[-1].split('_madden_nfl_')[0]
                     df['Team'] = team
@@ -59,7 +66,7 @@ def get_madden_ratings_from_web(year):
             print(f'Failed to get madden {year+1} ratings for season: {year} ')
             return pd.DataFrame()
         else:
-            df= pd.read_excel(base+links[0])
+            df= read_excel_cached(base+links[0])
             df['season'] = season
             return df
     except Exception as e:
@@ -67,29 +74,32 @@ def get_madden_ratings_from_web(year):
         return pd.DataFrame()
 
 
-def make_raw_madden(load_seasons):
-    frames = {}
-    for season in load_seasons:
-        if season != 2024: # manual fill for naming issue on site
-            frames[season] = get_madden_ratings_from_web(season)
-    return frames
+def make_raw_madden(load_seasons, workers=None):
+    load_seasons = [season for season in load_seasons if season != 2024] # manual fill for naming issue on site
+    return map_seasons(get_madden_ratings_from_web, load_seasons, workers=workers)
 
 
-## Add from nfl-madden-data pump
-def get_madden_ratings(season):
+def read_published_csv(relative_path, ttl=HOUR):
+    """
+    Read a published data file (relative to data/) from this checkout, falling back to the GitHub raw copy (through
+    the http cache) only when the file is not on disk.
+    """
+    local_path = DATA_DIR / relative_path
+    if local_path.exists():
+        return pd.read_csv(local_path)
     try:
-        df = pd.read_csv(f'https://github.com/theedgepredictor/nfl-madden-data/raw/main/data/madden/processed/{season}.csv')
-        return df
-    except:
+        return read_csv_cached(f'{PUBLISHED_DATA_URL}/{relative_path}', ttl=ttl)
+    except Exception:
         return pd.DataFrame()
 
+
+## Add from nfl-madden-data pump
+def get_madden_ratings(season):
+    return read_published_csv(f'madden/processed/{season}.csv')
+
 ## Add from nfl-madden-data pump
 def get_approximate_value(season):
-    try:
-        df = pd.read_csv(f'https://github.com/theedgepredictor/nfl-madden-data/raw/main/data/pfr/approximate_value/{season}.csv')
-        return df
-    except:
-        return pd.DataFrame()
+    return read_published_csv(f'pfr/approximate_value/{season}.csv')
 
 
 def collect_raw_madden(season):
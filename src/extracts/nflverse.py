@@ -0,0 +1,122 @@
+"""
+Disk memoized nfl_data_loader loaders.
+
+The nfl_data_loader collectors re-download whole nflverse releases on every call. The wrappers here store each
+result as Parquet under `.cache/nflverse/{loader}/` keyed by the call arguments, next to a small JSON meta file.
+Season keyed results for completed seasons never expire; the in-progress season and season-less loaders (players,
+static players) are refreshed after a short TTL. With MADDEN_OFFLINE=1 cached frames are served regardless of age.
+"""
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+
+import pandas as pd
+from nfl_data_loader.api.sources.players.boxscores.boxscores import collect_weekly_espn_player_stats as _collect_weekly_espn_player_stats
+from nfl_data_loader.api.sources.players.general.players import collect_players as _collect_players
+from nfl_data_loader.api.sources.players.rosters.rosters import collect_roster as _collect_roster
+from nfl_data_loader.utils.utils import find_year_for_season
+from nfl_data_loader.workflows.transforms.players.player import get_static_players as _get_static_players
+
+from src.extracts.http_cache import CACHE_DIR, DAY, FOREVER, HOUR, OfflineCacheMiss, is_offline
+
+MEMO_DIR = CACHE_DIR.parent / 'nflverse'
+
+CURRENT_SEASON_TTL = 6 * HOUR
+
+
+def season_ttl(season):
+    """Completed seasons are immutable upstream, the in-progress season keeps changing."""
+    return FOREVER if season < find_year_for_season() else CURRENT_SEASON_TTL
+
+
+def _memo_paths(loader_name, args, kwargs):
+    key = json.dumps({'args': list(args), 'kwargs': kwargs}, sort_keys=True, default=str)
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    base = MEMO_DIR / loader_name / digest
+    return base.with_suffix('.parquet'), base.with_suffix('.json'), key
+
+
+def _is_fresh(meta_path, ttl):
+    if not meta_path.exists():
+        return False
+    if is_offline() or ttl is FOREVER:
+        return True
+    with open(meta_path) as f:
+        return time.time() - json.load(f)['fetched_at'] < ttl
+
+
+def memoize_frame(loader, ttl=DAY, season_arg=None):
+    """
+    Wrap a DataFrame loader with the on-disk Parquet memo.
+
+    :param loader: callable returning a DataFrame
+    :param ttl: seconds a memoized frame is served for season-less calls
+    :param season_arg: position of the season argument; when given the TTL comes from season_ttl(season)
+    :return: wrapped loader with a `prefetch(seasons, workers)` helper when season_arg is set
+    """
+    loader_name = loader.__name__
+
+    def _ttl(args):
+        if season_arg is not None and len(args) > season_arg:
+            return season_ttl(args[season_arg])
+        return ttl
+
+    def is_cached(*args, **kwargs):
+        data_path, meta_path, _ = _memo_paths(loader_name, args, kwargs)
+        return data_path.exists() and _is_fresh(meta_path, _ttl(args))
+
+    @wraps(loader)
+    def wrapper(*args, **kwargs):
+        data_path, meta_path, key = _memo_paths(loader_name, args, kwargs)
+        if data_path.exists() and _is_fresh(meta_path, _ttl(args)):
+            return pd.read_parquet(data_path)
+        if is_offline():
+            raise OfflineCacheMiss(f"Offline mode: no memoized {loader_name} for {key}")
+
+        df = loader(*args, **kwargs)
+        # Loaders return an empty frame when the release is unavailable, never pin that to disk
+        if df.empty:
+            return df
+        try:
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = data_path.with_suffix('.tmp')
+            df.to_parquet(tmp)
+            os.replace(tmp, data_path)
+            with open(meta_path, 'w') as f:
+                json.dump({'loader': loader_name, 'call': key, 'fetched_at': time.time()}, f)
+        except Exception as e:
+            print(f"Could not memoize {loader_name} ({e}); continuing uncached")
+        return df
+
+    def prefetch(seasons, workers=8):
+        """Load every season not yet memoized in parallel (network bound), then return {season: frame}."""
+        frames = {}
+        missing = [season for season in seasons if not is_cached(season)]
+        if missing and not is_offline():
+            print(f"Prefetching {loader_name} for seasons {missing}")
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(missing)))) as pool:
+                frames.update(zip(missing, pool.map(wrapper, missing)))
+        for season in seasons:
+            if season not in frames:
+                frames[season] = wrapper(season)
+        return frames
+
+    wrapper.is_cached = is_cached
+    if season_arg is not None:
+        wrapper.prefetch = prefetch
+    return wrapper
+
+
+collect_roster = memoize_frame(_collect_roster, season_arg=0)
+collect_weekly_espn_player_stats = memoize_frame(_collect_weekly_espn_player_stats, season_arg=0)
+collect_players = memoize_frame(_collect_players, ttl=DAY)
+get_static_players = memoize_frame(_get_static_players, ttl=DAY)
+
+
+def collect_rosters(seasons, workers=8):
+    """Rosters of several seasons concatenated in the given order, missing seasons fetched in parallel."""
+    frames = collect_roster.prefetch(seasons, workers=workers)
+    return pd.concat([frames[season] for season in seasons])
@@ -1,56 +1,131 @@
-import time
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
 import pandas as pd
 import requests
-from nfl_data_loader.utils.utils import get_webpage_soup
+from nfl_data_loader.utils.utils import get_webpage_soup, find_year_for_season
 
-from src.utils import  pfr_request
+from src.extracts.http_cache import CACHE_DIR, DAY
+from src.utils import PFR_REQUESTS_PER_MINUTE, TokenBucket, pfr_request
 
+NFL_SR_ABBR_LIST = ['kan', 'jax', 'car', 'rav', 'buf', 'min', 'det', 'atl', 'nwe', 'was',
+                    'cin', 'nor', 'sfo', 'ram', 'nyg', 'den', 'cle', 'clt', 'oti', 'nyj', 'htx',
+                    'tam', 'mia', 'pit', 'phi', 'gnb', 'chi', 'dal', 'crd', 'sdg',
+                    'sea', 'rai']
+WINDOWS_CHROME_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
 
-def get_approximate_values(update_seasons):
-    NFL_SR_ABBR_LIST = ['kan', 'jax', 'car', 'rav', 'buf', 'min', 'det', 'atl', 'nwe', 'was',
-                        'cin', 'nor', 'sfo', 'ram', 'nyg', 'den', 'cle', 'clt', 'oti', 'nyj', 'htx',
-                        'tam', 'mia', 'pit', 'phi', 'gnb', 'chi', 'dal', 'crd', 'sdg',
-                        'sea', 'rai']
-    WINDOWS_CHROME_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
+# One csv per completed (season, team) so an interrupted backfill resumes where it stopped
+CHECKPOINT_DIR = CACHE_DIR.parent / 'pfr_checkpoints'
+
+
+def _roster_url(team_str, season):
+    return f'https://www.pro-football-reference.com/teams/{team_str}/{season}_roster.htm'
+
+
+def _checkpoint_path(season, team_str):
+    return CHECKPOINT_DIR / str(season) / f'{team_str}.csv'
+
+
+def clear_checkpoints(season):
+    """Drop the per-team checkpoints of a season once its approximate_value file has been written."""
+    shutil.rmtree(CHECKPOINT_DIR / str(season), ignore_errors=True)
+
+
+def get_team_approximate_values(team_str, season, session, limiter, ttl=DAY):
+    """
+    Scrape one team roster page for a season and return the approximate values of its players.
+    """
+    html = pfr_request(_roster_url(team_str, season), session=session, ttl=ttl, limiter=limiter)
+    html.raise_for_status()
+    page = get_webpage_soup(html.text)
+    page = get_webpage_soup(str(page).replace('<!--', '').replace('-->', ''))
+    page = get_webpage_soup(str(page), 'table', {'id': 'roster'})
+
+    datas = []
+    for i in page.find_all('tr'):
+        player = i.find('td', {'data-stat': 'player'})
+        if player is None:
+            continue
+        approx_value = i.find('td', {'data-stat': 'av'})
+        if approx_value.text == '':
+            approx_value = None
+        a = player.find('a')
+        player_id = a.get('href').split('/')[-1].replace('.htm', '') if a is not None else None
+        name = player.text
+
+        if player_id is None and name == 'Team Total':
+            continue
+        data = {
+            'player_id': player_id,
+            'name': name,
+            'team': team_str,
+            'season': season,
+            'approximate_value': approx_value.text if approx_value is not None else 0
+        }
+
+        datas.append(data)
+    return pd.DataFrame(datas, columns=['player_id', 'name', 'team', 'season', 'approximate_value'])
+
+
+def _fetch_and_checkpoint(team_str, season, session, limiter):
+    # Completed seasons rarely change on PFR, only the in-progress season needs frequent refreshes
+    ttl = DAY if season >= find_year_for_season() else 30 * DAY
+    df = get_team_approximate_values(team_str, season, session, limiter, ttl=ttl)
+    path = _checkpoint_path(season, team_str)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    df.to_csv(tmp, index=False)
+    tmp.replace(path)
+    return df
+
+
+def get_approximate_values(update_seasons, requests_per_minute=None, workers=3, allow_partial=False):
+    """
+    Scrape PFR roster approximate values for every team in the given seasons.
+
+    Requests are spread over a small worker pool that shares a TokenBucket, so the whole scrape stays within
+    `requests_per_minute` regardless of worker count. Every finished (team, season) is checkpointed to disk; on a rerun
+    checkpointed teams are loaded instead of refetched and only the missing / failed ones hit PFR.
+
+    :param update_seasons: seasons to scrape
+    :param requests_per_minute: request budget (default PFR_REQUESTS_PER_MINUTE)
+    :param workers: concurrent fetch workers
+    :param allow_partial: also return seasons where some teams failed (default: hold them back until a rerun completes them);
+        a season where every team failed is skipped either way
+    :return: {season: DataFrame} for every completed season
+    """
     session = requests.Session()
     session.headers.update(WINDOWS_CHROME_HEADERS)
-    frames = {}
-    for season in update_seasons:
-        datas = []
-        for team_str in NFL_SR_ABBR_LIST:
+    limiter = TokenBucket(requests_per_minute or PFR_REQUESTS_PER_MINUTE)
+
+    jobs = [(team_str, season) for season in update_seasons for team_str in NFL_SR_ABBR_LIST]
+    pending = [(team_str, season) for team_str, season in jobs if not _checkpoint_path(season, team_str).exists()]
+    print(f"PFR approximate values: {len(jobs) - len(pending)} of {len(jobs)} team seasons already checkpointed")
+
+    failed = set()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_fetch_and_checkpoint, team_str, season, session, limiter): (team_str, season) for team_str, season in pending}
+        for future in as_completed(futures):
+            team_str, season = futures[future]
             try:
-                html = pfr_request(f'https://www.pro-football-reference.com/teams/{team_str}/{season}_roster.htm', session=session)
-                page = get_webpage_soup(html.text)
-                page = get_webpage_soup(str(page).replace('<!--', '').replace('-->', ''))
-                page = get_webpage_soup(str(page), 'table', {'id': 'roster'})
-
-                for i in page.find_all('tr'):
-                    player = i.find('td', {'data-stat': 'player'})
-                    if player is None:
-                        continue
-                    approx_value = i.find('td', {'data-stat': 'av'})
-                    if approx_value.text == '':
-                        approx_value = None
-                    a = player.find('a')
-                    player_id = a.get('href').split('/')[-1].replace('.htm', '') if a is not None else None
-                    name = player.text
-
-                    if player_id is None and name == 'Team Total':
-                        continue
-                    data = {
-                        'player_id': player_id,
-                        'name': name,
-                        'team': team_str,
-                        'season': season,
-                        'approximate_value': approx_value.text if approx_value is not None else 0
-                    }
-
-                    datas.append(data)
+                future.result()
             except Exception as e:
                 print(e)
-                print(f"Requires manual intervention: {f'https://www.pro-football-reference.com/teams/{team_str}/{season}_roster.htm'}")
-        df = pd.DataFrame(datas)
+                print(f"Requires manual intervention (rerun to retry): {_roster_url(team_str, season)}")
+                failed.add((team_str, season))
+
+    frames = {}
+    for season in update_seasons:
+        season_failed = [team_str for team_str in NFL_SR_ABBR_LIST if (team_str, season) in failed]
+        if season_failed and not allow_partial:
+            print(f"Holding back {season}: {len(season_failed)} teams failed ({season_failed})")
+            continue
+        parts = [pd.read_csv(_checkpoint_path(season, team_str)) for team_str in NFL_SR_ABBR_LIST if team_str not in season_failed]
+        if not parts:
+            print(f"Skipping {season}: every team failed")
+            continue
+        df = pd.concat(parts, ignore_index=True)
         df['approximate_value'] = df['approximate_value'].astype(int)
         frames[season] = df
-    return frames
\ No newline at end of file
+    return frames
@@ -1,24 +1,213 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime, timezone
 from pathlib import Path
 
+import joblib
+import numpy as np
 import pandas as pd
+import sklearn
 from nfl_data_loader.schemas.players.madden import TEAM_MAPPER, RUN_STYLE_MAPPER, ARCHETYPE_POSITION_MAPPERS, MADDEN_ATTRIBUTE_MAP, META, GENERAL_ATTRIBUTES
 from nfl_data_loader.schemas.players.position import HIGH_POSITION_MAPPER
 from nfl_data_loader.utils.utils import find_year_for_season
 from pandas.api.types import is_numeric_dtype
-from sklearn.experimental import enable_iterative_imputer  # noqa: F401
-from sklearn.impute import IterativeImputer
-from sklearn.linear_model import Ridge
+from threadpoolctl import threadpool_limits
 
-from src.transforms.madden_registry import read_missed_madden_data, read_processed_madden_data
+from src.extracts.http_cache import CACHE_DIR
+from src.modeling.imputer_backends import DEFAULT_BACKEND, DEFAULT_MAX_ITER, DEFAULT_TOL, fit_transform_with_convergence, make_imputer
+from src.modeling.imputer_report import ImputationReport, adaptive_settings, read_imputation_report
+from src.pipeline.executor import resolve_workers
+from src.store.madden_store import COMPACT_CATEGORY_COLUMNS, compact_frame, read_madden_layer
+from src.transforms.madden_registry import read_missed_madden_data
 
 MADDEN_DIR = (Path(__file__).resolve()          # /project_root/src/my_module.py
               .parents[2]                       # /project_root/
               / "data" / "madden")     # /project_root/data/madden/raw
 
 
+# Fitted imputers of the last full refit: {backend}/{position_group}/{pass}.joblib, one file per backend, group and pass
+IMPUTER_MODELS_DIR = CACHE_DIR.parent / 'imputers'
+
+# Imputation passes of a position group in run order -> first season of the pass (every pass runs to the latest season)
+PASS_STARTS = {
+    'attrs_2010': 2010,
+    'attrs_2001': 2001,
+    'style_2020': 2020,
+    'style_2001': 2001,
+}
+
+# Columns imputed by each pass: the attribute passes leave the style columns alone
+STYLE_ATTRIBUTES = ['archetype', 'runningstyle', 'changeofdirection']
+ATTRIBUTE_COLUMNS = GENERAL_ATTRIBUTES + [col for col in MADDEN_ATTRIBUTE_MAP.keys() if col not in STYLE_ATTRIBUTES]
+STYLE_COLUMNS = GENERAL_ATTRIBUTES + list(MADDEN_ATTRIBUTE_MAP.keys())
+PASS_TARGET_COLUMNS = {
+    'attrs_2010': ATTRIBUTE_COLUMNS,
+    'attrs_2001': ATTRIBUTE_COLUMNS,
+    'style_2020': STYLE_COLUMNS,
+    'style_2001': STYLE_COLUMNS,
+}
+
+
+def _model_path(position_group, pass_key, backend=DEFAULT_BACKEND, root_path=IMPUTER_MODELS_DIR):
+    return Path(root_path) / backend / position_group / f"{pass_key}.joblib"
+
+
+def save_pass_models(position_group, models, backend=DEFAULT_BACKEND, root_path=IMPUTER_MODELS_DIR):
+    """Persist the fitted pass models ({pass key: model}) of one position group and backend."""
+    for pass_key, model in models.items():
+        path = _model_path(position_group, pass_key, backend, root_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        joblib.dump(model, tmp, compress=3)
+        os.replace(tmp, path)
+
+
+def load_pass_models(position_group, backend=DEFAULT_BACKEND, root_path=IMPUTER_MODELS_DIR):
+    """
+    Saved pass models of one position group.
+
+    :return: {pass key: model}, None unless every pass has a `backend` model fitted with the installed scikit-learn
+    """
+    models = {}
+    for pass_key in PASS_STARTS:
+        path = _model_path(position_group, pass_key, backend, root_path)
+        if not path.exists():
+            return None
+        model = joblib.load(path)
+        if model['sklearn'] != sklearn.__version__:
+            return None
+        models[pass_key] = model
+    return models
+
+
 def read_madden_dataset(year):
     return pd.read_parquet(f'{MADDEN_DIR}/dataset/{year}.parquet')
 
+class ImputationPlan:
+    """
+    Every imputation pass of one position group on a single float32 matrix.
+
+    The imputed columns are converted once into a rows x columns matrix. A pass selects its rows (seasons of the pass)
+    and columns (its target columns), fits or transforms each last_season_av bin on a float64 copy of the bin block and
+    writes the result back in place. Bin assignments only depend on the rows of a pass, so they are computed once per
+    first season and shared by the passes starting in the same season. `order` keeps the row order the chained
+    DataFrame passes produced (rows before the pass first, then the pass rows bin by bin; rows without a bin are
+    dropped), so every imputer sees its rows in the same order and the output keeps its order.
+
+    Parameters:
+        group_df (pd.DataFrame): Rows of one position group, in imputation order.
+        columns (list): Columns held in the matrix (every column any pass imputes).
+        find_bins (callable): Number of quantile bins for a frame (MaddenImputationRunner.find_optimal_bins).
+        bin_col (str): Column the rows are binned by.
+    """
+
+    def __init__(self, group_df, columns, find_bins, bin_col="last_season_av"):
+        self.columns = list(columns)
+        self.meta = group_df[META]
+        self.matrix = group_df[self.columns].apply(pd.to_numeric, errors="coerce") \
+            .to_numpy(dtype=np.float32, na_value=np.nan)
+        self.seasons = group_df['season'].to_numpy(dtype=int)
+        self.order = np.arange(len(group_df))
+        self.find_bins = find_bins
+        self.bin_col = bin_col
+        self._bin_codes = {}
+
+    def _pass_rows(self, start):
+        return self.order[self.seasons[self.order] >= start]
+
+    def _bins(self, start, rows, model):
+        """Bin code (NaN = no bin) of every pass row and the bin edges."""
+        values = pd.Series(self.matrix[rows, self.columns.index(self.bin_col)].astype(np.float64))
+        if model is not None:
+            # Bin with the saved edges, values outside the fitted range go to the first / last bin
+            edges = model['bin_edges']
+            codes = pd.cut(values.clip(edges[0], edges[-1]), bins=edges, labels=False, include_lowest=True)
+            return codes.to_numpy(dtype=float), edges
+        if start not in self._bin_codes:
+            n_bins = self.find_bins(values.to_frame(self.bin_col), bin_col=self.bin_col)
+            codes, edges = pd.qcut(values, q=n_bins, labels=False, duplicates='drop', retbins=True)
+            all_codes = np.full(len(self.matrix), np.nan)
+            all_codes[rows] = codes.to_numpy(dtype=float)
+            self._bin_codes[start] = (all_codes, edges)
+        all_codes, edges = self._bin_codes[start]
+        return all_codes[rows], edges
+
+    def run_pass(self, start, target_cols, backend=DEFAULT_BACKEND, estimator=None, random_state=42,
+                 max_iter=DEFAULT_MAX_ITER, tol=DEFAULT_TOL, bin_settings=None, executor=None, model=None, telemetry=None):
+        """
+        Impute `target_cols` of every row from season `start` on, one independent imputer per bin.
+
+        Parameters:
+            start (int): First season of the pass (every pass runs to the latest season).
+            target_cols (list): Columns imputed by the pass.
+            backend (str): Imputer backend fitted per bin (see imputer_backends.IMPUTER_BACKENDS).
+            estimator (sklearn estimator): Estimator of the iterative_ridge backend. Defaults to Ridge.
+            random_state (int): Random seed for reproducibility.
+            max_iter (int): Maximum iterations for imputation.
+            tol (float): Stopping tolerance of the iterative backend.
+            bin_settings (dict): {'bin_edges', 'bins': {bin: {'max_iter', 'tol'}}} overriding max_iter / tol per bin
+                (adaptive_settings). Bin ids only mean the same rows under the same edges, so the settings are ignored
+                when the pass is binned with other edges than the run they were derived from.
+            executor (concurrent.futures.Executor): Fit and transform the (disjoint) bins concurrently on this executor.
+            model (dict): Saved model of this pass; rows are binned with its edges and only transformed.
+            telemetry (list): Receives one _bin_record per bin.
+
+        Returns:
+            dict: Fitted model of the pass (None when transforming with `model`).
+        """
+        rows = self._pass_rows(start)
+        cols = np.array([self.columns.index(col) for col in target_cols])
+        codes, edges = self._bins(start, rows, model)
+        print(pd.Series(codes, name=f"{self.bin_col}_bin").value_counts())
+
+        bins = [(int(bin_id), rows[codes == bin_id]) for bin_id in np.unique(codes[~np.isnan(codes)])]
+        # sklearn fits in float64; the float32 blocks are only widened per bin
+        blocks = [self.matrix[np.ix_(bin_rows, cols)].astype(np.float64) for _, bin_rows in bins]
+        per_bin = {}
+        if bin_settings and model is None:
+            if np.array_equal(np.asarray(bin_settings['bin_edges'], dtype=np.float64), edges):
+                per_bin = bin_settings['bins']
+            else:
+                print(f"{self.bin_col} bins from {start} changed since the adaptive settings were derived, using defaults")
+        params = [{'max_iter': max_iter, 'tol': tol, **per_bin.get(bin_id, {})} for bin_id, _ in bins]
+        if model is not None:
+            worker, jobs = _transform_bin, [(block, model['imputers'][bin_id]) for (bin_id, _), block in zip(bins, blocks)]
+        else:
+            worker, jobs = _fit_transform_bin, [
+                (block, make_imputer(backend, estimator, random_state, **bin_params)) for block, bin_params in zip(blocks, params)
+            ]
+        results = list(executor.map(worker, jobs) if executor is not None else map(worker, jobs))
+        for (_, bin_rows), (imputed_array, _, _) in zip(bins, results):
+            self.matrix[np.ix_(bin_rows, cols)] = imputed_array
+        if telemetry is not None:
+            telemetry.extend(
+                _bin_record(bin_id, block, stats, model is None, backend, edges=edges, **bin_params)
+                for (bin_id, _), block, bin_params, (_, _, stats) in zip(bins, blocks, params, results)
+            )
+
+        self.order = np.concatenate([self.order[self.seasons[self.order] < start]] + [bin_rows for _, bin_rows in bins])
+        if model is not None:
+            return None
+        return {
+            'backend': backend,
+            'bin_col': self.bin_col,
+            'bin_edges': edges,
+            'target_cols': list(target_cols),
+            'season_range': (start, find_year_for_season()),
+            'imputers': {bin_id: imputer for (bin_id, _), (_, imputer, _) in zip(bins, results)},
+            'fitted_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'sklearn': sklearn.__version__,
+        }
+
+    def to_frame(self):
+        """META + matrix columns of the surviving rows, in pass order."""
+        meta = self.meta.iloc[self.order].reset_index(drop=True)
+        values = pd.DataFrame(self.matrix[self.order].astype(np.float64), columns=self.columns)
+        return pd.concat([meta, values], axis=1)
+
+
 class MaddenImputationRunner:
     """
     A class to load, preprocess, group, and impute missing Madden player attributes
@@ -35,19 +224,21 @@ class MaddenImputationRunner:
         Load and preprocess base Madden ratings across all seasons.
 
         Steps:
-        - Load processed Madden data for all seasons from 2001 to the latest.
+        - Load processed Madden data for all seasons from 2001 to the latest (typed Parquet store).
         - Append missed Madden data.
         - Drop any rows without a madden_id (invalid records).
         - Map 'runningstyle' and 'team' values to their numeric codes.
+        - Compact the frame (categorical labels, UInt8 ratings), it is held for the whole run.
         """
-        self.base_ratings = pd.concat(
-            [read_processed_madden_data(season) for season in list(range(2001, find_year_for_season() + 1))]
-            + [read_missed_madden_data()]
-        )
+        self.base_ratings = pd.concat([
+            read_madden_layer('processed', seasons=list(range(2001, find_year_for_season() + 1))),
+            read_missed_madden_data()
+        ])
         ### Going to try full playerverse imputation
         #self.base_ratings = self.base_ratings[self.base_ratings.madden_id.notnull()].copy()
         self.base_ratings['runningstyle'] = self.base_ratings['runningstyle'].map(RUN_STYLE_MAPPER)
         self.base_ratings['team'] = self.base_ratings['team'].map(TEAM_MAPPER)
+        self.base_ratings = compact_frame(self.base_ratings, 'base_ratings')
 
     def group_base_ratings(self):
         """
@@ -80,7 +271,7 @@ class MaddenImputationRunner:
 
             # Fill yearspro if missing (incremental count per player)
             base_group['yearspro'] = base_group['yearspro'].fillna(
-                base_group.groupby('madden_id').cumcount()
+                base_group.groupby('madden_id', observed=True).cumcount()
             ).astype("Int64")
 
             # Fill defaults for draft info and rookie flag
@@ -150,100 +341,94 @@ class MaddenImputationRunner:
         print(f"Optimal bins for {bin_col}: {best_bins} (min diff = {smallest_diff})")
         return best_bins
 
-    def impute_by_last_season_bin(
-        self,
-        df,
-        meta_cols,
-        target_cols,
-        bin_col="last_season_av",
-        n_bins=None,
-        season_range=None,
-        estimator=None,
-        random_state=42,
-        max_iter=20
-    ):
+    def impute_position_group(self, position_group, group_df, bin_workers=1, blas_threads=None, models=None, save_models=True,
+                              backend=DEFAULT_BACKEND, settings=None, telemetry=None):
         """
-        Perform iterative imputation within bins of players grouped by `bin_col`.
+        Impute one position group: the attribute passes (2010+, then 2001+), then the style passes (2020+, then 2001+).
+        Every pass runs in place on the group's ImputationPlan matrix; the DataFrame is only built at the end.
 
         Parameters:
-            df (pd.DataFrame): Data containing both meta and target columns.
-            meta_cols (list): Columns preserved and not imputed.
-            target_cols (list): Columns to be imputed.
-            bin_col (str): Column used to create bins (default='last_season_av').
-            n_bins (int): Number of quantile-based bins to split the data into.
-            season_range (tuple): Optional (start, end) season filtering.
-            estimator (sklearn estimator): Estimator for IterativeImputer. Defaults to Ridge.
-            random_state (int): Random seed for reproducibility.
-            max_iter (int): Maximum iterations for imputation.
+            position_group (str): Position group being imputed.
+            group_df (pd.DataFrame): Preprocessed rows of the group (see group_base_ratings).
+            bin_workers (int): Processes fitting the bins of a pass concurrently (1 = in process).
+            blas_threads (int): BLAS / OpenMP threads per bin worker.
+            models (dict): Saved pass models of the group (load_pass_models). Rows are only transformed with them;
+                without models every pass is fitted.
+            save_models (bool): Persist the fitted pass models (save_pass_models) after a fit.
+            backend (str): Imputer backend fitted per bin (see imputer_backends.IMPUTER_BACKENDS).
+            settings (dict): {pass: {'bin_edges', 'bins': {bin: {'max_iter', 'tol'}}}} of the group
+                (adaptive_settings); defaults elsewhere.
+            telemetry (list): Receives one record per bin of every pass (see ImputationReport).
 
         Returns:
-            pd.DataFrame: DataFrame with imputed values for target_cols.
+            pd.DataFrame: Imputed group with META, GENERAL_ATTRIBUTES and every Madden attribute.
         """
-        if estimator is None:
-            estimator = Ridge(alpha=1.0)
-
-        df = df.copy()
-
-        # Optional filtering by season
-        if season_range:
-            start, end = season_range
-            df = df[(df['season'] >= start) & (df['season'] <= end)].copy()
-
-        # Dynamically find optimal bins if not provided
-        if n_bins is None:
-            n_bins = self.find_optimal_bins(df, bin_col=bin_col)
-
-        # Create quantile-based bins for imputation groups
-        df[f"{bin_col}_bin"] = pd.qcut(
-            df[bin_col],
-            q=n_bins,
-            labels=False,
-            duplicates='drop'
-        )
-
-        print(df[f"{bin_col}_bin"].value_counts())
-
-        imputed_parts = []
-        for bin_id, bin_df in df.groupby(f"{bin_col}_bin"):
-            bin_index = bin_df.index
-            meta_part = bin_df[meta_cols]
-            target_part = bin_df[target_cols]
-
-            # Convert to float for sklearn (handles Int64 + pd.NA)
-            target_part = target_part.apply(pd.to_numeric, errors="coerce").astype(float)
+        print(f"\n=== Processing position group: {position_group} ===")
 
-            # Iterative imputation using chosen estimator
-            imputer = IterativeImputer(
-                estimator=estimator,
-                random_state=random_state,
-                max_iter=max_iter
-            )
-            imputed_array = imputer.fit_transform(target_part)
-
-            # Combine metadata and imputed results
-            imputed_parts.append(
-                pd.concat(
-                    [meta_part, pd.DataFrame(imputed_array, index=bin_index, columns=target_cols)],
-                    axis=1
-                )
-            )
-
-        return pd.concat(imputed_parts)
-
-    def run(self):
+        plan = ImputationPlan(
+            group_df.sort_values(by=['season', 'overallrating'], ascending=[False, False]),
+            columns=STYLE_COLUMNS,
+            find_bins=self.find_optimal_bins
+        )
+        print(f"{position_group} imputation plan: {plan.matrix.shape[0]} rows x {plan.matrix.shape[1]} columns "
+              f"({plan.matrix.nbytes / 2 ** 20:.1f} MB float32)")
+
+        fitted = {}
+        bin_pool = nullcontext()
+        if bin_workers > 1:
+            bin_pool = ProcessPoolExecutor(max_workers=bin_workers, initializer=_init_imputation_worker, initargs=(blas_threads,))
+        with bin_pool as executor:
+            for pass_key, start in PASS_STARTS.items():
+                model = models[pass_key] if models is not None else None
+                pass_telemetry = []
+                pass_model = plan.run_pass(start, PASS_TARGET_COLUMNS[pass_key], backend=backend,
+                                           bin_settings=(settings or {}).get(pass_key), executor=executor, model=model,
+                                           telemetry=pass_telemetry)
+                if model is None:
+                    fitted[pass_key] = pass_model
+                if telemetry is not None:
+                    telemetry.extend({'position_group': position_group, 'pass': pass_key, **record} for record in pass_telemetry)
+
+        if fitted and save_models:
+            save_pass_models(position_group, fitted, backend)
+
+        dataset = plan.to_frame()
+
+        # Round categorical integer-like columns
+        for col in ["archetype", "runningstyle"]:
+            if col in dataset.columns:
+                dataset[col] = dataset[col].round().astype("Int64")
+        return dataset
+
+    def run(self, workers=None, bin_workers=1, blas_threads=None, seasons=None, refit=True, backend=DEFAULT_BACKEND,
+            adaptive=False):
         """
         Execute the full Madden imputation pipeline for all position groups.
 
         Steps:
         1. Load and preprocess base ratings.
         2. Group ratings by position group.
-        3. For each position group:
-            - Split and sort data into archetype/runningstyle subset.
-            - Prepare attributes dataset without style-related columns.
-            - Impute missing Madden attributes for different year ranges.
-            - Merge imputed datasets back together.
-            - Impute archetype/runningstyle/changeofdirection for specific ranges.
+        3. Impute every position group (impute_position_group). Groups share nothing, so with more than one worker
+           they are imputed concurrently in worker processes. Every imputer keeps its fixed random_state, so the
+           output is identical to the sequential run. Within a group the bins of each pass can be fitted
+           concurrently as well; groups x bins x BLAS threads are kept within the core count.
+           A full refit saves the fitted pass models; an incremental run (refit=False) only transforms the rows of
+           `seasons` with them, falling back to a full refit when a group has no saved models or `seasons` covers
+           every season with ratings (a rebuild of every season, e.g. --full or a code change).
+           Every bin is timed and every fit's iterations and per round change are recorded; the run report
+           (ImputationReport) is written once all groups are done. In adaptive mode every bin runs with the
+           tol / max_iter the last report says it needs (adaptive_settings) instead of the defaults.
         4. Return a single DataFrame containing all processed position groups.
+
+        Parameters:
+            workers (int): Processes imputing groups concurrently (see resolve_workers).
+            bin_workers (int): Processes per group fitting the bins of a pass concurrently (0 = the cores the group
+                workers leave idle).
+            blas_threads (int): BLAS / OpenMP threads per worker (default: cores // (workers x bin_workers)).
+            seasons (list): Seasons to impute in incremental mode (default: every season).
+            refit (bool): Refit every imputer on every season (default) instead of reusing the saved models.
+            backend (str): Imputer backend fitted per bin (see imputer_backends.IMPUTER_BACKENDS).
+            adaptive (bool): Set tol / max_iter per position group, pass and bin from the last run report.
         """
         # Step 1: Load and preprocess data
         self.load_base_ratings()
@@ -251,71 +436,47 @@ class MaddenImputationRunner:
         # Step 2: Group data by position
         self.group_base_ratings()
 
-        all_groups = []
-
-        # Step 3: Loop through all position groups and process
+        # Step 3: Impute every position group
+        cores = os.cpu_count() or 1
+        workers = min(resolve_workers(workers), len(self.base_rating_groups))
+        bin_workers = max(1, min(bin_workers or cores, cores // workers))
+        if blas_threads is None:
+            blas_threads = max(1, cores // (workers * bin_workers))
+        group_models = {}
+        if not refit and seasons is not None and set(self.base_ratings['season'].astype(int).unique()) <= set(seasons):
+            print("Every season with ratings is rebuilt; running a full refit")
+            refit = True
+        if not refit:
+            group_models = {position_group: load_pass_models(position_group, backend) for position_group in self.base_rating_groups}
+            missing = [position_group for position_group, models in group_models.items() if models is None]
+            if missing:
+                print(f"No saved imputers for {missing}; running a full refit")
+                group_models = {}
+        settings = {}
+        if adaptive:
+            settings = adaptive_settings(read_imputation_report(), backend)
+            print(f"Adaptive imputer settings for {sorted(settings) or 'no group (no previous run), using defaults'}")
+        report = ImputationReport(backend, settings)
+        jobs = []
         for position_group, group_df in self.base_rating_groups.items():
-            print(f"\n=== Processing position group: {position_group} ===")
-
-            # Keep archetype/runningstyle/changeofdirection for later merge
-            arch_split = group_df[META + ['season', 'archetype', 'runningstyle', 'changeofdirection']] \
-                .sort_values(by=['season'], ascending=[False])
-
-            # Dataset without style-related fields
-            attrs_dataset = group_df[META + GENERAL_ATTRIBUTES + list(MADDEN_ATTRIBUTE_MAP.keys())] \
-                .sort_values(by=['season', 'overallrating'], ascending=[False, False]) \
-                .drop(columns=['archetype', 'runningstyle', 'changeofdirection'])
-
-            print(f"{position_group} initial attrs_dataset shape:", attrs_dataset.shape)
-
-            # Columns to impute (exclude style columns)
-            madden_attrs = [i for i in list(MADDEN_ATTRIBUTE_MAP.keys())
-                            if i not in ['archetype', 'runningstyle', 'changeofdirection']]
-
-            # Impute attributes for 2010–latest
-            attrs_2010_latest = self.impute_by_last_season_bin(
-                df=attrs_dataset,
-                meta_cols=META,
-                target_cols=GENERAL_ATTRIBUTES + madden_attrs,
-                season_range=(2010, find_year_for_season())
-            )
-            attrs_dataset = pd.concat([attrs_dataset[attrs_dataset.season < 2010].copy(), attrs_2010_latest])
-
-            # Impute attributes for 2001–latest
-            attrs_dataset = self.impute_by_last_season_bin(
-                df=attrs_dataset,
-                meta_cols=META,
-                target_cols=GENERAL_ATTRIBUTES + madden_attrs,
-                season_range=(2001, find_year_for_season())
-            )
-
-            # Merge back style-related fields
-            dataset = pd.merge(attrs_dataset, arch_split, on=['madden_id', 'season','player_id','position_group','fullname'])
-
-            # Impute style-related attributes for 2020–latest
-            style_2020_latest = self.impute_by_last_season_bin(
-                df=dataset,
-                meta_cols=META,
-                target_cols=GENERAL_ATTRIBUTES + list(MADDEN_ATTRIBUTE_MAP.keys()),
-                season_range=(2020, find_year_for_season())
-            )
-            dataset = pd.concat([dataset[dataset.season < 2020].copy(), style_2020_latest])
-
-            # Final imputation for full 2001–latest range
-            dataset = self.impute_by_last_season_bin(
-                df=dataset,
-                meta_cols=META,
-                target_cols=GENERAL_ATTRIBUTES + list(MADDEN_ATTRIBUTE_MAP.keys()),
-                season_range=(2001, find_year_for_season())
-            )
-
-            # Round categorical integer-like columns
-            for col in ["archetype", "runningstyle"]:
-                if col in dataset.columns:
-                    dataset[col] = dataset[col].round().astype("Int64")
-
-            # Add to master list
-            all_groups.append(dataset)
+            models = group_models.get(position_group)
+            if models is not None and seasons is not None:
+                # Every row is imputed on its own, so only the requested seasons need to go through the saved models
+                group_df = group_df[group_df['season'].isin(seasons)]
+                if group_df.empty:
+                    continue
+            jobs.append((position_group, group_df, bin_workers, blas_threads, models, True, backend, settings.get(position_group)))
+        if workers <= 1:
+            results = [_impute_group_worker(job, self) for job in jobs]
+        else:
+            print(f"Imputing {len(jobs)} position groups over {workers} processes "
+                  f"({bin_workers} bin workers, {blas_threads} BLAS threads each)")
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_imputation_worker, initargs=(blas_threads,)) as pool:
+                results = list(pool.map(_impute_group_worker, jobs))
+        all_groups = [dataset for dataset, _ in results]
+        for _, telemetry in results:
+            report.extend(telemetry)
+        report.write()
 
         # Step 4: Return all groups combined
         combined_df = pd.concat(all_groups, ignore_index=True)
@@ -344,16 +505,74 @@ class MaddenImputationRunner:
         combined_df['team'] = combined_df['team'].map(team_mapper_inverse)
         out_cols = ['player_id','madden_id','pfr_id','fullname','high_pos_group','position_group', 'position', 'season', 'team', 'last_season_av'] + list(MADDEN_ATTRIBUTE_MAP.keys())
         combined_df = combined_df[out_cols]
+        # The dataset files keep plain string columns
+        for col in COMPACT_CATEGORY_COLUMNS:
+            if isinstance(combined_df[col].dtype, pd.CategoricalDtype):
+                combined_df[col] = combined_df[col].astype(object)
 
         return combined_df
 
-def make_dataset_madden(s):
+# Keeps the BLAS thread cap of an imputation worker process alive for the life of the process
+_BLAS_LIMITS = None
+
+
+def _init_imputation_worker(blas_threads):
+    global _BLAS_LIMITS
+    _BLAS_LIMITS = threadpool_limits(limits=blas_threads)
+
+
+def _impute_group_worker(job, runner=None):
+    telemetry = []
+    dataset = (runner or MaddenImputationRunner()).impute_position_group(*job, telemetry=telemetry)
+    return dataset, telemetry
+
+
+def _fit_transform_bin(job):
+    target_part, imputer = job
+    started = time.perf_counter()
+    imputed, convergence = fit_transform_with_convergence(imputer, target_part)
+    return imputed, imputer, {'seconds': round(time.perf_counter() - started, 4), **convergence}
+
+
+def _transform_bin(job):
+    target_part, imputer = job
+    started = time.perf_counter()
+    imputed = imputer.transform(target_part)
+    stats = {'seconds': round(time.perf_counter() - started, 4), 'n_iter': None, 'converged': None, 'deltas': None, 'scaled_tolerance': None}
+    return imputed, None, stats
+
+
+def _bin_record(bin_id, target_part, stats, fit, backend, max_iter, tol, edges=None):
+    """Telemetry of one bin of a pass (see ImputationReport)."""
+    values = np.asarray(target_part, dtype=np.float64)
+    return {
+        'bin': int(bin_id),
+        'bin_edges': None if edges is None else [float(edge) for edge in edges],
+        'backend': backend,
+        'mode': 'fit' if fit else 'transform',
+        'rows': int(values.shape[0]),
+        'columns': int(values.shape[1]),
+        'missing': int(np.isnan(values).sum()),
+        'max_iter': max_iter,
+        'tol': tol,
+        **stats,
+    }
+
+
+def make_dataset_madden(s, workers=None):
     frames = {}
 
+    # A rebuild of every season with ratings (or MADDEN_IMPUTER_REFIT=1) refits the imputers, anything less reuses the
+    # saved ones (see MaddenImputationRunner.run)
+    refit = os.environ.get('MADDEN_IMPUTER_REFIT') == '1'
+    backend = os.environ.get('MADDEN_IMPUTER_BACKEND', DEFAULT_BACKEND)
+    adaptive = os.environ.get('MADDEN_IMPUTER_ADAPTIVE') == '1'
+    bin_workers = int(os.environ.get('MADDEN_IMPUTER_BIN_WORKERS', 1))
     madden_imputation_runner = MaddenImputationRunner()
-    dataset = madden_imputation_runner.run()
-    for season in dataset.season.unique():
-        frame = dataset[dataset.season==season].copy()
-        frames[season] = frame
+    dataset = madden_imputation_runner.run(workers=workers, bin_workers=bin_workers, seasons=s, refit=refit,
+                                           backend=backend, adaptive=adaptive)
+    # Single pass split (one boolean scan per season was O(rows x seasons)); writes are fanned out by the runner
+    for season, frame in dataset.groupby('season', sort=True):
+        frames[season] = frame.copy()
     return frames
 
@@ -0,0 +1,279 @@
+"""
+Imputer backends selectable by name.
+
+Every backend is a scikit-learn style imputer (fit_transform on the rows of one bin, transform for new rows of the
+same bin, observed values are returned unchanged):
+
+- iterative_ridge: IterativeImputer with a Ridge estimator (round robin regression of every column on the others),
+  recording the change of every round (TrackedIterativeImputer).
+- knn: nearest neighbour donors from a KD-tree over the standardized, mean filled rows of the bin.
+- softimpute: low rank matrix completion by iterative soft thresholded SVD (Mazumder, Hastie & Tibshirani 2010).
+"""
+import warnings
+
+import numpy as np
+from sklearn.experimental import enable_iterative_imputer  # noqa: F401
+from sklearn.impute import IterativeImputer
+from sklearn.linear_model import Ridge
+from sklearn.neighbors import KDTree
+
+DEFAULT_BACKEND = 'iterative_ridge'
+DEFAULT_MAX_ITER = 20
+DEFAULT_TOL = 1e-3
+
+
+def _standardize_params(X):
+    """Observed column means and standard deviations (0 / 1 for columns without observed values)."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        mean = np.nanmean(X, axis=0)
+        scale = np.nanstd(X, axis=0)
+    mean = np.where(np.isnan(mean), 0.0, mean)
+    scale = np.where(np.isnan(scale) | (scale == 0), 1.0, scale)
+    return mean, scale
+
+
+class KDTreeKNNImputer:
+    """
+    Fill every missing value with the mean of the observed values of the row's nearest donors.
+
+    Donors are the rows the imputer was fitted on. Neighbours are searched in a KD-tree over the standardized rows
+    with missing values set to the column mean, so one tree query per row replaces the pairwise nan-euclidean
+    distance matrix of sklearn's KNNImputer. A value no donor has observed falls back to the column mean.
+
+    Parameters:
+        n_neighbors (int): Donors per row.
+        leaf_size (int): KD-tree leaf size.
+        chunk_size (int): Rows queried at once (bounds the rows x neighbours x columns donor block).
+    """
+
+    def __init__(self, n_neighbors=10, leaf_size=40, chunk_size=2048):
+        self.n_neighbors = n_neighbors
+        self.leaf_size = leaf_size
+        self.chunk_size = chunk_size
+
+    def _filled(self, X):
+        Z = (X - self.mean_) / self.scale_
+        Z[np.isnan(Z)] = 0.0
+        return Z
+
+    def fit(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        self.mean_, self.scale_ = _standardize_params(X)
+        self.donors_ = X
+        self.tree_ = KDTree(self._filled(X), leaf_size=self.leaf_size)
+        return self
+
+    def transform(self, X):
+        X = np.array(X, dtype=np.float64)
+        mask = np.isnan(X)
+        if not mask.any():
+            return X
+        # A row that is its own nearest donor only contributes its observed values, which are never filled
+        k = min(self.n_neighbors, len(self.donors_))
+        for start in range(0, len(X), self.chunk_size):
+            rows = slice(start, start + self.chunk_size)
+            if not mask[rows].any():
+                continue
+            _, idx = self.tree_.query(self._filled(X[rows]), k=k)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', category=RuntimeWarning)
+                values = np.nanmean(self.donors_[idx], axis=1)
+            values = np.where(np.isnan(values), self.mean_, values)
+            X[rows][mask[rows]] = values[mask[rows]]
+        return X
+
+    def fit_transform(self, X):
+        return self.fit(X).transform(X)
+
+
+class SoftImputer:
+    """
+    Low rank completion of the standardized matrix by iterative soft thresholded SVD.
+
+    Missing entries start at the column mean; every iteration takes the SVD of the filled matrix, shrinks the singular
+    values by `shrinkage` x the largest singular value of the mean filled matrix and refills the missing entries from
+    the low rank reconstruction until the relative change drops below `tol`. New rows are completed by projecting them
+    onto the fitted right singular vectors the same way.
+
+    Parameters:
+        shrinkage (float): Soft threshold relative to the largest singular value.
+        max_rank (int): Cap on the rank of the reconstruction (default: no cap).
+        max_iter (int): Maximum SVD iterations.
+        tol (float): Relative change in the missing entries at which iteration stops.
+    """
+
+    def __init__(self, shrinkage=0.05, max_rank=None, max_iter=100, tol=1e-5):
+        self.shrinkage = shrinkage
+        self.max_rank = max_rank
+        self.max_iter = max_iter
+        self.tol = tol
+
+    def _complete(self, Z, mask, reconstruct):
+        self.n_iter_ = 0
+        self.deltas_ = []
+        self.converged_ = False
+        previous = Z[mask]
+        for self.n_iter_ in range(1, self.max_iter + 1):
+            Z[mask] = reconstruct(Z)[mask]
+            current = Z[mask]
+            change = np.sum((current - previous) ** 2) / max(np.sum(previous ** 2), 1e-12)
+            self.deltas_.append(float(change))
+            previous = current
+            if change < self.tol:
+                self.converged_ = True
+                break
+        return Z
+
+    def _low_rank(self, Z):
+        U, s, Vt = np.linalg.svd(Z, full_matrices=False)
+        s = np.maximum(s - self.threshold_, 0)
+        rank = int(np.count_nonzero(s))
+        if self.max_rank is not None:
+            rank = min(rank, self.max_rank)
+        self.components_ = Vt[:rank]
+        return (U[:, :rank] * s[:rank]) @ Vt[:rank]
+
+    def fit_transform(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        mask = np.isnan(X)
+        self.mean_, self.scale_ = _standardize_params(X)
+        Z = (X - self.mean_) / self.scale_
+        Z[mask] = 0.0
+        self.threshold_ = self.shrinkage * (np.linalg.norm(Z, ord=2) if Z.size else 0.0)
+        if mask.any():
+            Z = self._complete(Z, mask, self._low_rank)
+        else:
+            self._low_rank(Z)
+            self.n_iter_, self.deltas_, self.converged_ = 0, [], True
+        out = X.copy()
+        out[mask] = (Z * self.scale_ + self.mean_)[mask]
+        return out
+
+    def fit(self, X):
+        self.fit_transform(X)
+        return self
+
+    def transform(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        mask = np.isnan(X)
+        if not mask.any():
+            return X.copy()
+        Z = (X - self.mean_) / self.scale_
+        Z[mask] = 0.0
+        Z = self._complete(Z, mask, lambda filled: filled @ self.components_.T @ self.components_)
+        out = X.copy()
+        out[mask] = (Z * self.scale_ + self.mean_)[mask]
+        return out
+
+
+class TrackedIterativeImputer(IterativeImputer):
+    """
+    IterativeImputer that records how its fit converged.
+
+    IterativeImputer stops once the largest change of a round (infinity norm between the filled matrix before and after
+    the round) falls below tol x the largest observed absolute value, but only reports that change in verbose mode.
+    This subclass computes the same change itself: the first feature imputed in a round sees the filled matrix the
+    previous round left, so a copy taken there (the same copy IterativeImputer keeps to compare rounds) closes the
+    previous round, and the returned matrix closes the last one. Transforms are untouched and the imputed values are
+    identical to IterativeImputer.
+
+    Attributes (after fit):
+        deltas_ (list): Change of every round.
+        scaled_tolerance_ (float): tol x largest observed absolute value, the change the fit had to fall below.
+        converged_ (bool): The fit stopped before max_iter (or had nothing to impute).
+    """
+
+    def _impute_one_feature(self, X_filled, mask_missing_values, feat_idx, neighbor_feat_idx, estimator=None,
+                            fit_mode=True, params=None):
+        # IterativeImputer runs its rounds as `for self.n_iter_ in range(1, max_iter + 1)`
+        if fit_mode and self.n_iter_ != self._round:
+            if self._round_start is not None:
+                self.deltas_.append(float(np.linalg.norm(X_filled - self._round_start, ord=np.inf, axis=None)))
+            self._round, self._round_start = self.n_iter_, X_filled.copy()
+        return super()._impute_one_feature(X_filled, mask_missing_values, feat_idx, neighbor_feat_idx,
+                                           estimator=estimator, fit_mode=fit_mode, params=params)
+
+    def fit_transform(self, X, y=None, **params):
+        self.deltas_, self._round, self._round_start = [], 0, None
+        observed = np.abs(np.asarray(X, dtype=np.float64))
+        observed = observed[~np.isnan(observed)]
+        self.scaled_tolerance_ = float(self.tol * observed.max()) if observed.size else None
+        Xt = super().fit_transform(X, y, **params)
+        if self._round_start is not None:
+            self.deltas_.append(float(np.linalg.norm(np.asarray(Xt) - self._round_start, ord=np.inf, axis=None)))
+        # The round copy is only needed during the fit, saved models must not carry it
+        self._round_start = None
+        if self.n_iter_ > 0 and len(self.deltas_) != self.n_iter_:
+            warnings.warn(f"TrackedIterativeImputer recorded {len(self.deltas_)} round changes for {self.n_iter_} rounds; "
+                          f"the installed scikit-learn no longer imputes through _impute_one_feature per round")
+        self.converged_ = self.n_iter_ == 0 or (
+            len(self.deltas_) == self.n_iter_ and self.deltas_[-1] < self.scaled_tolerance_
+        )
+        return Xt
+
+
+def _iterative_ridge(estimator=None, random_state=42, max_iter=DEFAULT_MAX_ITER, tol=DEFAULT_TOL):
+    return TrackedIterativeImputer(
+        estimator=estimator if estimator is not None else Ridge(alpha=1.0),
+        random_state=random_state,
+        max_iter=max_iter,
+        tol=tol
+    )
+
+
+def _knn(estimator=None, random_state=42, max_iter=DEFAULT_MAX_ITER, tol=DEFAULT_TOL):
+    return KDTreeKNNImputer()
+
+
+def _softimpute(estimator=None, random_state=42, max_iter=DEFAULT_MAX_ITER, tol=DEFAULT_TOL):
+    return SoftImputer()
+
+
+# Backend name -> factory of an unfitted imputer for one bin (estimator / max_iter / tol only apply to iterative_ridge)
+IMPUTER_BACKENDS = {
+    'iterative_ridge': _iterative_ridge,
+    'knn': _knn,
+    'softimpute': _softimpute,
+}
+
+
+def make_imputer(backend=DEFAULT_BACKEND, estimator=None, random_state=42, max_iter=DEFAULT_MAX_ITER, tol=DEFAULT_TOL):
+    """
+    Unfitted imputer of a backend.
+
+    Parameters:
+        backend (str): One of IMPUTER_BACKENDS.
+        estimator (sklearn estimator): Estimator of the iterative backend (default Ridge).
+        random_state (int): Random seed of the iterative backend.
+        max_iter (int): Maximum iterations of the iterative backend.
+        tol (float): Stopping tolerance of the iterative backend (relative to the largest observed value).
+
+    Returns:
+        Imputer with fit_transform / transform.
+    """
+    if backend not in IMPUTER_BACKENDS:
+        raise ValueError(f"Unknown imputer backend {backend!r}, expected one of {list(IMPUTER_BACKENDS)}")
+    return IMPUTER_BACKENDS[backend](estimator=estimator, random_state=random_state, max_iter=max_iter, tol=tol)
+
+
+def fit_transform_with_convergence(imputer, X):
+    """
+    Fit and transform one bin and report how the fit converged.
+
+    Parameters:
+        imputer: Unfitted imputer (make_imputer).
+        X (array-like): Rows of the bin.
+
+    Returns:
+        tuple: (imputed array, {'n_iter', 'converged', 'deltas', 'scaled_tolerance'}); None where a backend does not
+            iterate or has no scaled tolerance.
+    """
+    imputed = imputer.fit_transform(X)
+    n_iter = getattr(imputer, 'n_iter_', None)
+    return imputed, {
+        'n_iter': None if n_iter is None else int(n_iter),
+        'converged': getattr(imputer, 'converged_', None),
+        'deltas': getattr(imputer, 'deltas_', None),
+        'scaled_tolerance': getattr(imputer, 'scaled_tolerance_', None),
+    }
@@ -0,0 +1,137 @@
+"""
+Run report for the dataset imputation.
+
+Every last_season_av bin of every pass adds one record: position group, pass, bin, backend, whether the bin was fitted
+or only transformed with a saved model, rows, columns, missing cells, wall time and, for fits, the iterations run, the
+per round change, the scaled tolerance and whether the fit stopped before max_iter. The report is written as JSON to
+data/madden/reports/ after each dataset build together with the tol / max_iter each group ran with.
+
+adaptive_settings turns the last report into tol / max_iter per position group, pass and bin: bins that converged get a
+max_iter just above the rounds they needed, bins that ran into max_iter get the tolerance at which their change per
+round had fallen below ADAPTIVE_CHANGE_RATIO of the first round (diminishing returns) and the rounds that took. Bin ids
+are positions between the last_season_av edges of the fit, so every pass keeps the edges its settings were derived
+with and a refit that bins with other edges ignores them.
+"""
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from src.modeling.imputer_backends import DEFAULT_MAX_ITER
+from src.transforms.registry_report import REPORTS_DIR
+
+IMPUTER_REPORT_PATH = REPORTS_DIR / "imputer_convergence.json"
+
+# Rounds added to what a bin needed last time
+ADAPTIVE_MARGIN = 2
+# A bin still changing at max_iter stops once its change per round is below this share of its first round change
+ADAPTIVE_CHANGE_RATIO = 0.05
+
+
+class ImputationReport:
+    def __init__(self, backend, settings=None):
+        """
+        :param backend: imputer backend of the run
+        :param settings: {position_group: {pass: {'bin_edges', 'bins': {bin: {'max_iter', 'tol'}}}}} the run uses
+            (adaptive_settings)
+        """
+        self.backend = backend
+        self.settings = settings or {}
+        self.records = []
+        self.started_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+    def extend(self, records):
+        self.records.extend(records)
+
+    def to_frame(self):
+        return pd.DataFrame(self.records)
+
+    def summary(self):
+        """Per position group and pass: bins, rows, fit seconds, most rounds and bins that hit max_iter."""
+        df = self.to_frame()
+        if df.empty:
+            return df
+        df['capped'] = df['converged'].eq(False)
+        return (
+            df.groupby(['position_group', 'pass'], sort=False)
+                .agg(bins=('bin', 'size'), rows=('rows', 'sum'), seconds=('seconds', 'sum'),
+                     max_n_iter=('n_iter', 'max'), max_iter=('max_iter', 'max'), capped=('capped', 'sum'))
+        )
+
+    def write(self, path=IMPUTER_REPORT_PATH):
+        path = Path(path)
+        os.makedirs(path.parent, exist_ok=True)
+        report = {
+            "started_at": self.started_at,
+            "finished_at": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "backend": self.backend,
+            "settings": self.settings,
+            "records": self.records,
+        }
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=1)
+        print(f"Imputation report written to {path}")
+        print(self.summary().to_string())
+        return path
+
+
+def read_imputation_report(path=IMPUTER_REPORT_PATH):
+    """Last written report as a dict, None if there is none."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _bin_settings(record, max_iter):
+    """max_iter / tol for the next fit of one bin."""
+    if record['converged']:
+        return {'max_iter': min(max_iter, record['n_iter'] + ADAPTIVE_MARGIN), 'tol': record['tol']}
+    # Still changing at max_iter: stop where the change fell below ADAPTIVE_CHANGE_RATIO of the first round change.
+    # IterativeImputer compares the change to tol x largest observed value (the scaled tolerance)
+    deltas = record['deltas']
+    scale = record['scaled_tolerance'] / record['tol']
+    threshold = ADAPTIVE_CHANGE_RATIO * deltas[0]
+    rounds = next((i + 1 for i, delta in enumerate(deltas) if delta < threshold), None)
+    return {
+        'max_iter': max_iter if rounds is None else min(max_iter, rounds + ADAPTIVE_MARGIN),
+        'tol': max(record['tol'], threshold / scale),
+    }
+
+
+def adaptive_settings(report, backend, max_iter=DEFAULT_MAX_ITER):
+    """
+    Per position group, pass and bin max_iter / tol from a previous run.
+
+    Groups fitted in the report get settings from the fit of every bin; groups the report only transformed keep the
+    settings they ran with. Only iterating backends that report a scaled tolerance (iterative_ridge) are tuned.
+    Settings of reports without bin edges are dropped, their bin ids cannot be matched to the bins of the coming run.
+
+    :param report: read_imputation_report()
+    :param backend: backend of the coming run, reports of another backend are ignored
+    :param max_iter: ceiling of every max_iter
+    :return: {position_group: {pass: {'bin_edges', 'bins': {bin: {'max_iter', 'tol'}}}}}
+    """
+    if report is None or report['backend'] != backend:
+        return {}
+    # JSON turned the bin ids into strings
+    settings = {
+        position_group: {
+            pass_key: {'bin_edges': values['bin_edges'], 'bins': {int(bin_id): bin_values for bin_id, bin_values in values['bins'].items()}}
+            for pass_key, values in passes.items() if 'bin_edges' in values
+        }
+        for position_group, passes in report['settings'].items()
+    }
+    fits = [
+        record for record in report['records']
+        if record['mode'] == 'fit' and record['scaled_tolerance'] is not None and record.get('bin_edges') is not None
+    ]
+    for position_group in {record['position_group'] for record in fits}:
+        settings[position_group] = {}
+    for record in fits:
+        values = settings[record['position_group']].setdefault(record['pass'], {'bin_edges': record['bin_edges'], 'bins': {}})
+        values['bins'][record['bin']] = _bin_settings(record, max_iter)
+    return settings
@@ -0,0 +1,70 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.store.madden_store import LAYER_SCHEMAS, write_season_partition
+
+
+def resolve_workers(workers=None):
+    """
+    Number of worker processes to use for per-season work.
+
+    Resolution order: explicit argument, MADDEN_WORKERS env var, 1 (sequential). 0 or a negative value means one
+    worker per core.
+    """
+    if workers is None:
+        workers = int(os.environ.get('MADDEN_WORKERS', 1))
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def map_seasons(func, seasons, workers=None):
+    """
+    Run `func(season)` for every season, fanning out over a process pool when more than one worker is configured.
+
+    `func` must be a module level (picklable) callable. Results are merged back into a dict ordered by season so the
+    output is identical regardless of the number of workers or completion order.
+
+    :param func: per-season builder returning a value for one season
+    :param seasons: seasons to build
+    :param workers: pool size (see resolve_workers)
+    :return: {season: func(season)} in ascending season order
+    """
+    seasons = sorted(seasons)
+    workers = min(resolve_workers(workers), len(seasons))
+    if workers <= 1:
+        return {season: func(season) for season in seasons}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(seasons, pool.map(func, seasons)))
+
+
+def _write_season_frame(args):
+    df, root_path, feature_store_name, season, file_format, exports = args
+    for fmt in [file_format] + list(exports):
+        if fmt == 'parquet' and feature_store_name in LAYER_SCHEMAS:
+            write_season_partition(feature_store_name, season, df, root_path=root_path)
+        elif fmt == 'parquet':
+            df.to_parquet(f"{root_path}/{feature_store_name}/{season}.parquet", index=False)
+        else:
+            df.to_csv(f"{root_path}/{feature_store_name}/{season}.csv", index=False)
+    return season
+
+
+def write_season_frames(frames, root_path, feature_store_name, file_format, exports=(), workers=None):
+    """
+    Write {season: frame} to `{root_path}/{feature_store_name}/{season}.{file_format}`, serialising in parallel.
+    Layers with a store schema (stage, processed) go through the typed Parquet store; `exports` lists additional
+    formats written alongside (e.g. the published processed CSVs).
+
+    :return: list of seasons written, ascending
+    """
+    seasons = sorted(frames.keys())
+    jobs = [(frames[season], root_path, feature_store_name, season, file_format, exports) for season in seasons]
+    workers = min(resolve_workers(workers), len(jobs))
+    if workers <= 1:
+        for job in jobs:
+            _write_season_frame(job)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_write_season_frame, jobs))
+    return seasons
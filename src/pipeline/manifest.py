@@ -0,0 +1,199 @@
+import ast
+import hashlib
+import inspect
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+from nfl_data_loader.utils.utils import find_year_for_season, get_seasons_to_update
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def file_fingerprint(path, season=None, season_column=None):
+    """
+    Content hash of a stage input.
+
+    If `season_column` is given the file is treated as a multi-season table and only the rows belonging to `season`
+    are hashed, so a change to one season of e.g. missed.csv does not dirty every other season.
+
+    :param path: file to hash
+    :param season: season used to filter rows when `season_column` is set
+    :param season_column: column holding the season in a multi-season file
+    :return: hex digest or None if the file does not exist
+    """
+    if not os.path.exists(path):
+        return None
+    if season_column is None:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    df = pd.read_csv(path, low_memory=False)
+    df = df[df[season_column] == season]
+    if df.empty:
+        return None
+    return hashlib.sha256(pd.util.hash_pandas_object(df, index=False).values.tobytes()).hexdigest()
+
+
+def code_fingerprint(modules):
+    """
+    Hash of the source files that build a stage. Any edit to them invalidates every season of the stage.
+
+    :param modules: paths relative to the project root
+    :return: hex digest
+    """
+    digest = hashlib.sha256()
+    for module in sorted(modules):
+        digest.update(module.encode())
+        digest.update((PROJECT_ROOT / module).read_bytes())
+    return digest.hexdigest()
+
+
+def module_closure(module_path):
+    """
+    Project source files a module builds on: the module itself plus every `src.*` module it imports, transitively.
+    Imports are read statically, so the list follows the code without importing anything.
+
+    :param module_path: source file
+    :return: sorted paths relative to the project root
+    """
+    seen = set()
+    pending = [Path(module_path).resolve()]
+    while pending:
+        path = pending.pop()
+        relative = path.relative_to(PROJECT_ROOT).as_posix()
+        if relative in seen:
+            continue
+        seen.add(relative)
+        for node in ast.walk(ast.parse(path.read_text())):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                # `from src.x import y` may import the module src.x.y
+                names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            for name in names:
+                candidate = PROJECT_ROOT / f"{name.replace('.', '/')}.py"
+                if name.split('.')[0] == 'src' and candidate.exists():
+                    pending.append(candidate)
+    return sorted(seen)
+
+
+def builder_modules(builder, data_files=()):
+    """
+    Every file whose edit invalidates a stage: the import closure of the builder's module plus data files it reads
+    (e.g. hand maintained tables).
+
+    :param builder: stage builder function (raw_obj)
+    :param data_files: extra paths relative to the project root
+    :return: paths relative to the project root
+    """
+    return module_closure(inspect.getsourcefile(builder)) + list(data_files)
+
+
+def season_input_fingerprint(fs_meta_obj, season):
+    """
+    Combined fingerprint of every upstream input of one season of a stage.
+
+    :return: hex digest or None if a required upstream input is missing (season cannot be built yet)
+    """
+    digest = hashlib.sha256()
+    for upstream in fs_meta_obj.get('upstream', []):
+        path = upstream['path'].format(season=season + upstream.get('season_offset', 0))
+        fingerprint = file_fingerprint(path, season=season, season_column=upstream.get('season_column'))
+        if fingerprint is None:
+            if upstream.get('required', True):
+                return None
+            fingerprint = 'missing'
+        digest.update(path.encode())
+        digest.update(fingerprint.encode())
+    return digest.hexdigest()
+
+
+def _manifest_path(root_path, feature_store_name):
+    return f"{root_path}/manifest/{feature_store_name}.json"
+
+
+def load_manifest(root_path, feature_store_name):
+    try:
+        with open(_manifest_path(root_path, feature_store_name)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_manifest(root_path, feature_store_name, manifest):
+    os.makedirs(f"{root_path}/manifest", exist_ok=True)
+    with open(_manifest_path(root_path, feature_store_name), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def plan_stage(root_path, fs_meta_obj, full_rebuild=False):
+    """
+    Determine which seasons of a stage need rebuilding.
+
+    Source stages (no `upstream`) keep the original pump behaviour: the seasons returned by get_seasons_to_update.
+    Derived stages rebuild a season only when its output is missing, it has never been recorded in the manifest, or
+    the fingerprint of its upstream inputs / builder code differs from the one recorded at its last build. Stages that
+    also read live sources without a file to fingerprint (`refresh_latest_season`, e.g. the nflverse rosters joined
+    into processed) always rebuild their latest buildable season, so in-season roster changes are picked up.
+
+    :param root_path: feature store root (./data/madden)
+    :param fs_meta_obj: stage meta (name, start_season, raw_obj, file_format, upstream, code, refresh_latest_season)
+    :param full_rebuild: ignore the manifest and rebuild every buildable season
+    :return: {season: {"inputs": fingerprint, "code": fingerprint}} for every season to rebuild
+    """
+    feature_store_name = fs_meta_obj['name']
+    file_format = fs_meta_obj.get('file_format', 'csv')
+    seasons = list(range(fs_meta_obj['start_season'], find_year_for_season() + 1))
+
+    if not fs_meta_obj.get('upstream'):
+        update_seasons = get_seasons_to_update(root_path, feature_store_name)
+        return {season: {"inputs": None, "code": None} for season in update_seasons}
+
+    manifest = load_manifest(root_path, feature_store_name)
+    plan = {}
+    current = stage_fingerprints(fs_meta_obj, seasons)
+    for season, fingerprints in current.items():
+        recorded = manifest.get(str(season), {})
+        output_exists = os.path.exists(f"{root_path}/{feature_store_name}/{season}.{file_format}")
+        if full_rebuild or not output_exists or any(recorded.get(key) != value for key, value in fingerprints.items()):
+            plan[season] = fingerprints
+    if fs_meta_obj.get('refresh_latest_season') and current:
+        latest_season = max(current)
+        plan[latest_season] = current[latest_season]
+    return plan
+
+
+def stage_fingerprints(fs_meta_obj, seasons):
+    """
+    Current input / code fingerprints of seasons of a stage.
+
+    :return: {season: {"inputs": fingerprint, "code": fingerprint}}, seasons whose upstream is not available yet left out
+    """
+    code = code_fingerprint(fs_meta_obj.get('code', []))
+    fingerprints = {}
+    for season in seasons:
+        inputs = season_input_fingerprint(fs_meta_obj, season)
+        if inputs is not None:
+            fingerprints[season] = {"inputs": inputs, "code": code}
+    return fingerprints
+
+
+def record_stage_build(root_path, fs_meta_obj, plan, built_seasons):
+    """
+    Persist the fingerprints of the seasons that were rebuilt so the next run can skip them.
+    """
+    if not fs_meta_obj.get('upstream'):
+        return
+    feature_store_name = fs_meta_obj['name']
+    manifest = load_manifest(root_path, feature_store_name)
+    built_at = datetime.now(timezone.utc).isoformat()
+    for season in built_seasons:
+        manifest[str(season)] = dict(plan[season], built_at=built_at)
+    save_manifest(root_path, feature_store_name, manifest)
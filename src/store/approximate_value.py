@@ -0,0 +1,63 @@
+"""
+In-memory store of PFR approximate values, loaded once per run.
+
+Every season in `data/pfr/approximate_value` is read from disk into a single frame indexed by (pfr_id, season).
+Seasons that are not on disk are fetched from the published GitHub copy on first use and kept for the rest of the run.
+"""
+from pathlib import Path
+
+import pandas as pd
+
+from src.extracts.madden import get_approximate_value
+
+AV_DIR = (Path(__file__).resolve()          # /project_root/src/store/approximate_value.py
+          .parents[2]                       # /project_root/
+          / "data" / "pfr" / "approximate_value")
+
+AV_COLUMNS = ['player_id', 'name', 'team', 'season', 'approximate_value']
+
+
+class ApproximateValueStore:
+    def __init__(self, root_path=AV_DIR):
+        paths = sorted((p for p in Path(root_path).glob("*.csv") if p.stem.isdigit()), key=lambda p: int(p.stem))
+        frames = [pd.read_csv(path) for path in paths]
+        self.seasons = {int(path.stem) for path in paths}
+        self.frame = self._index(pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=AV_COLUMNS))
+
+    @staticmethod
+    def _index(df):
+        return df.rename(columns={'player_id': 'pfr_id'}).set_index(['pfr_id', 'season'])
+
+    def _load_remote(self, season):
+        df = get_approximate_value(season)
+        self.seasons.add(season)
+        if df.empty:
+            print(f"No approximate values for {season} locally or remotely")
+            return
+        self.frame = pd.concat([self.frame, self._index(df)])
+
+    def season(self, season):
+        """
+        Approximate values of one season in file order (one row per player and team), remote fallback if not on disk.
+
+        :return: DataFrame with the approximate_value csv columns
+        """
+        if season not in self.seasons:
+            self._load_remote(season)
+        rows = self.frame[self.frame.index.get_level_values('season') == season]
+        return rows.reset_index().rename(columns={'pfr_id': 'player_id'})[AV_COLUMNS]
+
+    def for_seasons(self, seasons):
+        """
+        Approximate values of several seasons in one frame, each season in file order.
+
+        :return: DataFrame with the approximate_value csv columns
+        """
+        seasons = list(dict.fromkeys(seasons))
+        for season in seasons:
+            if season not in self.seasons:
+                self._load_remote(season)
+        rows = self.frame[self.frame.index.get_level_values('season').isin(seasons)]
+        rows = rows.reset_index().rename(columns={'pfr_id': 'player_id'})[AV_COLUMNS]
+        order = {season: i for i, season in enumerate(seasons)}
+        return rows.sort_values('season', key=lambda s: s.map(order), kind='mergesort').reset_index(drop=True)
@@ -0,0 +1,158 @@
+"""
+Embedded SQLite crosswalk between player identifiers.
+
+Every registry build writes `data/madden/registry/identity.sqlite`: one row per player season with the nflverse
+`player_id` (gsis), the Madden `madden_id`, the PFR `pfr_id` and EA's `ea_id` (EA ratings API seasons only), plus the
+attributes players are usually searched by. Each identifier, (season, fullname_clean), (team, jerseynumber, season) and
+birthdate are B-tree indexed, so a point lookup reads a handful of pages instead of 25 seasons of CSV.
+"""
+import os
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+
+from src.store.madden_store import MADDEN_DIR
+from src.transforms.name_index import name_tokens
+
+IDENTITY_DB_PATH = MADDEN_DIR / "registry" / "identity.sqlite"
+
+ID_COLUMNS = ['player_id', 'madden_id', 'pfr_id', 'ea_id']
+IDENTITY_COLUMNS = ID_COLUMNS + ['season', 'fullname', 'fullname_clean', 'team', 'position_group', 'jerseynumber', 'birthdate']
+
+CREATE_TABLE = """
+CREATE TABLE player_seasons (
+    player_id TEXT,
+    madden_id TEXT,
+    pfr_id TEXT,
+    ea_id TEXT,
+    season INTEGER NOT NULL,
+    fullname TEXT,
+    fullname_clean TEXT,
+    team TEXT,
+    position_group TEXT,
+    jerseynumber INTEGER,
+    birthdate TEXT
+)
+"""
+INDEXES = {
+    'ix_player_id': ['player_id'],
+    'ix_madden_id': ['madden_id'],
+    'ix_pfr_id': ['pfr_id'],
+    'ix_ea_id': ['ea_id'],
+    'ix_season_name': ['season', 'fullname_clean'],
+    'ix_team_jersey_season': ['team', 'jerseynumber', 'season'],
+    'ix_birthdate': ['birthdate'],
+}
+
+
+def clean_fullname(name):
+    """Lookup form of a name: lowercase tokens without punctuation or suffixes ("D.J. Moore Jr." -> 'dj moore')."""
+    return ' '.join(name_tokens(name)) or None
+
+
+def _conform_identity_rows(df):
+    out = pd.DataFrame(index=df.index)
+    for col in ID_COLUMNS + ['fullname', 'team', 'position_group']:
+        values = df[col] if col in df.columns else pd.Series(None, index=df.index, dtype=object)
+        out[col] = values.astype(object).where(values.notna(), None)
+    # EA ids are numeric in the raw exports (floats once a column is partially null)
+    out['ea_id'] = out['ea_id'].map(lambda v: v if v is None or isinstance(v, str) else str(int(v)))
+    out['season'] = pd.to_numeric(df['season']).astype(int)
+    out['fullname_clean'] = out['fullname'].map(clean_fullname)
+    out['jerseynumber'] = pd.to_numeric(df['jerseynumber'], errors='coerce').astype('Int64').astype(object)
+    out['jerseynumber'] = out['jerseynumber'].where(out['jerseynumber'].notna(), None)
+    birthdate = pd.to_datetime(df['birthdate'], errors='coerce', format='mixed').dt.strftime('%Y-%m-%d')
+    out['birthdate'] = birthdate.where(birthdate.notna(), None)
+    return out[IDENTITY_COLUMNS].drop_duplicates()
+
+
+def write_identity_store(df, path=IDENTITY_DB_PATH):
+    """
+    Rebuild the identity store from player season rows. The database is written next to the target and swapped in,
+    so readers never see a half written store.
+
+    :param df: rows with any of the ID_COLUMNS plus season, fullname, team, position_group, jerseynumber, birthdate
+    :param path: sqlite file
+    :return: number of rows written
+    """
+    rows = _conform_identity_rows(df)
+    path = Path(path)
+    os.makedirs(path.parent, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    if tmp.exists():
+        tmp.unlink()
+    with sqlite3.connect(tmp) as conn:
+        conn.execute(CREATE_TABLE)
+        conn.executemany(
+            f"INSERT INTO player_seasons ({', '.join(IDENTITY_COLUMNS)}) VALUES ({', '.join('?' * len(IDENTITY_COLUMNS))})",
+            rows.itertuples(index=False, name=None),
+        )
+        for name, columns in INDEXES.items():
+            conn.execute(f"CREATE INDEX {name} ON player_seasons ({', '.join(columns)})")
+        conn.execute("ANALYZE")
+    conn.close()
+    os.replace(tmp, path)
+    print(f"Identity store: {len(rows)} player seasons written to {path}")
+    return len(rows)
+
+
+class IdentityStore:
+    """
+    Read only point lookups against the identity store.
+
+    :param path: sqlite file written by write_identity_store
+    """
+
+    def __init__(self, path=IDENTITY_DB_PATH):
+        if not Path(path).exists():
+            raise FileNotFoundError(f"No identity store at {path}; build the processed madden layer first")
+        self.conn = sqlite3.connect(f"{Path(path).as_uri()}?mode=ro", uri=True, check_same_thread=False)
+
+    def _rows(self, where, params):
+        return pd.read_sql_query(f"SELECT * FROM player_seasons WHERE {where} ORDER BY season", self.conn, params=params)
+
+    def resolve(self, id_type, value):
+        """
+        Every identifier known for the player behind one identifier.
+
+        :param id_type: one of ID_COLUMNS
+        :param value: identifier value
+        :return: {id_type: sorted list of values} for every ID column, None when the identifier is unknown
+        """
+        if id_type not in ID_COLUMNS:
+            raise ValueError(f"Unknown id type {id_type!r}, expected one of {ID_COLUMNS}")
+        rows = self._rows(f"{id_type} = ?", [str(value)])
+        if rows.empty:
+            return None
+        # Widen to every season of the player, also the ones only known under its other id
+        player_ids = rows['player_id'].dropna().unique().tolist()
+        madden_ids = rows['madden_id'].dropna().unique().tolist()
+        clauses, params = [], []
+        for col, values in (('player_id', player_ids), ('madden_id', madden_ids)):
+            if values:
+                clauses.append(f"{col} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        rows = pd.concat([rows, self._rows(' OR '.join(clauses), params)]) if clauses else rows
+        return {col: sorted(rows[col].dropna().unique().tolist()) for col in ID_COLUMNS}
+
+    def by_name(self, fullname, season):
+        """Player seasons with this (cleaned) name in a season."""
+        return self._rows("season = ? AND fullname_clean = ?", [int(season), clean_fullname(fullname)])
+
+    def by_jersey(self, team, jerseynumber, season):
+        """Player seasons wearing a jersey number for a team in a season."""
+        return self._rows("team = ? AND jerseynumber = ? AND season = ?", [team, int(jerseynumber), int(season)])
+
+    def by_birthdate(self, birthdate):
+        """Player seasons of every player born on a date."""
+        return self._rows("birthdate = ?", [pd.Timestamp(birthdate).strftime('%Y-%m-%d')])
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,217 @@
+"""
+Season partitioned Parquet store for the stage and processed Madden layers.
+
+Each layer is written as one file per season (`data/madden/{layer}/{season}.parquet`) with an explicit Arrow schema,
+so readers never re-run CSV type inference. Rows are stably sorted by position_group and packed into a few row groups;
+filters on position_group are pushed down to the row group statistics and season filters only open the matching
+partitions.
+"""
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+MADDEN_DIR = (Path(__file__).resolve()          # /project_root/src/store/madden_store.py
+              .parents[2]                       # /project_root/
+              / "data" / "madden")     # /project_root/data/madden
+
+# Madden attribute columns in stored order; archetype / runningstyle are labels, everything else a 0-99 rating
+ATTRIBUTE_COLUMNS = [
+    'agility', 'acceleration', 'speed', 'stamina',
+    'strength', 'toughness', 'injury', 'awareness', 'jumping', 'trucking',
+    'archetype', 'runningstyle', 'changeofdirection', 'playrecognition',
+    'throwpower', 'throwaccuracyshort', 'throwaccuracymid', 'throwaccuracydeep', 'playaction', 'throwonrun',
+    'carrying', 'ballcarriervision', 'stiffarm', 'spinmove', 'jukemove',
+    'catching', 'shortrouterunning', 'midrouterunning', 'deeprouterunning', 'spectacularcatch', 'catchintraffic', 'release',
+    'runblocking', 'passblocking', 'impactblocking',
+    'mancoverage', 'zonecoverage', 'tackle', 'hitpower', 'press', 'pursuit',
+    'kickaccuracy', 'kickpower', 'return',
+]
+ATTRIBUTE_FIELDS = [(col, pa.string() if col in ('archetype', 'runningstyle') else pa.float64()) for col in ATTRIBUTE_COLUMNS]
+
+STAGE_SCHEMA = pa.schema(
+    [
+        ('madden_id', pa.string()),
+        ('team', pa.string()),
+        ('season', pa.int16()),
+        ('fullname', pa.string()),
+        ('high_pos_group', pa.string()),
+        ('position_group', pa.string()),
+        ('position', pa.string()),
+        ('overallrating', pa.float64()),
+    ]
+    + ATTRIBUTE_FIELDS
+    + [
+        ('jerseynumber', pa.float64()),
+        ('yearspro', pa.float64()),
+        ('age', pa.float64()),
+        ('birthdate', pa.date32()),
+        ('ea_id', pa.string()),
+    ]
+)
+
+PROCESSED_SCHEMA = pa.schema(
+    [
+        ('player_id', pa.string()),
+        ('season', pa.int16()),
+        ('fullname', pa.string()),
+        ('team', pa.string()),
+        ('high_pos_group', pa.string()),
+        ('position_group', pa.string()),
+        ('position', pa.string()),
+        ('jerseynumber', pa.float64()),
+        ('yearspro', pa.float64()),
+        ('birthdate', pa.date32()),
+        ('age', pa.float64()),
+        ('madden_id', pa.string()),
+        ('pfr_id', pa.string()),
+        ('height', pa.float64()),
+        ('weight', pa.float64()),
+        ('headshot', pa.string()),
+        ('college_name', pa.string()),
+        ('college_conference', pa.string()),
+        ('rookie_season', pa.float64()),
+        ('draft_year', pa.float64()),
+        ('draft_round', pa.float64()),
+        ('draft_pick', pa.float64()),
+        ('draft_team', pa.string()),
+        ('forty', pa.float64()),
+        ('bench', pa.float64()),
+        ('vertical', pa.float64()),
+        ('broad_jump', pa.float64()),
+        ('cone', pa.float64()),
+        ('shuttle', pa.float64()),
+        ('last_updated', pa.string()),
+        ('is_rookie', pa.bool_()),
+        ('last_season_av', pa.float64()),
+        ('overallrating', pa.float64()),
+    ]
+    + ATTRIBUTE_FIELDS
+)
+
+LAYER_SCHEMAS = {
+    'stage': STAGE_SCHEMA,
+    'processed': PROCESSED_SCHEMA,
+}
+
+ROW_GROUP_ROWS = 512
+
+# In-memory schema of the all-season rating frames: repeated labels as categoricals, 0-99 ratings as UInt8
+COMPACT_CATEGORY_COLUMNS = ['team', 'position', 'position_group', 'high_pos_group', 'madden_id']
+RATING_COLUMNS = ['overallrating'] + [name for name, dtype in ATTRIBUTE_FIELDS if pa.types.is_floating(dtype)]
+
+
+def _partition_path(layer, season, root_path=MADDEN_DIR):
+    return f"{root_path}/{layer}/{season}.parquet"
+
+
+def _label_to_str(value):
+    # Numeric codes mixed into label columns: CSV round trips turn 16 into 16.0, store both as '16'
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _conform_to_schema(df, schema):
+    """
+    Coerce a frame to the layer schema: numerics via to_numeric (stray markers like '??' / 'nan' become null), dates
+    via to_datetime, strings keep None for missing. Columns outside the schema are dropped with a notice.
+    """
+    extra = [col for col in df.columns if col not in schema.names]
+    if extra:
+        print(f"Dropping columns not in store schema: {extra}")
+    out = {}
+    for field in schema:
+        col = df[field.name] if field.name in df.columns else pd.Series(None, index=df.index, dtype=object)
+        if pa.types.is_string(field.type):
+            out[field.name] = col.astype(object).where(col.notna(), None).map(_label_to_str)
+        elif pa.types.is_date(field.type):
+            out[field.name] = pd.to_datetime(col, errors='coerce', format='mixed').dt.normalize()
+        elif pa.types.is_boolean(field.type):
+            out[field.name] = col.astype('boolean')
+        else:
+            out[field.name] = pd.to_numeric(col, errors='coerce')
+    return pd.DataFrame(out, index=df.index)
+
+
+def write_season_partition(layer, season, df, root_path=MADDEN_DIR):
+    """
+    Write one season of a layer. Rows are stably sorted by position_group (original order is kept within a group)
+    and contiguous position groups are packed into row groups of at least ROW_GROUP_ROWS rows. The min/max
+    statistics of each row group then cover a narrow position_group range, so position filters skip most of the file
+    without paying the per-row-group overhead of one tiny row group per position.
+    """
+    schema = LAYER_SCHEMAS[layer]
+    df = _conform_to_schema(df, schema)
+    df = df.sort_values('position_group', kind='mergesort', na_position='last')
+    os.makedirs(f"{root_path}/{layer}", exist_ok=True)
+    with pq.ParquetWriter(_partition_path(layer, season, root_path), schema) as writer:
+        chunk = []
+        for _, group in df.groupby('position_group', sort=False, dropna=False):
+            chunk.append(group)
+            if sum(len(part) for part in chunk) >= ROW_GROUP_ROWS:
+                writer.write_table(pa.Table.from_pandas(pd.concat(chunk), schema=schema, preserve_index=False))
+                chunk = []
+        if chunk or df.empty:
+            writer.write_table(pa.Table.from_pandas(pd.concat(chunk) if chunk else df, schema=schema, preserve_index=False))
+
+
+def read_madden_layer(layer, seasons=None, columns=None, position_groups=None, root_path=MADDEN_DIR):
+    """
+    Read a stage/processed layer with projection and predicate pushdown.
+
+    :param layer: 'stage' or 'processed'
+    :param seasons: seasons to read (default: every partition on disk). Missing partitions are skipped.
+    :param columns: columns to project (default: full schema)
+    :param position_groups: only return rows in these position groups (row groups outside them are not read)
+    :return: DataFrame typed by the layer schema
+    """
+    schema = LAYER_SCHEMAS[layer]
+    if seasons is None:
+        seasons = sorted(int(p.stem) for p in Path(f"{root_path}/{layer}").glob("*.parquet") if p.stem.isdigit())
+    paths = [_partition_path(layer, season, root_path) for season in seasons]
+    paths = [path for path in paths if os.path.exists(path)]
+    if not paths:
+        return pd.DataFrame({name: pd.Series(dtype=schema.field(name).type.to_pandas_dtype()) for name in (columns or schema.names)})
+
+    row_filter = None
+    if position_groups is not None:
+        row_filter = ds.field('position_group').isin(list(position_groups))
+    table = ds.dataset(paths, schema=schema, format='parquet').to_table(columns=columns, filter=row_filter)
+    df = table.to_pandas(date_as_object=False)
+    # Missing labels come back as NaN like read_csv produced (RUN_STYLE_MAPPER maps None, but not NaN, to a style)
+    for name in df.columns:
+        if pa.types.is_string(schema.field(name).type):
+            df[name] = df[name].where(df[name].notna(), np.nan)
+    return df
+
+
+def compact_frame(df, label='frame'):
+    """
+    Shrink an in-memory rating frame in place: string label columns become categoricals and ratings become UInt8.
+    A rating column holding anything but whole numbers in 0-255 keeps its dtype.
+
+    :param df: frame with any of COMPACT_CATEGORY_COLUMNS / RATING_COLUMNS
+    :param label: name used in the memory report
+    :return: df
+    """
+    before = df.memory_usage(deep=True).sum()
+    for col in COMPACT_CATEGORY_COLUMNS:
+        if col in df.columns and df[col].dtype == object:
+            df[col] = df[col].astype('category')
+    for col in RATING_COLUMNS:
+        if col not in df.columns or df[col].dtype == 'UInt8':
+            continue
+        values = pd.to_numeric(df[col], errors='coerce')
+        known = values.dropna()
+        if known.between(0, 255).all() and (known == known.round()).all():
+            df[col] = values.astype('UInt8')
+    after = df.memory_usage(deep=True).sum()
+    print(f"{label}: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB in memory")
+    return df
@@ -5,8 +5,6 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from nfl_data_loader.api.sources.players.general.players import collect_players
-from nfl_data_loader.api.sources.players.rosters.rosters import collect_roster
 
 import os
 
@@ -14,40 +12,103 @@ import os
 from nfl_data_loader.schemas.players.position import HIGH_POSITION_MAPPER, POSITION_MAPPER
 from nfl_data_loader.utils.utils import name_filter
 
+from src.extracts.nflverse import collect_players, collect_roster
+from src.pipeline.executor import map_seasons
+from src.store.madden_store import read_madden_layer
+from src.transforms.madden_overrides import apply_overrides, write_override_report
+
 MONTH_TO_NUM = {m.lower(): i for i, m in enumerate(calendar.month_name) if m}
 MONTH_TO_NUM.update({m.lower(): i for i, m in enumerate(calendar.month_abbr) if m})
 # e.g. "july" → 7, "jul" → 7
 
-def _month_to_int(m) -> int | None:
+def _months_to_int(months: pd.Series) -> pd.Series:
     """
-    Return 1-12 or None.
+    Vectorized month parser, returns 1-12 or NaN per row.
     Accepts:
       • "July" / "jul" / "JUL"
       • 3          (int)
       • "3" / "03" (str)
       • 3.0000     (float)
     """
-    if pd.isna(m):
-        return None
+    keys = months.astype(str).str.strip().str.lower()
     # 1-a  string names / abbreviations
-    key = str(m).strip().lower()
-    if key in MONTH_TO_NUM:
-        return MONTH_TO_NUM[key]
+    named = keys.map(MONTH_TO_NUM)
     # 1-b  digits: "3" / "03" / 3 / 3.0000
-    try:
-        num = int(float(key))        # handles "3.0000" too
-        if 1 <= num <= 12:
-            return num
-    except ValueError:
-        pass
-    return None
+    numeric = np.trunc(pd.to_numeric(keys, errors='coerce'))
+    numeric = numeric.where((numeric >= 1) & (numeric <= 12))
+    return named.fillna(numeric).where(months.notna())
+
+
+def _build_dates(year: pd.Series, month: pd.Series, day: pd.Series) -> pd.Series:
+    """Assemble dates column-wise; rows with missing or impossible parts (Feb 30, month 13, ...) become NaT."""
+    parts = pd.DataFrame({'year': year, 'month': month, 'day': day})
+    valid = parts.notna().all(axis=1)
+    out = pd.Series(pd.NaT, index=year.index, dtype='datetime64[ns]')
+    if valid.any():
+        out[valid] = pd.to_datetime(parts[valid].astype('int64'), errors='coerce')
+    return out
+
+
+def _parse_day_month_year(day: pd.Series, month: pd.Series, year: pd.Series) -> pd.Series:
+    """
+    Birthdates stored as separate day / month / year columns (e.g. 23.000 / "July" / 1976.000).
+    """
+    return _build_dates(
+        np.trunc(pd.to_numeric(year, errors='coerce')),
+        _months_to_int(month),
+        np.trunc(pd.to_numeric(day, errors='coerce')),
+    )
+
+
+def _parse_birthdate_cells(cells: pd.Series) -> pd.Series:
+    """
+    Vectorized parser for birthdate columns mixing digit strings and date-like strings.
+
+    Digit strings are read as MMDDYY / MDDYY / MDYY with a two digit year (< 35 → 20yy, else 19yy); everything else is
+    parsed as a date-like string and normalized to midnight. Unparseable cells become NaT.
+    """
+    x_str = cells.astype(str).str.strip().where(cells.notna())
+    n = x_str.str.len()
+    digits = x_str.fillna('').str.isdigit()
+
+    out = pd.Series(pd.NaT, index=cells.index, dtype='datetime64[ns]')
+    for length, (mm, dd, yy) in {
+        6: (slice(0, 2), slice(2, 4), slice(4, None)),  # MMDDYY
+        5: (slice(0, 1), slice(1, 3), slice(3, None)),  # MDDYY
+        4: (slice(0, 1), slice(1, 2), slice(2, None)),  # MDYY
+    }.items():
+        mask = digits & (n == length)
+        if mask.any():
+            part = x_str[mask]
+            yy_int = part.str[yy].astype(int)
+            out[mask] = _build_dates(
+                yy_int.where(yy_int >= 35, yy_int + 100) + 1900,
+                part.str[mm].astype(int),
+                part.str[dd].astype(int),
+            )
+
+    # --- date-like strings (and digit strings of any other length) ----------------
+    rest = cells.notna() & ~(digits & n.isin([4, 5, 6]))
+    if rest.any():
+        out[rest] = pd.to_datetime(cells[rest], format='mixed', errors='coerce').dt.normalize()
+    return out
+
 
 MADDEN_DIR = (Path(__file__).resolve()          # /project_root/src/my_module.py
               .parents[2]                       # /project_root/
               / "data" / "madden")     # /project_root/data/madden/raw
 
+def ea_export_seasons(seasons):
+    """Seasons whose raw export came from the EA ratings API, i.e. carries EA's Player.id (only the header is read)."""
+    found = []
+    for season in seasons:
+        path = f'{MADDEN_DIR}/raw/{season}.csv'
+        if os.path.exists(path) and 'playerid' in [_madden_column_normalizer(i) for i in pd.read_csv(path, nrows=0).columns]:
+            found.append(season)
+    return found
+
 def read_stage_madden_data(year):
-    return pd.read_csv(f'{MADDEN_DIR}/stage/{year}.csv')
+    return read_madden_layer('stage', seasons=[year])
 
 def read_raw_madden_data(year):
     df = pd.read_csv(f'{MADDEN_DIR}/raw/{year}.csv')
@@ -97,6 +158,10 @@ def read_raw_madden_data(year):
         else:
             df['deeprouterunning'] = df['routerunning']
 
+    # EA ratings API exports carry EA's own Player.id
+    if 'playerid' in df.columns:
+        df = df.rename(columns={'playerid': 'ea_id'})
+
     if 'season' not in df.columns:
         df['season'] = year
 
@@ -113,64 +178,13 @@ def read_raw_madden_data(year):
         df = df.drop(columns=['overall\nrating'])
 
     if 'birthday' in df.columns:
-        def _row_to_date(r):
-            d_raw, m_raw, y_raw = r['birthday'], r['birthmonth'], r['birthyear']
-
-            if pd.isna(d_raw) or pd.isna(m_raw) or pd.isna(y_raw):
-                return pd.NaT
-
-            try:
-                day = int(float(d_raw))  # 23.000 → 23
-                year = int(float(y_raw))  # 1976.000 → 1976
-                month = _month_to_int(m_raw)
-                if month is None:
-                    return pd.NaT
-                return pd.Timestamp(year=year, month=month, day=day)
-            except Exception:
-                return pd.NaT
-        df['birthdate'] = df.apply(_row_to_date, axis=1)
+        df['birthdate'] = _parse_day_month_year(df['birthday'], df['birthmonth'], df['birthyear'])
         df = df.drop(columns=['birthyear', 'birthmonth', 'birthday'])
 
 
     if 'birthdate' in df.columns:
-        def _century_fix(yy: int) -> int:
-            return 2000 + yy if yy < 35 else 1900 + yy
-        def _safe_ts(y, m, d):
-            try:
-                return pd.Timestamp(year=y, month=m, day=d)
-            except ValueError:
-                return pd.NaT
-
-        def _parse_cell(x):
-            if pd.isna(x):
-                return pd.NaT
-
-            # --- digits patterns -------------------------------------
-            x_str = str(x).strip()
-            if x_str.isdigit():
-                n = len(x_str)
-
-                if n == 6:  # MMDDYY
-                    mm, dd, yy = int(x_str[:2]), int(x_str[2:4]), int(x_str[4:])
-                    return _safe_ts(_century_fix(yy), mm, dd)
-
-                if n == 5:  # MDDYY
-                    mm, dd, yy = int(x_str[0]), int(x_str[1:3]), int(x_str[3:])
-                    return _safe_ts(_century_fix(yy), mm, dd)
-
-                if n == 4:  # MDYY  ← NEW branch
-                    mm, dd, yy = int(x_str[0]), int(x_str[1]), int(x_str[2:])
-                    return _safe_ts(_century_fix(yy), mm, dd)
-
-            # --- fast path: already a date-like string ----------------
-            try:
-                ts = pd.to_datetime(x, errors="raise")
-                return ts.normalize()
-            except Exception:
-                return pd.NaT
-
         if year in [2018, 2019]: # 32589 like datetimes
-            df['birthdate'] = df['birthdate'].apply(_parse_cell)
+            df['birthdate'] = _parse_birthdate_cells(df['birthdate'])
         elif year in [2021, 2023]:
             df['birthdate'] = pd.NaT ## Unparseable datetime...
         else:
@@ -209,76 +223,13 @@ def read_raw_madden_data(year):
     df.high_pos_group = df.high_pos_group.map(HIGH_POSITION_MAPPER)
 
     df = df.replace('n/a', 0)
-    # DE that should be OLB (normalizes start of career to end of career position)
-    df.loc[df.fullname == 'John Abraham', 'position_group'] = 'd_field'
-    df.loc[df.fullname == 'Chike Okeafor', 'position_group'] = 'd_field'
-    df.loc[((df.fullname == 'Bertrand Berry')), 'position_group'] = 'd_field'
-    df.loc[((df.fullname == 'Fred Wakefield')), 'position_group'] = 'o_line'
-    df.loc[((df.fullname == 'Will Overstreet')), 'position_group'] = 'd_field'
-    df.loc[((df.fullname == 'R-Kal Truluck')), 'position_group'] = 'd_field'
-    df.loc[((df.fullname == 'Eric Ogbogu')), 'position_group'] = 'd_field'
-    df.loc[((df.fullname == 'Adalius Thomas')), 'position_group'] = 'd_field'
-    df.loc[((df.fullname == 'Terrell Suggs')), 'position_group'] = 'd_field'
-    df.loc[((df.fullname == 'Jason Gildon')), 'position_group'] = 'd_field'
-    df.loc[((df.fullname == 'Robert Mathis')), 'position_group'] = 'd_field'
-    df.loc[((df.fullname == 'Shawne Merriman')), 'position_group'] = 'd_line'
-    df.loc[((df.fullname == 'Jason Babin')), 'position_group'] = 'd_line'
-    df.loc[((df.fullname == 'Kenard Lang')), 'position_group'] = 'd_line'
-    df.loc[((df.fullname == 'OJ Atogwe')), 'position_group'] = 'd_line'
-    df.loc[((df.fullname == 'Damane Duckett')), 'position_group'] = 'd_field'
-    df.loc[((df.fullname == 'Brock Lesnar')), 'position_group'] = 'd_line'
-    df.loc[((df.fullname == 'Antwan Peek')), 'position_group'] = 'd_field'
-    df.loc[df.fullname == 'Dan Klecko', 'position_group'] = 'o_rush'
-    df.loc[df.fullname == 'Tamba Hali', 'position_group'] = 'd_field'
-    df.loc[df.fullname == 'Mike Sellers', 'position_group'] = 'o_pass'
-    df.loc[df.fullname == 'Ben Utecht', 'position_group'] = 'o_pass'
-    df.loc[df.fullname == 'Casey Fitzsimmons', 'position_group'] = 'o_pass'
-    df.loc[df.fullname == 'Brad Cieslak', 'position_group'] = 'o_pass'
-    df.loc[df.fullname == 'Mathias Kiwanuka', 'position_group'] = 'd_line'
-    df.loc[df.fullname == 'Quentin Moses', 'position_group'] = 'd_field'
-    df.loc[df.fullname == 'Patrick Chukwurah', 'position_group'] = 'd_field'
-    df.loc[df.fullname == 'Ikaika Alama-Francis', 'position_group'] = 'd_field'
-    df.loc[df.fullname == 'Rob Ninkovich', 'position_group'] = 'd_field'
-    df.loc[df.fullname == 'Akbar Gbaja Biamila', 'position_group'] = 'd_line'
-    df.loc[df.fullname == 'B.J. Sams', 'position_group'] = 'o_rush'
-
-    df.loc[((df.fullname == 'Jim Kleinsasser')), 'fullname'] = 'Jimmy Kleinsasser'
-    df.loc[((df.fullname == 'Jimmy Kleinsasser')), 'position_group'] = 'o_pass'
-    df.loc[((df.fullname == 'Jimmy Kleinsasser')), 'position'] = 'TE'
-    df.loc[((df.fullname == 'Eric Beverly')), 'position_group'] = 'o_pass'
-    df.loc[((df.fullname == 'Michael Moore')), 'position_group'] = 'o_pass'
-
-    name_fixes = {
-        'Justin Madubuike': 'Nnamdi Madubuike',
-        'R.Webb': 'Richmond Webb',
-        'Ndukwe Kalu': 'ND Kalu',
-        'B.Cox': 'Byron Cox',
-        'H.Ford': 'Henry Ford',
-        'W.Walls': 'Wesley Walls',
-        'B.Stai': 'Brenden Stai',
-        'T.Fair': 'Terry Fair',
-        'D.Greer': 'Donovan Greer',
-        'G.Crowell': 'Germane Crowell',
-        'G.Brown': 'Gilbert Brown',
-        'T.Mathis': 'Terance Mathis',
-        'K.Lyle': 'Keith Lyle',
-        'I.Byrd': 'Isaac Byrd',
-        'R.Mealey': 'Rondell Mealey',
-        'A.Dorsett': 'Anthony Dorsett',
-        'K.Office': 'Kendrick Office',
-        'C.Peter': 'Christian Peter',
-        'J.Boyd': 'James Boyd',  ##
-        # 'RTate': 'Ray Tate',
-        # 'JRomero': 'Jesse Romero',
-        'D.Patmon': 'DeWayne Patmon',
-        'T.Sawyer': 'Talance Sawyer',
-        'R.Bean': 'Robert Bean',
-        'M.Fulcher': 'Mondriel Fulcher',
-        'O.J. Atogwe': 'Oshiomogho Atogwe',
-        'Michael Jennings': 'Mike Jennings',
-        'Akbar Gbaja Biamila': 'Akbar Gbaja-Biamila',
-    }
-    df['fullname'] = df['fullname'].replace(name_fixes)
+    # Career position normalizations and name spelling fixes (see madden_overrides.csv)
+    df, override_report = apply_overrides(df)
+    write_override_report(override_report, year)
+    print(f"{year}: {int((override_report.matched_rows > 0).sum())} of {len(override_report)} overrides matched {int(override_report.matched_rows.sum())} rows")
+    unmatched = override_report[override_report['season'].eq(year).fillna(False) & override_report['matched_rows'].eq(0)]
+    if not unmatched.empty:
+        print(f"{year}: overrides for this season matched no row: {unmatched[['fullname', 'team']].to_dict('records')}")
 
     df['madden_id'] = df['fullname'].apply(name_filter) + '_' + df['position_group'].astype(str)
     df['madden_id'] = df['madden_id'].str.upper()
@@ -344,6 +295,7 @@ def read_raw_madden_data(year):
         'yearspro',
         'age',
         'birthdate',
+        'ea_id',
     ]
     for col in madden_cols:
         if col not in df.columns:
@@ -556,14 +508,8 @@ def _stage_validation_set(frames):
 
 
 
-def make_stage_madden(load_seasons):
-    frames = {}
-    column_list = []
-    for season in load_seasons:
-        frame = stage_madden_season_data(season)
-        frames[season] = frame
-        column_list.extend(frame.team.values)
-    madden_counts = pd.Series(column_list).value_counts().to_dict()
+def make_stage_madden(load_seasons, workers=None):
+    frames = map_seasons(stage_madden_season_data, load_seasons, workers=workers)
     _stage_validation_set(frames)
     return frames
 
@@ -602,10 +548,10 @@ def normalize_madden_data(season, debug=False):
         wth['fullname'] = wth['fullname'].astype(str)
         wth['fullname'] = wth['fullname'].str.extract('(\d+)')
         wth = wth.rename(columns={"fullname":"jersey_number"})
+        roster_check = collect_roster(season)
         for _, row in wth.iterrows():
 
             ### Finish this out for fullname (jersey number) and team to determine actual name and add back into raw madden
-            roster_check = collect_roster(season)
             a = roster_check[((roster_check.jersey_number==row['jersey_number'])&(roster_check.position_group==row['position_group'])&(roster_check.team == row['team']))]
             print(a)
 
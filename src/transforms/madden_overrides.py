@@ -0,0 +1,144 @@
+"""
+Table driven player overrides for raw Madden rosters.
+
+Every override lives in `madden_overrides.csv`, one row per rule, with a header row and these columns:
+
+    fullname        match key, the fullname exactly as it appears in the raw roster (required)
+    season          match key, Madden season as an integer; blank matches every season
+    team            match key, team abbreviation as it appears in the raw roster; blank matches every team
+    new_fullname    fullname to set on matched rows; blank leaves the fullname untouched
+    position_group  position group to set on matched rows; blank leaves it untouched
+    position        position to set on matched rows; blank leaves it untouched
+    reason          free text for the reader, not used by the engine
+
+Two rules with the same fullname / season / team are rejected when the table is loaded, so row order in the file
+never decides an outcome. Rules are matched on the raw (pre-fix) fullname / season / team, also when a less specific
+rule renames the player. All rules sharing the same key columns are applied with a single merge against the roster,
+so adding rules does not add passes over the frame.
+
+Rules are applied in order of specificity and later rules overwrite the columns earlier ones set:
+
+    1. fullname
+    2. fullname + team
+    3. fullname + season
+    4. fullname + season + team
+
+so the most specific rule that sets a column wins for that column; a blank value never overwrites one set earlier.
+
+Every staged season writes the rows each rule matched to data/madden/reports/madden_overrides/{season}.csv;
+override_match_totals adds them up over the seasons, so a rule that stopped matching shows up with 0 rows.
+"""
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+from src.transforms.registry_report import REPORTS_DIR
+
+OVERRIDES_PATH = Path(__file__).resolve().parent / "madden_overrides.csv"
+OVERRIDE_REPORTS_DIR = REPORTS_DIR / "madden_overrides"
+
+KEY_COLUMNS = ['fullname', 'season', 'team']
+# Target column in the roster -> column in the override table
+SET_COLUMNS = {
+    'fullname': 'new_fullname',
+    'position_group': 'position_group',
+    'position': 'position',
+}
+
+
+@lru_cache(maxsize=None)
+def _read_overrides(path):
+    overrides = pd.read_csv(path, dtype=str, keep_default_na=False).replace('', None)
+    overrides['season'] = pd.to_numeric(overrides['season']).astype('Int64')
+    overrides['rule_id'] = range(len(overrides))
+
+    duplicated = overrides.duplicated(KEY_COLUMNS, keep=False)
+    if duplicated.any():
+        raise ValueError(f"Conflicting madden overrides for the same key:\n{overrides.loc[duplicated, KEY_COLUMNS]}")
+    return overrides
+
+
+def load_overrides(path=OVERRIDES_PATH):
+    """
+    Load the override table.
+
+    :param path: csv of override rules
+    :return: DataFrame with the key / set columns, a nullable int season and a positional rule_id
+    """
+    return _read_overrides(str(path)).copy()
+
+
+def apply_overrides(df, overrides=None):
+    """
+    Apply every override rule to a raw roster in one hash join per key specificity.
+
+    :param df: raw roster with fullname, season, team, position_group, position
+    :param overrides: override table (default: load_overrides())
+    :return: (df, report) where report is the override table with a `matched_rows` count per rule
+    """
+    if overrides is None:
+        overrides = load_overrides()
+    df = df.copy()
+    # Match keys before any rule renamed a player
+    raw_keys = df[KEY_COLUMNS].reset_index(drop=True)
+    raw_keys['season'] = raw_keys['season'].astype('Int64')
+    matched_rows = {}
+
+    # Least specific first so the more specific rules overwrite them: fullname, +team, +season, +season+team
+    by_specificity = overrides.groupby([overrides['season'].notna(), overrides['team'].notna()], sort=True)
+    for (has_season, has_team), rules in sorted(by_specificity, key=lambda item: sum(item[0])):
+        keys = ['fullname'] + (['season'] if has_season else []) + (['team'] if has_team else [])
+        left = raw_keys[keys].copy()
+        left['_row'] = range(len(left))
+        hits = left.merge(rules[keys + list(SET_COLUMNS.values()) + ['rule_id']], on=keys, how='inner')
+        if hits.empty:
+            continue
+        matched_rows.update(hits['rule_id'].value_counts().to_dict())
+        for target, source in SET_COLUMNS.items():
+            values = hits.loc[hits[source].notna(), ['_row', source]]
+            if not values.empty:
+                df.iloc[values['_row'].values, df.columns.get_loc(target)] = values[source].values
+
+    report = overrides.assign(matched_rows=overrides['rule_id'].map(matched_rows).fillna(0).astype(int))
+    return df, report
+
+
+def write_override_report(report, season, root_path=OVERRIDE_REPORTS_DIR):
+    """
+    Persist the override report of one season's raw roster.
+
+    :param report: report of apply_overrides
+    :param season: season of the roster
+    :param root_path: report directory, one csv per season
+    :return: path written
+    """
+    path = Path(root_path) / f"{season}.csv"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report.drop(columns='rule_id').to_csv(path, index=False)
+    return path
+
+
+def override_match_totals(root_path=OVERRIDE_REPORTS_DIR):
+    """
+    Rows every override rule matched over all seasons with a written report.
+
+    :param root_path: report directory of write_override_report
+    :return: DataFrame with the key columns, matched_rows (sum) and seasons (seasons the rule matched in), or None if
+        no season has a report
+    """
+    paths = sorted(Path(root_path).glob("*.csv"))
+    if not paths:
+        return None
+    reports = pd.concat(
+        [pd.read_csv(path, dtype={'fullname': str, 'team': str}).assign(report_season=int(path.stem)) for path in paths],
+        ignore_index=True
+    )
+    reports['season'] = reports['season'].astype('Int64')
+    reports['matched_season'] = reports['report_season'].where(reports['matched_rows'] > 0)
+    return (
+        reports.groupby(KEY_COLUMNS, dropna=False, sort=False)
+            .agg(matched_rows=('matched_rows', 'sum'),
+                 seasons=('matched_season', lambda seasons: sorted(int(season) for season in seasons.dropna())))
+            .reset_index()
+    )
@@ -1,17 +1,25 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-from nfl_data_loader.api.sources.players.rosters.rosters import collect_roster
 from nfl_data_loader.utils.utils import find_year_for_season
-from nfl_data_loader.workflows.transforms.players.player import get_static_players, apply_rookie_av
 
 from rapidfuzz import process, fuzz
 
 # ---------------------------------------------------------------
 # NFL season–start lookup  (you already built it earlier)
 # ---------------------------------------------------------------
-from src.extracts.madden import get_approximate_value
-from src.transforms.madden import read_stage_madden_data
+from src.extracts.nflverse import collect_rosters, get_static_players
+from src.pipeline.executor import resolve_workers
+from src.store.approximate_value import ApproximateValueStore
+from src.store.identity_store import write_identity_store
+from src.store.madden_store import compact_frame, read_madden_layer
+from src.transforms.madden import ea_export_seasons
+from src.transforms.name_index import NameIndex, name_tokens
+from src.transforms.registry_report import CascadeReport, new_score_stats
 
 NFL_SEASON_OPENERS = {
     2000: "2000-09-03", 2001: "2001-09-09", 2002: "2002-09-05", 2003: "2003-09-04",
@@ -82,32 +90,111 @@ MADDEN_ATTRIBUTES = [
         'return',
     ]
 
+# Columns of every match frame produced by the registry cascade
+MATCH_COLUMNS = ["madden_id", "overallrating", "player_id"]
+# Name score needed to tie a never matched Madden player to an nflverse player of another season
+CROSS_SEASON_THRESHOLD = 90
+
 MADDEN_DIR = (Path(__file__).resolve()          # /project_root/src/my_module.py
               .parents[2]                       # /project_root/
               / "data" / "madden")     # /project_root/data/madden/raw
 
+# Season level madden_id -> player_id matches of the last registry build, tagged with the cascade stage that made them
+REGISTRY_MATCHES_PATH = MADDEN_DIR / "registry" / "matches.parquet"
+
+def read_registry_matches(path=REGISTRY_MATCHES_PATH):
+    if not os.path.exists(path):
+        return pd.DataFrame({
+            "season": pd.Series(dtype="int16"), "madden_id": pd.Series(dtype=object), "overallrating": pd.Series(dtype="float64"),
+            "player_id": pd.Series(dtype=object), "stage": pd.Series(dtype=object),
+        })
+    return pd.read_parquet(path)
+
+def write_registry_matches(matches, path=REGISTRY_MATCHES_PATH):
+    os.makedirs(Path(path).parent, exist_ok=True)
+    matches = matches.astype({"season": "int16", "overallrating": "float64"})
+    matches[["season"] + MATCH_COLUMNS + ["stage"]].to_parquet(path, index=False)
+
 def read_processed_madden_data(year):
-    return pd.read_csv(f'{MADDEN_DIR}/processed/{year}.csv')
+    return read_madden_layer('processed', seasons=[year])
 
 def read_missed_madden_data():
     return pd.read_csv(f'{MADDEN_DIR}/missed/missed.csv')
 # ---------------------------------------------------------------
 # helper → age on season opener
 # ---------------------------------------------------------------
-def _age_on_season_start(birthdate: pd.Timestamp, season: int):
-    if pd.isna(birthdate) or season not in NFL_SEASON_OPENERS:
-        return pd.NA
-    start = pd.to_datetime(NFL_SEASON_OPENERS[season])
-    return int((start - birthdate.normalize()).days // 365)
+# Rookie last_season_av estimate by overall draft pick, the rest of the draft is valued by round
+ROOKIE_PICK_AV = {1: 12, 2: 11, 3: 10.5, 4: 9, 5: 8.5}
+
+SEASON_OPENER_DATES = {season: pd.Timestamp(date) for season, date in NFL_SEASON_OPENERS.items()}
+
+def _age_on_season_start(birthdates: pd.Series, seasons: pd.Series) -> pd.Series:
+    """Whole years between birthdate and the season opener per row, NaN without a birthdate or a known opener."""
+    openers = pd.to_datetime(seasons.map(SEASON_OPENER_DATES))
+    days = (openers - pd.to_datetime(birthdates).dt.normalize()).dt.days
+    return days // 365
+
+def _rookie_av(draft_round, draft_pick):
+    """
+    Vectorized nfl_data_loader apply_rookie_av: fixed estimates for the first five picks, (9 - draft_round) / 2 after.
+    """
+    return draft_pick.map(ROOKIE_PICK_AV).fillna((9 - draft_round) * 0.5)
+
+def _attach_last_season_av(registry, av_store):
+    """
+    Add last_season_av (PFR approximate value of the previous season) to every player season in one merge on
+    (pfr_id, season). Rookies get the draft based estimate instead; undrafted rookies count as round 8 and one pick
+    after the last rookie picked that season.
+
+    :param registry: player season rows with pfr_id, season, rookie_season, yearspro, draft_round, draft_pick
+    :param av_store: ApproximateValueStore
+    :return: registry with is_rookie and last_season_av, non-rookies before rookies within each season
+    """
+    df = registry.copy()
+    df['is_rookie'] = (df['rookie_season'] == df['season']) & (df['yearspro'] == 0)
+
+    season_order = df['season'].unique()
+    av_df = av_store.for_seasons([season - 1 for season in season_order])[[
+        'player_id',
+        'season',
+        'approximate_value'
+    ]].rename(columns={'player_id': 'pfr_id', 'approximate_value': 'last_season_av'})
+    av_df['season'] = av_df['season'] + 1
+    df = df.merge(av_df, on=['pfr_id', 'season'], how='left')
+
+    rookies = df['is_rookie']
+    last_pick = df[rookies].groupby('season')['draft_pick'].max()
+    df.loc[rookies, 'draft_round'] = df.loc[rookies, 'draft_round'].fillna(8)
+    df.loc[rookies, 'draft_pick'] = df.loc[rookies, 'draft_pick'].fillna(df.loc[rookies, 'season'].map(last_pick) + 1)
+    df.loc[rookies, 'last_season_av'] = _rookie_av(df.loc[rookies, 'draft_round'], df.loc[rookies, 'draft_pick'])
+
+    # Seasons in registry order, non-rookies first, first row per player (players traded mid season have one AV row per team)
+    df['_season_order'] = df['season'].map({season: i for i, season in enumerate(season_order)})
+    df = df.sort_values(['_season_order', 'is_rookie'], kind='mergesort')
+    return df.drop_duplicates(['season', 'player_id'], keep='first').drop(columns=['_season_order']).reset_index(drop=True)
+
+def _first_mode(df, key, value):
+    """
+    Most common `value` per `key`, ties going to the smallest value (same as groupby().agg(lambda s: s.mode().iloc[0])).
+
+    :return: Series indexed by key, sorted by key
+    """
+    counts = df.groupby([key, value]).size().rename("n").reset_index()
+    counts = counts.sort_values([key, "n", value], ascending=[True, False, True], kind="mergesort")
+    return counts.drop_duplicates(key).set_index(key)[value]
 
 
 class MaddenRegistry:
-    def __init__(self):
-        self.base_ratings = pd.concat([read_stage_madden_data(season) for season in list(range(2001, find_year_for_season() + 1))])
+    def __init__(self, fuzzy_workers=-1):
+        # Threads used by rapidfuzz to score a match block, -1 uses every core
+        self.fuzzy_workers = fuzzy_workers
+        self.base_ratings = read_madden_layer('stage', seasons=list(range(2001, find_year_for_season() + 1)))
         self.base_ratings = self.base_ratings.sort_values(by=['madden_id', 'season'], ascending=[True, False]).drop_duplicates(subset=['madden_id', 'season'], keep='first').copy()
         self.base_ratings = self.base_ratings[self.base_ratings['fullname'].notna()].copy()
+        # The matching cascade builds strings out of the label columns, so it works on a plain (object) copy
         self.staged_madden_ratings = self.base_ratings[['madden_id', 'season', 'fullname', 'team', 'high_pos_group', 'position_group', 'position', 'jerseynumber', 'yearspro', 'age', 'birthdate', 'overallrating']].copy()
-        self.nflverse_player_rosters = pd.concat([collect_roster(season) for season in list(range(2001,find_year_for_season()+1))])
+        self.base_ratings = compact_frame(self.base_ratings, 'base_ratings')
+        self.nflverse_player_rosters = collect_rosters(list(range(2001,find_year_for_season()+1)))
         self.nflverse_player_rosters = self.nflverse_player_rosters.sort_values(by=['player_id', 'season'], ascending=[True, False]).rename(
             columns={
                 'birth_date': 'birthdate',
@@ -119,26 +206,125 @@ class MaddenRegistry:
         self.player_registry = None
         self.pre_season_registry = None
         self.missed = None
+        self.report = CascadeReport()
+        self._name_index = None
+
+    @classmethod
+    def for_matching(cls, name_index, fuzzy_workers=1):
+        """Registry that only runs the per-season cascade on frames it is handed (no stage / roster loads)."""
+        registry = cls.__new__(cls)
+        registry.fuzzy_workers = fuzzy_workers
+        registry.report = CascadeReport()
+        registry._name_index = name_index
+        return registry
+
+    @property
+    def name_index(self):
+        """NameIndex over every nflverse roster name, built on first use."""
+        if self._name_index is None:
+            self._name_index = NameIndex(self.nflverse_player_rosters)
+        return self._name_index
 
     def apply(self):
         self.apply_birthdate_pool()
         self.apply_age_pool()
         self.apply_madden_uid()
 
-    def mapper(self):
-        full_matches = []
+    def mapper(self, rematch_seasons=None, workers=None):
+        """
+        Match every staged season against nflverse, starting from the matches persisted by the previous run.
+
+        Seasons in `rematch_seasons`, seasons never matched before and the current season (its nflverse roster still
+        changes) go through the full cascade. In every other season only Madden rows whose madden_id is not mapped yet
+        are matched, against the nflverse players not already taken in that season. The combined matches are persisted
+        again for the next run.
+
+        Only the per-season cascade is persisted. A reused season gives the same matches and unmatched rows as a full
+        rematch as long as its staged Madden rows and nflverse roster did not change since its matches were written;
+        the cross season ties of match_across_seasons are not persisted and are recomputed from these results on every
+        build.
+
+        Seasons are independent once the frames are partitioned by season, so with more than one worker they are
+        matched concurrently in worker processes; the result is identical to the sequential run.
+
+        :param rematch_seasons: seasons to match from scratch (default: every season)
+        :param workers: processes matching seasons concurrently (see resolve_workers)
+        :return: (matches, unmatched)
+        """
+        seasons = list(range(find_year_for_season(), 2001 - 1, -1))
+        self.report = CascadeReport()
+        known = read_registry_matches()
+        # Drop matches whose Madden row is no longer staged (renamed / restaged players)
+        known = known.merge(self.staged_madden_ratings[["season", "madden_id"]].drop_duplicates(), on=["season", "madden_id"], how="inner")
+        rematch = set(seasons) if rematch_seasons is None else set(rematch_seasons) | (set(seasons) - set(known["season"])) | {seasons[0]}
+        known = known[~known["season"].isin(rematch)]
+        mapped_madden_ids = set(known["madden_id"])
+        if not known.empty:
+            print(f"Reusing {len(known)} registry matches; rematching seasons {sorted(rematch)}")
+
+        # Partition once instead of filtering both full frames for every season
+        madden_by_season = dict(list(self.staged_madden_ratings.groupby("season", sort=False)))
+        nfl_by_season = dict(list(self.nflverse_player_rosters.groupby("season", sort=False)))
+        jobs = []
+        for season in seasons:
+            skip_madden_ids, skip_player_ids = None, None
+            if season not in rematch:
+                skip_madden_ids = mapped_madden_ids
+                skip_player_ids = set(known.loc[known["season"] == season, "player_id"])
+            jobs.append((
+                season,
+                madden_by_season.get(season, self.staged_madden_ratings.iloc[:0]),
+                nfl_by_season.get(season, self.nflverse_player_rosters.iloc[:0]),
+                skip_madden_ids,
+                skip_player_ids,
+            ))
+
+        workers = min(resolve_workers(workers), len(jobs))
+        if workers <= 1:
+            results = [self._match_season_job(job) for job in jobs]
+        else:
+            print(f"Matching {len(jobs)} seasons over {workers} processes")
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_match_worker, initargs=(self.name_index,)) as pool:
+                results = list(pool.map(_match_season_worker, jobs))
+
+        full_matches = [known] if not known.empty else []
         full_unmatches = []
-        for season in list(range(find_year_for_season(), 2001 - 1, -1)):
-            matches, unmatched, nfl_unmapped = self.fuzzy_match_nflverse_to_madden(season)
-            full_matches.append(matches)
+        for season, (matches, unmatched, nfl_unmapped, report_records) in zip(seasons, results):
+            self.report.records.extend(report_records)
+            if season not in rematch:
+                season_known = known[known["season"] == season]
+                # Mapped through another season but unmatched in this one, exactly as a full rematch leaves them
+                staged = madden_by_season.get(season, self.staged_madden_ratings.iloc[:0])
+                carried = staged[staged["madden_id"].isin(mapped_madden_ids) & ~staged["madden_id"].isin(season_known["madden_id"])]
+                unmatched = pd.concat([unmatched, carried])
+            full_matches.append(matches.assign(season=season))
             full_unmatches.append(unmatched)
-        return pd.concat(full_matches), pd.concat(full_unmatches)
+        full_matches = pd.concat(full_matches, ignore_index=True)
+        write_registry_matches(full_matches)
+        return full_matches, pd.concat(full_unmatches)
+
+    def _match_season_job(self, job):
+        """Run the cascade for one mapper job, returning its report records alongside the cascade output."""
+        season, madden_df, nfl_df, skip_madden_ids, skip_player_ids = job
+        first_record = len(self.report.records)
+        matches, unmatched, nfl_unmapped = self.fuzzy_match_nflverse_to_madden(
+            season,
+            skip_madden_ids=skip_madden_ids,
+            skip_player_ids=skip_player_ids,
+            madden_df=madden_df,
+            nfl_df=nfl_df,
+        )
+        records = self.report.records[first_record:]
+        del self.report.records[first_record:]
+        return matches, unmatched, nfl_unmapped, records
 
-    def define_registry(self):
+    def define_registry(self, rematch_seasons=None, workers=None):
         self.apply()
-        full_matches, full_unmatched = self.mapper()
+        full_matches, full_unmatched = self.mapper(rematch_seasons=rematch_seasons, workers=workers)
 
-        registry = full_matches.groupby("player_id")['madden_id'].agg(lambda s: s.mode().iloc[0]).reset_index().drop_duplicates(['madden_id'])
+        registry = _first_mode(full_matches, "player_id", "madden_id").reset_index().drop_duplicates(['madden_id'])
+        registry = pd.concat([registry, self.match_across_seasons(full_unmatched, registry).drop(columns=["stage"])])
+        self.report.write()
         MANUAL_MAPPER = {
             "DOMANICKDAVIS_o_rush": "00-0021979",
             "ANTHONYSIMMONS_d_lb": "00-0014889",
@@ -159,40 +345,43 @@ class MaddenRegistry:
         player_registry = registry.merge(registry_meta, how="left", on=["player_id"])
         self.player_registry = player_registry
         pre_season_player_registry_meta = self.nflverse_player_rosters.drop_duplicates(["player_id", 'season'])[["player_id", 'season', 'fullname', 'team', 'high_pos_group', 'position_group', 'position', 'jerseynumber', 'yearspro','birthdate']]
-        pre_season_player_registry_meta["age"] = pre_season_player_registry_meta.apply(lambda r: _age_on_season_start(pd.to_datetime(r.birthdate), r.season), axis=1)
+        pre_season_player_registry_meta["age"] = _age_on_season_start(pre_season_player_registry_meta["birthdate"], pre_season_player_registry_meta["season"])
         pre_season_registry = pre_season_player_registry_meta.merge(registry, on=['player_id'], how="left")
         pre_season_registry = pd.merge(pre_season_registry, get_static_players(), on='player_id', how='left')
 
-        registries = []
+        ## ADD (Previous Season) AWARDS, SEASON BASED HIGHLIGHTS HERE
+
         ### Add AV column to preseason registry
-        for season in pre_season_registry.season.unique():
-            #pre_season_registry_unmatched = pre_season_registry[pre_season_registry.madden_id.isnull()].copy()
-            #pre_season_registry_matched = pre_season_registry[pre_season_registry.madden_id.notnull()].copy()
-            df = pre_season_registry[pre_season_registry.season==season].copy()
-            df['is_rookie'] = (df['rookie_season'] == season) & (df.yearspro == 0)
-
-            ## ADD (Previous Season) AWARDS, SEASON BASED HIGHLIGHTS HERE
-
-            ### AV Extractor (Previous Season)
-            av_df = get_approximate_value(season - 1)[[
-                'player_id',
-                'approximate_value'
-            ]].rename(columns={'player_id': 'pfr_id', 'approximate_value': 'last_season_av'})
-            df = pd.merge(df, av_df, on='pfr_id', how='left')
-
-            rookie_approx_value_df = df[df['is_rookie'] == True].copy()
-            rookie_approx_value_df.draft_round = rookie_approx_value_df.draft_round.fillna(8)
-            rookie_approx_value_df.draft_pick = rookie_approx_value_df.draft_pick.fillna(rookie_approx_value_df.draft_pick.max() + 1)
-            rookie_approx_value_df = rookie_approx_value_df.apply(apply_rookie_av, axis=1)
-
-            df = df[df['is_rookie'] == False].copy()
-            df = pd.concat([df, rookie_approx_value_df], ignore_index=True).drop_duplicates(subset=['player_id'], keep='first')
-            registries.append(df)
-
-        self.pre_season_registry = pd.concat(registries,ignore_index=True)
+        self.pre_season_registry = _attach_last_season_av(pre_season_registry, ApproximateValueStore())
         self.pre_season_registry = pd.merge(self.pre_season_registry, self.base_ratings[['season', 'fullname', 'team', 'position_group','overallrating']+MADDEN_ATTRIBUTES], on=['season', 'fullname', 'team', 'position_group'], how='left')
+        self.pre_season_registry = compact_frame(self.pre_season_registry, 'pre_season_registry')
+        # Missed rows of a registered player who is not on that season's nflverse roster keep the player's identity
+        madden_to_player = registry.drop_duplicates('madden_id').set_index('madden_id')['player_id']
+        full_unmatched = full_unmatched.assign(player_id=full_unmatched['madden_id'].map(madden_to_player))
+        rostered = self.nflverse_player_rosters[['player_id', 'season']].drop_duplicates().assign(_on_roster=True)
+        on_roster = full_unmatched[['player_id', 'season']].merge(rostered, on=['player_id', 'season'], how='left')['_on_roster'].notna().to_numpy()
+        full_unmatched.loc[on_roster, 'player_id'] = np.nan
         self.missed = pd.merge(full_unmatched.copy().drop(columns=['overallrating','fullname_clean']), self.base_ratings[['season', 'fullname', 'team', 'position_group','overallrating']+MADDEN_ATTRIBUTES], on=['season', 'fullname', 'team', 'position_group'], how='left')
 
+    def identity_rows(self):
+        """
+        Player season rows of the identity store: every nflverse roster row of the registry plus the missed Madden
+        rows, with the EA id of the Madden row where the ratings came from the EA API.
+        """
+        keys = ['season', 'fullname', 'team', 'position_group']
+        ea_ids = self.base_ratings.loc[self.base_ratings['ea_id'].notna(), keys + ['ea_id']].drop_duplicates(keys)
+        rows = pd.concat([self.pre_season_registry, self.missed], ignore_index=True)
+        rows = rows.merge(ea_ids, on=keys, how='left')
+        # Every Madden rated row of an EA API season must carry its EA id (a stage built before ea_id was kept has none)
+        ea_seasons = ea_export_seasons(sorted(self.base_ratings['season'].unique()))
+        missing = rows['season'].isin(ea_seasons) & rows['overallrating'].notna() & rows['ea_id'].isna()
+        if missing.any():
+            raise ValueError(
+                f"{int(missing.sum())} Madden rated identity rows of EA API seasons {ea_seasons} have no ea_id, "
+                f"restage those seasons: {sorted(rows.loc[missing, 'season'].unique())}"
+            )
+        return rows
+
     def _madden_imputer(self):
         pass
         #### for each position_group determine how overallrating is calculated using a simple multivariate linear function. Leverage those weights to fill in / estimate
@@ -200,32 +389,147 @@ class MaddenRegistry:
         #### Once all attributes are filled in for the dataset we can take the pre_season_registry_matched and look to impute each position_group of the pre_season_registry_unmatched
         #### We can leverage AV as our rule of best fit for estimating a player, can also add in static stats like combine, draft, etc. Once these are all imputed and defined they should be a better set of data to pass to our rating system
 
-    def _compute_new_madden_id(self, row):
-        name = str(row['fullname']).strip().upper().replace(' ', '')
+    def _compute_new_madden_id(self, df):
+        """NAME_YYYYMMDD when the birthdate is known, NAME_position_group otherwise."""
+        name = df['fullname'].astype(str).str.strip().str.upper().str.replace(' ', '', regex=False)
+        bday = pd.to_datetime(df['birthdate']).dt.strftime("%Y%m%d")
+        return name + "_" + bday.where(df['birthdate'].notna(), df['position_group'].astype(str))
 
-        if pd.notna(row.get("birthdate")):
-            bday = pd.to_datetime(row["birthdate"]).strftime("%Y%m%d")
-            uid_input = f"{name}_{bday}"
-        else:
-            uid_input = f"{name}_{row['position_group']}"
-        return uid_input
-
-    def _fuzzy_match(self, name, pool, threshold):
-        if pool.empty:
-            return None
-        best = process.extractOne(
-            query=name,
-            choices=pool["fullname_clean"],
-            scorer=fuzz.token_sort_ratio
+    def _fuzzy_match_block(self, block, pool, threshold, score_stats=None):
+        """
+        Best fuzzy match in `pool` for every Madden row of `block`, scored as one cdist matrix.
+
+        Same result as running process.extractOne per row: token_sort_ratio, missing names skipped, the first pool row
+        with the highest score wins and it is kept when the score reaches `threshold`. Matches are resolved by position,
+        not by looking the matched name back up in the pool.
+
+        :param block: unmatched Madden rows (madden_id, overallrating, fullname_clean)
+        :param pool: candidate nflverse rows (player_id, fullname_clean)
+        :param threshold: minimum score to accept
+        :param score_stats: new_score_stats() accumulator for the run report
+        :return: DataFrame of madden_id, overallrating, player_id
+        """
+        choice_rows = np.flatnonzero(pool["fullname_clean"].notna().to_numpy())
+        block = block[block["fullname_clean"].notna()]
+        if block.empty or choice_rows.size == 0:
+            return pd.DataFrame(columns=MATCH_COLUMNS)
+
+        scores = process.cdist(
+            block["fullname_clean"].tolist(),
+            pool["fullname_clean"].iloc[choice_rows].tolist(),
+            scorer=fuzz.token_sort_ratio,
+            dtype=np.float64,
+            workers=self.fuzzy_workers,
         )
-        if best and best[1] >= threshold:
-            return pool.loc[pool["fullname_clean"] == best[0]].iloc[0]
-        return None
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(best)), best]
+        hit = best_scores >= threshold
+        if score_stats is not None:
+            score_stats["scores"].extend(best_scores.tolist())
+            score_stats["pairs"] += scores.size
+
+        found = block.loc[hit, ["madden_id", "overallrating"]].reset_index(drop=True)
+        found["player_id"] = pool["player_id"].iloc[choice_rows[best[hit]]].to_numpy()
+        return found[MATCH_COLUMNS]
+
+    def _fuzzy_match_candidates(self, block, pool, candidates, threshold, score_stats=None):
+        """
+        Fuzzy match every Madden row of `block` against the pool rows of its candidate players only.
+
+        Candidate rows are scored in pool order, so whenever the best pool row is among the candidates the result is
+        the same as scoring the whole pool.
+
+        :param candidates: per row of `block`, the candidate player_ids (NameIndex.candidates)
+        :return: DataFrame of madden_id, overallrating, player_id
+        """
+        pool_rows = pool.reset_index(drop=True).groupby("player_id").indices
+        pool_names = pool["fullname_clean"].astype(object).where(pool["fullname_clean"].notna(), None).to_numpy()
+        pool_players = pool["player_id"].to_numpy()
+
+        found = []
+        for row, player_ids in zip(block.itertuples(index=False), candidates):
+            positions = [pool_rows[player_id] for player_id in player_ids if player_id in pool_rows]
+            if pd.isna(row.fullname_clean) or not positions:
+                continue
+            positions = np.sort(np.concatenate(positions))
+            best = process.extractOne(row.fullname_clean, list(pool_names[positions]), scorer=fuzz.token_sort_ratio)
+            if score_stats is not None:
+                score_stats["pairs"] += len(positions)
+                if best:
+                    score_stats["scores"].append(best[1])
+            if best and best[1] >= threshold:
+                found.append((row.madden_id, row.overallrating, pool_players[positions[best[2]]]))
+        return pd.DataFrame(found, columns=MATCH_COLUMNS)
+
+    def match_across_seasons(self, unmatched, registry):
+        """
+        Tie Madden players that were never matched in any season to nflverse players from any season's roster.
+
+        The name index proposes candidates over every roster; a pair is accepted when the cleaned names score at least
+        CROSS_SEASON_THRESHOLD and the player is compatible (same birthdate when both are known, otherwise a shared
+        position group). Players already in the registry are not reassigned; every player is claimed once, best score
+        first.
+
+        :param unmatched: unmatched Madden rows of every season
+        :param registry: player_id / madden_id pairs from the per-season cascade
+        :return: DataFrame of player_id, madden_id, stage
+        """
+        started, score_stats = time.perf_counter(), new_score_stats()
+        queries = unmatched[~unmatched["madden_id"].isin(registry["madden_id"])].drop_duplicates("madden_id")
+        rosters = self.nflverse_player_rosters
+        player_birthdates = pd.to_datetime(rosters.dropna(subset=["birthdate"]).drop_duplicates("player_id").set_index("player_id")["birthdate"]).dt.strftime('%Y-%m-%d')
+        player_groups = rosters.dropna(subset=["position_group"]).groupby("player_id")["position_group"].agg(set)
+        player_names = self.name_index.players.groupby("player_id")["fullname"].agg(list)
+        taken = set(registry["player_id"])
+
+        proposals = []
+        candidates = self.name_index.candidates(queries["fullname"])
+        for row, player_ids in zip(queries.itertuples(index=False), candidates):
+            query = " ".join(name_tokens(row.fullname))
+            birthdate = pd.to_datetime(row.birthdate).strftime('%Y-%m-%d') if pd.notna(row.birthdate) else None
+            best_score = None
+            for player_id in player_ids:
+                if player_id in taken:
+                    continue
+                score = max(fuzz.token_sort_ratio(query, " ".join(name_tokens(name))) for name in player_names[player_id])
+                score_stats["pairs"] += 1
+                best_score = score if best_score is None else max(best_score, score)
+                if score < CROSS_SEASON_THRESHOLD:
+                    continue
+                known_birthdate = player_birthdates.get(player_id)
+                if birthdate is not None and known_birthdate is not None:
+                    compatible = birthdate == known_birthdate
+                else:
+                    compatible = row.position_group in player_groups.get(player_id, set())
+                if compatible:
+                    proposals.append((score, row.madden_id, player_id))
+            if best_score is not None:
+                score_stats["scores"].append(best_score)
+
+        recovered = []
+        claimed_madden, claimed_players = set(), set()
+        for score, madden_id, player_id in sorted(proposals, key=lambda p: -p[0]):
+            if madden_id in claimed_madden or player_id in claimed_players:
+                continue
+            claimed_madden.add(madden_id)
+            claimed_players.add(player_id)
+            recovered.append((player_id, madden_id))
+        print(f"Cross season matching recovered {len(recovered)} of {len(queries)} never matched madden players")
+        self.report.add(None, "cross_season", started, len(queries), len(recovered), len(self.name_index.players), score_stats)
+        return pd.DataFrame(recovered, columns=["player_id", "madden_id"]).assign(stage="cross_season")
+
+    def _fuzzy_match_blocks(self, unmatched, pool, by, threshold, score_stats=None):
+        """Fuzzy match blocked on `by`: every Madden row only competes against pool rows with the same `by` value."""
+        blocks = [
+            self._fuzzy_match_block(group, pool[pool[by] == key], threshold, score_stats)
+            for key, group in unmatched.groupby(by)
+        ]
+        return pd.concat(blocks) if blocks else pd.DataFrame(columns=MATCH_COLUMNS)
 
     def apply_madden_uid(self):
         print("Applying new madden id map")
-        self.staged_madden_ratings['madden_id'] = self.staged_madden_ratings.apply(self._compute_new_madden_id, axis=1)
-        self.base_ratings['madden_id'] = self.base_ratings.apply(self._compute_new_madden_id, axis=1)
+        self.staged_madden_ratings['madden_id'] = self._compute_new_madden_id(self.staged_madden_ratings)
+        self.base_ratings['madden_id'] = self._compute_new_madden_id(self.base_ratings)
 
     def apply_birthdate_pool(self):
         print("Applying birthdate pool")
@@ -233,11 +537,8 @@ class MaddenRegistry:
         birthdate_pool = stage[stage['birthdate'].notna()].copy()
         birthdate_pool['birthdate'] = pd.to_datetime(birthdate_pool['birthdate'], format='mixed')
         birthdate_pool['birthdate'] = birthdate_pool['birthdate'].dt.strftime('%Y-%m-%d')
-        # choose the modal (most common) date for each id ---------------
-        pool = (
-            birthdate_pool.groupby("madden_id")["birthdate"]
-                .agg(lambda s: s.mode().iloc[0])  # mode() always sorted ⇒ .iloc[0] OK
-        )
+        # choose the modal (most common) date for each id, earliest date on ties
+        pool = _first_mode(birthdate_pool, "madden_id", "birthdate")
 
         # fill ONLY the NaNs: keep original non-null dates untouched ----
         self.staged_madden_ratings["birthdate"] = (
@@ -257,53 +558,46 @@ class MaddenRegistry:
 
         # Step 1: Use birthdate to fill age
         stage["birthdate"] = pd.to_datetime(stage["birthdate"], errors='coerce')
-        missing_age_with_birthdate = stage['age'].isna() & stage['birthdate'].notna()
-
-        stage.loc[missing_age_with_birthdate, 'age'] = stage.loc[missing_age_with_birthdate].apply(
-            lambda row: _age_on_season_start(row.birthdate, row.season),
-            axis=1
-        )
+        stage['age'] = pd.to_numeric(stage['age'], errors='coerce')
+        stage['age'] = stage['age'].fillna(_age_on_season_start(stage['birthdate'], stage['season']))
 
-        # Step 2: Use known age + season delta
+        # Step 2: Use known age + season delta (earliest season with a known age per id)
         known_ages = (
             stage[stage['age'].notna()]
                 .sort_values('season')
                 .groupby('madden_id')[['season', 'age']]
                 .first()
-                .reset_index()
         )
-        age_lookup = {
-            row['madden_id']: (row['season'], row['age'])
-            for _, row in known_ages.iterrows()
-        }
-
-        def infer_age_from_known(row):
-            if pd.notna(row['age']):
-                return row['age']
-            data = age_lookup.get(row['madden_id'])
-            if not data:
-                return pd.NA
-            known_season, known_age = data
-            return known_age + (row['season'] - known_season)
-
-        stage['age'] = stage.apply(infer_age_from_known, axis=1)
+        known_season = stage['madden_id'].map(known_ages['season'])
+        known_age = stage['madden_id'].map(known_ages['age'])
+        stage['age'] = stage['age'].fillna(known_age + (stage['season'] - known_season))
 
         # Final clean-up
         stage['age'] = pd.to_numeric(stage['age'], errors='coerce').astype('Int64')
         self.staged_madden_ratings['age'] = stage['age']
 
 
-    def fuzzy_match_nflverse_to_madden(self, season):
+    def fuzzy_match_nflverse_to_madden(self, season, skip_madden_ids=None, skip_player_ids=None, madden_df=None, nfl_df=None):
         """
-
-        :param season:
-        :return:
+        Run the matching cascade (exact name -> jersey -> birthdate / age / yearspro fuzzy -> name -> fallback fuzzy)
+        for one season. Every match is tagged with the cascade `stage` it came from.
+
+        :param season: season to match
+        :param skip_madden_ids: Madden rows already mapped, left out of the cascade
+        :param skip_player_ids: nflverse players already taken this season, left out of the candidate pools
+        :param madden_df: staged Madden rows of the season (default: filtered from staged_madden_ratings)
+        :param nfl_df: nflverse roster rows of the season (default: filtered from nflverse_player_rosters)
+        :return: (matches, unmatched, nfl_unmapped)
         """
         print(f"Fuzzy matching for {season}")
 
         # ---------- Prep Data ----------
-        madden_df = self.staged_madden_ratings.query("season == @season").copy()
-        nfl_df = self.nflverse_player_rosters.query("season == @season").copy()
+        madden_df = (self.staged_madden_ratings.query("season == @season") if madden_df is None else madden_df).copy()
+        nfl_df = (self.nflverse_player_rosters.query("season == @season") if nfl_df is None else nfl_df).copy()
+        if skip_madden_ids:
+            madden_df = madden_df[~madden_df["madden_id"].isin(skip_madden_ids)].copy()
+        if skip_player_ids:
+            nfl_df = nfl_df[~nfl_df["player_id"].isin(skip_player_ids)].copy()
 
         def clean_name(s):
             return (
@@ -319,6 +613,7 @@ class MaddenRegistry:
 
         matched_rows = []
         unmatched = madden_df.copy()
+        started, rows_in = time.perf_counter(), len(unmatched)
 
         # ============================================================
         # 1. Exact match on season + position_group + fullname_clean
@@ -329,14 +624,16 @@ class MaddenRegistry:
             how="inner",
             suffixes=("", "_nfl")
         )
-        matched_rows.append(exact[["madden_id", "overallrating", "player_id"]])
+        matched_rows.append(exact[MATCH_COLUMNS].assign(stage="exact"))
         unmatched = unmatched[~unmatched["madden_id"].isin(exact["madden_id"])].copy()
+        self.report.add(season, "exact", started, rows_in, rows_in - len(unmatched), len(nfl_df))
         matches = pd.concat(matched_rows).drop_duplicates(["player_id", "madden_id"])
         nfl_unmapped = nfl_df[~nfl_df["player_id"].isin(matches["player_id"])].copy()
 
         # ============================================================
         # 2. Exact Jersey number + team + season + fullname_clean
         # ============================================================
+        started, rows_in = time.perf_counter(), len(unmatched)
         jmatch = unmatched[unmatched["jerseynumber"].notna()].copy()
         jmatch["jerseynumber"] = jmatch["jerseynumber"].astype(int).astype(str)
         j_candidates = nfl_unmapped[nfl_unmapped["jerseynumber"].notna()].copy()
@@ -348,96 +645,86 @@ class MaddenRegistry:
             how="inner",
             suffixes=("", "_nfl")
         )
-        matched_rows.append(jersey_matches[["madden_id", "overallrating", "player_id"]])
+        matched_rows.append(jersey_matches[MATCH_COLUMNS].assign(stage="jersey"))
         unmatched = unmatched[~unmatched["madden_id"].isin(jersey_matches["madden_id"])].copy()
+        self.report.add(season, "jersey", started, rows_in, rows_in - len(unmatched), len(j_candidates))
         matches = pd.concat(matched_rows).drop_duplicates(["player_id", "madden_id"])
         nfl_unmapped = nfl_df[~nfl_df["player_id"].isin(matches["player_id"])].copy()
 
         # ============================================================
         # 3. Birthdate + fuzzy name
         # ============================================================
+        started, rows_in, score_stats = time.perf_counter(), len(unmatched), new_score_stats()
         birth_pool = nfl_unmapped[nfl_unmapped["birthdate"].notna()].drop_duplicates("player_id").copy()
         birth_pool["birthdate"] = pd.to_datetime(birth_pool["birthdate"]).dt.strftime('%Y-%m-%d')
         unmatch_pool = unmatched[unmatched["birthdate"].notna()].copy()
         unmatch_pool["birthdate"] = pd.to_datetime(unmatch_pool["birthdate"]).dt.strftime('%Y-%m-%d')
 
-        bmatch = []
-        for bdate, group in unmatch_pool.groupby("birthdate"):
-            candidates = birth_pool[birth_pool["birthdate"] == bdate]
-            for _, row in group.iterrows():
-                match = self._fuzzy_match(row.fullname_clean, candidates, 80)
-                if match is not None:
-                    bmatch.append({"madden_id": row.madden_id, "overallrating": row.overallrating, "player_id": match.player_id})
-        matched_rows.append(pd.DataFrame(bmatch))
-        unmatched = unmatched[~unmatched["madden_id"].isin(pd.DataFrame(bmatch)["madden_id"])].copy()
+        bmatch = self._fuzzy_match_blocks(unmatch_pool, birth_pool, "birthdate", 80, score_stats)
+        matched_rows.append(bmatch.assign(stage="birthdate_fuzzy"))
+        unmatched = unmatched[~unmatched["madden_id"].isin(bmatch["madden_id"])].copy()
+        self.report.add(season, "birthdate_fuzzy", started, rows_in, rows_in - len(unmatched), len(birth_pool), score_stats)
         matches = pd.concat(matched_rows).drop_duplicates(["player_id", "madden_id"])
         nfl_unmapped = nfl_df[~nfl_df["player_id"].isin(matches["player_id"])].copy()
 
         # ============================================================
         # 4. Age + fuzzy name
         # ============================================================
+        started, rows_in, score_stats = time.perf_counter(), len(unmatched), new_score_stats()
         age_pool = nfl_unmapped[nfl_unmapped["birthdate"].notna()].copy()
-        age_pool["age"] = age_pool.apply(lambda r: _age_on_season_start(pd.to_datetime(r.birthdate), r.season), axis=1)
-
-        amatch = []
-        for age, group in unmatched[unmatched["age"].notna()].groupby("age"):
-            candidates = age_pool[age_pool["age"] == age]
-            for _, row in group.iterrows():
-                match = self._fuzzy_match(row.fullname_clean, candidates, 87)
-                if match is not None:
-                    amatch.append({"madden_id": row.madden_id, "overallrating": row.overallrating, "player_id": match.player_id})
-        matched_rows.append(pd.DataFrame(amatch))
-        unmatched = unmatched[~unmatched["madden_id"].isin(pd.DataFrame(amatch)["madden_id"])].copy()
+        age_pool["age"] = _age_on_season_start(age_pool["birthdate"], age_pool["season"])
+
+        amatch = self._fuzzy_match_blocks(unmatched[unmatched["age"].notna()], age_pool, "age", 87, score_stats)
+        matched_rows.append(amatch.assign(stage="age_fuzzy"))
+        unmatched = unmatched[~unmatched["madden_id"].isin(amatch["madden_id"])].copy()
+        self.report.add(season, "age_fuzzy", started, rows_in, rows_in - len(unmatched), len(age_pool), score_stats)
         matches = pd.concat(matched_rows).drop_duplicates(["player_id", "madden_id"])
         nfl_unmapped = nfl_df[~nfl_df["player_id"].isin(matches["player_id"])].copy()
 
         # ============================================================
         # 5. YearsPro + fuzzy name
         # ============================================================
-        yp_match = []
+        started, rows_in, score_stats = time.perf_counter(), len(unmatched), new_score_stats()
         yp_frame = unmatched[unmatched["yearspro"].notna()].copy()
         yp_frame['yearspro'] = yp_frame['yearspro'].astype(int).astype(str)
         if yp_frame.shape[0] !=0:
-            for yp, group in yp_frame.groupby("yearspro"):
-                candidates = nfl_unmapped[nfl_unmapped["yearspro"] == yp]
-                for _, row in group.iterrows():
-                    match = self._fuzzy_match(row.fullname_clean, candidates, 80)
-                    if match is not None:
-                        yp_match.append({"madden_id": row.madden_id, "overallrating": row.overallrating, "player_id": match.player_id})
-            yp_df = pd.DataFrame(yp_match)
+            yp_df = self._fuzzy_match_blocks(yp_frame, nfl_unmapped, "yearspro", 80, score_stats)
             if not yp_df.empty:
-                matched_rows.append(yp_df)
-                unmatched = unmatched[~unmatched["madden_id"].isin(pd.DataFrame(yp_match)["madden_id"])].copy()
+                matched_rows.append(yp_df.assign(stage="yearspro_fuzzy"))
+                unmatched = unmatched[~unmatched["madden_id"].isin(yp_df["madden_id"])].copy()
                 matches = pd.concat(matched_rows).drop_duplicates(["player_id", "madden_id"])
                 nfl_unmapped = nfl_df[~nfl_df["player_id"].isin(matches["player_id"])].copy()
+        self.report.add(season, "yearspro_fuzzy", started, rows_in, rows_in - len(unmatched), len(nfl_unmapped), score_stats)
 
         # ============================================================
         # 6. Exact match within same season on fullname_clean (At this point with the values left we can join straight on name most likely)
         # ============================================================
+        started, rows_in = time.perf_counter(), len(unmatched)
         same_season_match = unmatched.merge(
             nfl_unmapped,
             on=["season", "fullname_clean"],
             how="inner",
             suffixes=("", "_nfl")
-        )[["madden_id", "overallrating", "player_id"]]
+        )[MATCH_COLUMNS]
 
-        matched_rows.append(same_season_match)
+        matched_rows.append(same_season_match.assign(stage="season_name"))
         unmatched = unmatched[~unmatched["madden_id"].isin(same_season_match["madden_id"])].copy()
+        self.report.add(season, "season_name", started, rows_in, rows_in - len(unmatched), len(nfl_unmapped))
         matches = pd.concat(matched_rows).drop_duplicates(["player_id", "madden_id"])
         nfl_unmapped = nfl_df[~nfl_df["player_id"].isin(matches["player_id"])].copy()
 
         # ============================================================
         # 7. Final Fuzzy (fallback) - append position group
         # ============================================================
+        # Only the unmapped players the name index ranks as likely are scored for each name
+        started, rows_in, score_stats = time.perf_counter(), len(unmatched), new_score_stats()
+        candidates = self.name_index.candidates(unmatched['fullname'], player_ids=nfl_unmapped['player_id'])
         unmatched['fullname_clean'] = unmatched['fullname_clean'] + " " + unmatched['position_group']
         nfl_unmapped['fullname_clean'] = nfl_unmapped['fullname_clean'] + " " + nfl_unmapped['position_group']
-        final_match = []
-        for _, row in unmatched.iterrows():
-            match = self._fuzzy_match(row.fullname_clean, nfl_unmapped, 70)
-            if match is not None:
-                final_match.append({"madden_id": row.madden_id, "overallrating": row.overallrating, "player_id": match.player_id})
-        matched_rows.append(pd.DataFrame(final_match))
-        unmatched = unmatched[~unmatched["madden_id"].isin(pd.DataFrame(final_match)["madden_id"])].copy()
+        final_match = self._fuzzy_match_candidates(unmatched, nfl_unmapped, candidates, 70, score_stats)
+        matched_rows.append(final_match.assign(stage="fallback_fuzzy"))
+        unmatched = unmatched[~unmatched["madden_id"].isin(final_match["madden_id"])].copy()
+        self.report.add(season, "fallback_fuzzy", started, rows_in, rows_in - len(unmatched), len(nfl_unmapped), score_stats)
 
         # ============================================================
         # Final outputs
@@ -448,17 +735,32 @@ class MaddenRegistry:
 
         return matches, unmatched, nfl_unmapped
 
-def make_processed_madden(load_seasons):
+# Matching only registry of a mapper worker process, set up once per process by _init_match_worker
+_WORKER_REGISTRY = None
+
+
+def _init_match_worker(name_index):
+    global _WORKER_REGISTRY
+    # Seasons already run in parallel, a single scoring thread per process avoids oversubscribing the cores
+    _WORKER_REGISTRY = MaddenRegistry.for_matching(name_index, fuzzy_workers=1)
+
+
+def _match_season_worker(job):
+    return _WORKER_REGISTRY._match_season_job(job)
+
+
+def make_processed_madden(load_seasons, workers=None):
     frames = {}
     madden_registry = MaddenRegistry()
-    madden_registry.define_registry()
+    # Seasons being rebuilt are rematched from scratch, the rest only match Madden rows not mapped yet
+    madden_registry.define_registry(rematch_seasons=load_seasons, workers=workers)
     full_unmatched = madden_registry.missed
     #player_registry = madden_registry.player_registry
     pre_season_registry = madden_registry.pre_season_registry
     full_unmatched.to_csv(f'{MADDEN_DIR}/missed/missed.csv', index=False)
-    for season in pre_season_registry.season.unique():
-        frame = pre_season_registry[pre_season_registry.season==season].copy()
-        frames[season] = frame
+    write_identity_store(madden_registry.identity_rows())
+    for season, frame in pre_season_registry.groupby('season', sort=True):
+        frames[season] = frame.copy()
     return frames
 
 
@@ -0,0 +1,126 @@
+"""
+Candidate generation for player name matching.
+
+NameIndex is built once over every nflverse roster. Each player name is reduced to three kinds of keys: normalized
+name tokens, character trigrams and a phonetic (Soundex) key per token. The keys are stored as an IDF weighted sparse
+incidence matrix, so the candidates of a whole batch of query names come out of one sparse product: players sharing
+more (and rarer) keys with a query rank higher, and only the top few per query are handed to the fuzzy scorer.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+SOUNDEX_CODES = {c: code for code, letters in {'1': 'bfpv', '2': 'cgjkqsxz', '3': 'dt', '4': 'l', '5': 'mn', '6': 'r'}.items() for c in letters}
+
+# Weight of a shared whole token / phonetic key relative to one shared trigram
+TOKEN_WEIGHT = 2.0
+PHONETIC_WEIGHT = 2.0
+
+
+def name_tokens(name):
+    """Lowercase tokens without punctuation and generational suffixes ("D.J. Moore Jr." -> ['dj', 'moore'])."""
+    if not isinstance(name, str):
+        return []
+    name = re.sub(r"[.'`]", '', name.lower())
+    tokens = re.split(r'[^a-z0-9]+', name)
+    return [t for t in tokens if t and t not in NAME_SUFFIXES]
+
+
+def soundex(token):
+    """American Soundex code of one token ('robert' -> 'R163')."""
+    token = re.sub('[^a-z]', '', token.lower())
+    if not token:
+        return ''
+    code = token[0].upper()
+    last = SOUNDEX_CODES.get(token[0], '')
+    for c in token[1:]:
+        digit = SOUNDEX_CODES.get(c, '')
+        if digit and digit != last:
+            code += digit
+        if c not in 'hw':
+            last = digit
+    return (code + '000')[:4]
+
+
+def name_keys(name):
+    """Every index key of a name: tokens, trigrams of the joined name and phonetic keys."""
+    tokens = name_tokens(name)
+    joined = f" {' '.join(tokens)} "
+    keys = [f"t:{t}" for t in tokens]
+    keys += [f"g:{joined[i:i + 3]}" for i in range(len(joined) - 2)] if tokens else []
+    keys += [f"p:{soundex(t)}" for t in tokens if soundex(t)]
+    return keys
+
+
+def _key_weight(key):
+    return {'t': TOKEN_WEIGHT, 'p': PHONETIC_WEIGHT}.get(key[0], 1.0)
+
+
+class NameIndex:
+    """
+    Inverted index from name keys to nflverse players.
+
+    :param rosters: nflverse roster rows with player_id and fullname (any number of rows per player / season)
+    """
+
+    def __init__(self, rosters):
+        players = rosters[rosters['fullname'].notna()].drop_duplicates(['player_id', 'fullname'])
+        self.players = players[['player_id', 'fullname']].reset_index(drop=True)
+        self.vocabulary = {}
+        incidence = (self._incidence(self.players['fullname'], grow=True) > 0).astype(np.float32)
+        # keys x players weighted by inverse document frequency: sharing 'williams' says little, 'lafell' a lot
+        key_counts = np.asarray(incidence.sum(axis=0)).ravel()
+        idf = np.log1p(len(self.players) / np.maximum(key_counts, 1)).astype(np.float32)
+        self.matrix = (incidence @ sparse.diags(idf)).T.tocsr()
+
+    def _incidence(self, names, grow=False):
+        rows, cols, weights = [], [], []
+        for row, name in enumerate(names):
+            for key in set(name_keys(name)):
+                col = self.vocabulary.get(key)
+                if col is None:
+                    if not grow:
+                        continue
+                    col = self.vocabulary[key] = len(self.vocabulary)
+                rows.append(row)
+                cols.append(col)
+                weights.append(_key_weight(key))
+        shape = (len(names), len(self.vocabulary))
+        return sparse.csr_matrix((weights, (rows, cols)), shape=shape, dtype=np.float32)
+
+    def candidates(self, names, limit=50, player_ids=None, chunk_size=512):
+        """
+        Likely nflverse players for every query name.
+
+        :param names: query names
+        :param limit: maximum candidates per query
+        :param player_ids: restrict candidates to these players (e.g. the unmapped players of a season)
+        :param chunk_size: queries scored per sparse product
+        :return: list (one per query) of candidate player_id arrays, best first
+        """
+        names = list(names)
+        allowed = None
+        if player_ids is not None:
+            allowed = self.players['player_id'].isin(set(player_ids)).to_numpy()
+        player_column = self.players['player_id'].to_numpy()
+
+        out = []
+        for start in range(0, len(names), chunk_size):
+            chunk = self._incidence(names[start:start + chunk_size])
+            scores = (chunk @ self.matrix).toarray()
+            if allowed is not None:
+                scores[:, ~allowed] = 0
+            k = min(limit, scores.shape[1])
+            if k == 0:
+                out.extend(np.array([], dtype=object) for _ in range(chunk.shape[0]))
+                continue
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            # best first, ties in index order so results do not depend on the partition
+            top = np.take_along_axis(top, np.lexsort((top, -np.take_along_axis(scores, top, axis=1)), axis=1), axis=1)
+            for row, cols in enumerate(top):
+                cols = cols[scores[row, cols] > 0]
+                out.append(pd.unique(player_column[cols]))
+        return out
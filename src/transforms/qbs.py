@@ -1,5 +1,5 @@
 import pandas as pd
-from nfl_data_loader.api.sources.players.boxscores.boxscores import collect_weekly_espn_player_stats
+from src.extracts.nflverse import collect_weekly_espn_player_stats
 
 
 def calculate_raw_passer_value(df):
@@ -0,0 +1,87 @@
+"""
+Run report for the registry matching cascade.
+
+Every (season, stage) of MaddenRegistry.fuzzy_match_nflverse_to_madden adds one record: wall time, Madden rows going
+in, matches made, candidate pool rows, query x candidate pairs scored and, for fuzzy stages, a histogram of the best
+score of every query. The report is written as JSON to data/madden/reports/ after each registry build, so the cost and
+yield of each stage can be compared across runs and Madden releases.
+"""
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPORTS_DIR = (Path(__file__).resolve()          # /project_root/src/transforms/registry_report.py
+               .parents[2]                       # /project_root/
+               / "data" / "madden" / "reports")
+
+SCORE_BINS = list(range(0, 101, 10))
+
+
+def new_score_stats():
+    """Accumulator handed to the fuzzy scorers: best score per query and number of pairs scored."""
+    return {"scores": [], "pairs": 0}
+
+
+class CascadeReport:
+    def __init__(self):
+        self.records = []
+        self.started_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+    def add(self, season, stage, started, rows_in, matches, pool_rows, score_stats=None):
+        """
+        Record one stage of one season.
+
+        :param started: time.perf_counter() at the start of the stage
+        :param rows_in: unmatched Madden rows entering the stage
+        :param matches: matches produced by the stage
+        :param pool_rows: nflverse rows available to the stage
+        :param score_stats: new_score_stats() filled by a fuzzy stage (None for exact joins)
+        """
+        record = {
+            "season": None if season is None else int(season),
+            "stage": stage,
+            "seconds": round(time.perf_counter() - started, 4),
+            "rows_in": int(rows_in),
+            "matches": int(matches),
+            "pool_rows": int(pool_rows),
+            "pairs_scored": None,
+            "score_histogram": None,
+        }
+        if score_stats is not None:
+            record["pairs_scored"] = int(score_stats["pairs"])
+            record["score_histogram"] = np.histogram(score_stats["scores"], bins=SCORE_BINS)[0].tolist()
+        self.records.append(record)
+
+    def to_frame(self):
+        return pd.DataFrame(self.records)
+
+    def summary(self):
+        """Totals per stage over every season, slowest stage first."""
+        df = self.to_frame()
+        if df.empty:
+            return df
+        return (
+            df.groupby("stage", sort=False)[["seconds", "rows_in", "matches", "pool_rows", "pairs_scored"]]
+                .sum(min_count=1)
+                .sort_values("seconds", ascending=False)
+        )
+
+    def write(self, path=None):
+        path = Path(path or REPORTS_DIR / "registry_cascade.json")
+        os.makedirs(path.parent, exist_ok=True)
+        report = {
+            "started_at": self.started_at,
+            "finished_at": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "score_bins": SCORE_BINS,
+            "records": self.records,
+        }
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=1)
+        print(f"Registry cascade report written to {path}")
+        print(self.summary().to_string())
+        return path
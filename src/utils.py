@@ -0,0 +1,60 @@
+import os
+import random
+import threading
+import time
+
+from nfl_data_loader.utils.utils import find_year_for_season  # noqa: F401  (re-exported for src.extracts)
+
+from src.extracts.http_cache import DAY, cached_get
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket enforcing a requests-per-minute budget.
+
+    Tokens refill continuously at `requests_per_minute / 60` per second up to `burst`. `acquire` blocks until a token
+    is available, so any number of workers sharing one bucket stay within the budget without blind sleeps.
+    """
+
+    def __init__(self, requests_per_minute, burst=1):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# PFR blocks clients above ~20 requests/minute; stay well under it by default
+PFR_REQUESTS_PER_MINUTE = float(os.environ.get('PFR_REQUESTS_PER_MINUTE', 10))
+
+
+def _polite_sleep():
+    rand_int_sleep = random.randint(1, 8)
+    rand_float_sleep = round(random.random(), 2)
+    print(f"Schleeping for {rand_int_sleep + rand_float_sleep}")
+    time.sleep(rand_int_sleep + rand_float_sleep)
+
+
+def pfr_request(url, session=None, ttl=DAY, limiter=None):
+    """
+    PFR requests will require a session to avoid rate limiting.
+    Be polite to their server: network requests wait on the shared `limiter` (a TokenBucket) or, without one, a
+    random sleep. Nothing waits when the page is served from the http cache.
+    """
+    if session:
+        r = cached_get(url, session=session, ttl=ttl, before_request=limiter.acquire if limiter else _polite_sleep)
+    else:
+        raise Exception('No session passed. PFR requests will require a session to avoid rate limiting.')
+    return r
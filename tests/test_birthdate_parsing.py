@@ -0,0 +1,43 @@
+"""
+Vectorized birthdate parsing against the original row-wise parsers (benchmarks.birthdate_parsing).
+"""
+import pandas as pd
+import pytest
+
+from benchmarks.birthdate_parsing import _legacy_cells, _legacy_day_month_year, _read_raw_columns, check_edge_cases
+from src.transforms.madden import _parse_birthdate_cells, _parse_day_month_year
+
+
+def _assert_same(expected, actual):
+    pd.testing.assert_series_equal(actual, expected.astype('datetime64[ns]'), check_names=False)
+
+
+def test_edge_cases():
+    check_edge_cases()
+
+
+def test_mixed_cells_match_row_wise_parser():
+    cells = pd.Series(['32589', '123199', '1299', '022930', '7/4/96', '1988-05-14 00:00:00', 'garbage', None, '1234567', 81599,
+                       '0229', '11590', 'Feb 3 1990', '', '000000'])
+    _assert_same(_legacy_cells(cells), _parse_birthdate_cells(cells))
+
+
+def test_day_month_year_matches_row_wise_parser():
+    dmy = pd.DataFrame({
+        'birthday': [23.0, '5', 31, 30, None, 1.9, 12, 29, 29, '0', 15],
+        'birthmonth': ['July', 'jul', 'Feb', 13, 'March', '3.000', 'nan', 'February', 2, 'Jan', ' OCT '],
+        'birthyear': [1976.0, '1980', 1990, 1990, 1985, 1991.0, 1999, 1992, 1993, 1990, '1987.0'],
+    })
+    _assert_same(_legacy_day_month_year(dmy), _parse_day_month_year(dmy['birthday'], dmy['birthmonth'], dmy['birthyear']))
+
+
+@pytest.mark.parametrize('season', [2010, 2018, 2019])
+def test_raw_season_sample_matches_row_wise_parser(season):
+    try:
+        df = _read_raw_columns(season).head(300)
+    except FileNotFoundError:
+        pytest.skip(f'raw Madden {season} not on disk')
+    if 'birthday' in df.columns:
+        _assert_same(_legacy_day_month_year(df), _parse_day_month_year(df['birthday'], df['birthmonth'], df['birthyear']))
+    else:
+        _assert_same(_legacy_cells(df['birthdate']), _parse_birthdate_cells(df['birthdate']))
@@ -0,0 +1,48 @@
+"""
+Concurrent paging of the EA ratings API against a fake listing.
+"""
+import pytest
+import requests
+
+from src.extracts.ea_api import MaddenRatingsClient
+
+
+def _client(items, total_items=None):
+    """Client whose player pages are slices of `items`; the first page reports `total_items`."""
+    client = MaddenRatingsClient()
+
+    def players_page(limit, iteration, offset, filters, extra_query):
+        page = {"items": [{"id": i} for i in items[offset:offset + limit]]}
+        if total_items is not None:
+            page["totalItems"] = total_items
+        return page
+
+    client._players_page = players_page
+    return client
+
+
+@pytest.mark.parametrize("total_items", [None, 23])
+def test_fetch_all_players_matches_the_listing(total_items):
+    players = _client(list(range(23)), total_items).fetch_all_players(limit=5, max_concurrency=3)
+    assert [p.id for p in players] == list(range(23))
+
+
+def test_fetch_all_players_pages_past_a_stale_total():
+    players = _client(list(range(23)), total_items=12).fetch_all_players(limit=5, max_concurrency=3)
+    assert [p.id for p in players] == list(range(23))
+
+
+def test_fetch_all_players_raises_when_short_of_the_total():
+    with pytest.raises(RuntimeError):
+        _client(list(range(23)), total_items=30).fetch_all_players(limit=5, max_concurrency=3)
+
+
+def test_count_is_not_a_total():
+    assert MaddenRatingsClient._total_from_payload({"count": 5, "items": []}) is None
+
+
+def test_caller_session_keeps_its_adapters():
+    session = requests.Session()
+    adapter = session.get_adapter("https://example.com")
+    MaddenRatingsClient(session=session)
+    assert session.get_adapter("https://example.com") is adapter
@@ -0,0 +1,50 @@
+"""
+Identity rows of the registry carry EA ids for EA API seasons, and the identity store resolves them.
+"""
+import pandas as pd
+import pytest
+
+from src.store.identity_store import IdentityStore, write_identity_store
+from src.store.madden_store import read_madden_layer
+from src.transforms.madden import ea_export_seasons
+from src.transforms.madden_registry import MaddenRegistry
+
+KEYS = ['season', 'fullname', 'team', 'position_group']
+
+
+def _registry(base_ratings):
+    """Registry whose every Madden row is matched to a made up nflverse player."""
+    registry = MaddenRegistry.__new__(MaddenRegistry)
+    registry.base_ratings = base_ratings
+    rated = base_ratings[KEYS + ['madden_id', 'overallrating', 'jerseynumber', 'birthdate']].copy()
+    registry.pre_season_registry = rated.assign(player_id=[f'00-{i:07d}' for i in range(len(rated))], pfr_id=None)
+    registry.missed = rated.iloc[:0].assign(player_id=None, pfr_id=None)
+    return registry
+
+
+@pytest.fixture
+def ea_stage():
+    seasons = ea_export_seasons(range(2001, 2026))
+    if not seasons:
+        pytest.skip('no EA API raw export on disk')
+    return read_madden_layer('stage', seasons=seasons[-1:])
+
+
+def test_stage_of_ea_seasons_keeps_ea_id(ea_stage):
+    assert ea_stage['ea_id'].notna().all()
+
+
+def test_identity_rows_of_ea_seasons_have_ea_id(ea_stage, tmp_path):
+    rows = _registry(ea_stage).identity_rows()
+    assert rows['ea_id'].notna().all()
+
+    write_identity_store(rows, tmp_path / 'identity.sqlite')
+    row = rows.iloc[0]
+    with IdentityStore(tmp_path / 'identity.sqlite') as store:
+        resolved = store.resolve('ea_id', row['ea_id'])
+    assert resolved['player_id'] == [row['player_id']]
+
+
+def test_identity_rows_reject_a_stage_without_ea_id(ea_stage):
+    with pytest.raises(ValueError):
+        _registry(ea_stage.assign(ea_id=None)).identity_rows()
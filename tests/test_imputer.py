@@ -0,0 +1,165 @@
+"""
+Dataset imputation on small synthetic position groups.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+from nfl_data_loader.schemas.players.madden import GENERAL_ATTRIBUTES, MADDEN_ATTRIBUTE_MAP, META
+
+from src.modeling import imputer
+from src.modeling.imputer import STYLE_ATTRIBUTES, MaddenImputationRunner, _impute_group_worker
+from src.modeling.imputer_backends import DEFAULT_MAX_ITER, DEFAULT_TOL
+from src.modeling.imputer_report import ImputationReport, adaptive_settings, read_imputation_report
+
+ATTRIBUTES = list(MADDEN_ATTRIBUTE_MAP)
+# Attributes Madden only started rating in later releases
+LATE_ATTRIBUTES = ['playrecognition', 'throwonrun', 'stiffarm', 'spinmove', 'jukemove', 'release', 'press']
+
+
+def synthetic_group(position_group, rows=240, seed=0):
+    """Rows of one position group over 2001-2025 with the missing value pattern of the real data."""
+    rng = np.random.default_rng(seed)
+    seasons = rng.integers(2001, 2026, size=rows)
+    skill = rng.normal(70, 10, size=rows)
+    df = pd.DataFrame({
+        'madden_id': [f'{position_group.upper()}{i:04d}' for i in range(rows)],
+        'fullname': [f'Player {i}' for i in range(rows)],
+        'position_group': position_group,
+        'player_id': [f'00-{i:07d}' for i in range(rows)],
+    })
+    for col in GENERAL_ATTRIBUTES:
+        df[col] = rng.normal(10, 3, size=rows)
+    df['season'] = seasons
+    df['team'] = rng.integers(1, 33, size=rows)
+    df['last_season_av'] = np.clip(skill / 10 + rng.normal(0, 2, size=rows), 0, None).round()
+    for i, col in enumerate(ATTRIBUTES):
+        df[col] = np.clip(skill + rng.normal(0, 8, size=rows) + i % 7, 1, 99).round()
+    df['archetype'] = rng.integers(1, 5, size=rows).astype(float)
+    df['runningstyle'] = rng.integers(1, 4, size=rows).astype(float)
+    df.loc[df['season'] < 2020, STYLE_ATTRIBUTES] = np.nan
+    df.loc[df['season'] < 2010, LATE_ATTRIBUTES] = np.nan
+    sparse = rng.random((rows, len(ATTRIBUTES))) < 0.05
+    df[ATTRIBUTES] = df[ATTRIBUTES].mask(sparse)
+    return df[META + GENERAL_ATTRIBUTES + ATTRIBUTES]
+
+
+def _without_seconds(telemetry):
+    return [{k: v for k, v in record.items() if k != 'seconds'} for record in telemetry]
+
+
+@pytest.fixture
+def no_saved_models(monkeypatch):
+    monkeypatch.setattr(imputer, 'save_pass_models', lambda *args, **kwargs: None)
+    # A few rounds per bin keep the fits short; equivalence does not depend on the round count
+    make_imputer = imputer.make_imputer
+    monkeypatch.setattr(imputer, 'make_imputer', lambda backend, estimator, random_state, max_iter, tol:
+                        make_imputer(backend, estimator, random_state, min(max_iter, 3), tol))
+
+
+def test_parallel_groups_equal_sequential(no_saved_models):
+    runner = MaddenImputationRunner()
+    jobs = [(group, synthetic_group(group, seed=i), 1, 1, None, False, 'iterative_ridge', None)
+            for i, group in enumerate(['o_rush', 'd_lb'])]
+
+    sequential = [_impute_group_worker(job, runner) for job in jobs]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        parallel = list(pool.map(_impute_group_worker, jobs))
+
+    for (seq_dataset, seq_telemetry), (par_dataset, par_telemetry) in zip(sequential, parallel):
+        pd.testing.assert_frame_equal(par_dataset, seq_dataset)
+        assert _without_seconds(par_telemetry) == _without_seconds(seq_telemetry)
+
+
+def test_parallel_bins_equal_sequential(no_saved_models):
+    group_df = synthetic_group('o_rush', seed=5)
+    runner = MaddenImputationRunner()
+    sequential = runner.impute_position_group('o_rush', group_df, bin_workers=1, save_models=False)
+    parallel = runner.impute_position_group('o_rush', group_df, bin_workers=2, blas_threads=1, save_models=False)
+    pd.testing.assert_frame_equal(parallel, sequential)
+    assert not sequential[ATTRIBUTES].drop(columns=STYLE_ATTRIBUTES).isna().any().any()
+
+
+def _bin_params(telemetry):
+    return {(record['pass'], record['bin']): {'max_iter': record['max_iter'], 'tol': record['tol']} for record in telemetry}
+
+
+def test_adaptive_settings_apply_only_to_the_bin_edges_they_came_from(no_saved_models, tmp_path):
+    group_df = synthetic_group('o_rush', seed=3)
+    runner = MaddenImputationRunner()
+    report = ImputationReport('iterative_ridge')
+    telemetry = []
+    runner.impute_position_group('o_rush', group_df, bin_workers=1, save_models=False, telemetry=telemetry)
+    report.extend(telemetry)
+    settings = adaptive_settings(read_imputation_report(report.write(tmp_path / 'report.json')), 'iterative_ridge')
+
+    expected = {(pass_key, bin_id): values
+                for pass_key, values in settings['o_rush'].items() for bin_id, values in values['bins'].items()}
+    assert any(values != {'max_iter': DEFAULT_MAX_ITER, 'tol': DEFAULT_TOL} for values in expected.values())
+    tuned = []
+    runner.impute_position_group('o_rush', group_df, bin_workers=1, save_models=False,
+                                 settings=settings['o_rush'], telemetry=tuned)
+    assert _bin_params(tuned) == expected
+
+    # The same bin ids under other edges are other rows
+    shifted = {pass_key: {**values, 'bin_edges': [edge + 0.5 for edge in values['bin_edges']]}
+               for pass_key, values in settings['o_rush'].items()}
+    defaults = []
+    runner.impute_position_group('o_rush', group_df, bin_workers=1, save_models=False,
+                                 settings=shifted, telemetry=defaults)
+    assert all(params == {'max_iter': DEFAULT_MAX_ITER, 'tol': DEFAULT_TOL} for params in _bin_params(defaults).values())
+
+
+@pytest.fixture
+def o_rush_store(monkeypatch, tmp_path):
+    """One synthetic group as the base ratings, imputers saved under tmp_path, no run report; returns saved groups."""
+    base = synthetic_group('o_rush', seed=7).assign(
+        high_pos_group='offense', position='HB', jerseynumber=20, birthdate=None, pfr_id=None
+    )
+    monkeypatch.setattr(MaddenImputationRunner, 'load_base_ratings', lambda self: setattr(self, 'base_ratings', base))
+    monkeypatch.setattr(MaddenImputationRunner, 'group_base_ratings',
+                        lambda self: setattr(self, 'base_rating_groups', {'o_rush': base.copy()}))
+    monkeypatch.setattr(imputer.ImputationReport, 'write', lambda self, path=None: None)
+    saves = []
+    save = partial(imputer.save_pass_models, root_path=tmp_path)
+    monkeypatch.setattr(imputer, 'save_pass_models', lambda position_group, models, backend: saves.append(position_group)
+                        or save(position_group, models, backend))
+    monkeypatch.setattr(imputer, 'load_pass_models', partial(imputer.load_pass_models, root_path=tmp_path))
+    make_imputer = imputer.make_imputer
+    monkeypatch.setattr(imputer, 'make_imputer', lambda backend, estimator, random_state, max_iter, tol:
+                        make_imputer(backend, estimator, random_state, min(max_iter, 3), tol))
+    return saves
+
+
+def test_incremental_run_transforms_with_saved_imputers(o_rush_store):
+    runner = MaddenImputationRunner()
+    full = runner.run(refit=True)
+    assert o_rush_store == ['o_rush']
+
+    incremental = runner.run(seasons=[2024, 2025], refit=False)
+    # Transformed with the saved models, nothing refitted
+    assert o_rush_store == ['o_rush']
+    assert set(incremental['season']) == {2024, 2025}
+    expected = full[full['season'].isin([2024, 2025])]
+    pd.testing.assert_frame_equal(
+        incremental.sort_values(['madden_id', 'season']).reset_index(drop=True),
+        expected.sort_values(['madden_id', 'season']).reset_index(drop=True),
+        check_exact=False,
+    )
+
+
+def test_rebuilding_every_season_with_ratings_refits(o_rush_store):
+    runner = MaddenImputationRunner()
+    runner.run(refit=True)
+    runner.run(seasons=list(range(2001, 2026)), refit=False)
+    assert o_rush_store == ['o_rush', 'o_rush']
+
+
+def test_make_dataset_madden_passes_bin_workers(monkeypatch):
+    calls = []
+    monkeypatch.setenv('MADDEN_IMPUTER_BIN_WORKERS', '0')
+    monkeypatch.setattr(MaddenImputationRunner, 'run', lambda self, **kwargs: calls.append(kwargs) or synthetic_group('o_rush'))
+    imputer.make_dataset_madden([2025], workers=2)
+    assert calls[0]['bin_workers'] == 0 and calls[0]['workers'] == 2
@@ -0,0 +1,92 @@
+"""
+Imputer backends: convergence telemetry of the iterative backend, knn / softimpute fill every missing value.
+"""
+import re
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+import pytest
+from sklearn.experimental import enable_iterative_imputer  # noqa: F401
+from sklearn.impute import IterativeImputer
+from sklearn.linear_model import Ridge
+
+from src.modeling.imputer_backends import TrackedIterativeImputer, fit_transform_with_convergence, make_imputer
+
+CHANGE_LINE = re.compile(r"\[IterativeImputer\] Change: (\S+), scaled tolerance: (\S+)")
+
+
+def _bin(seed=0, rows=200, cols=12, missing=0.2):
+    rng = np.random.default_rng(seed)
+    latent = rng.normal(size=(rows, 2))
+    X = 60 + 10 * latent @ rng.normal(size=(2, cols)) + rng.normal(scale=3, size=(rows, cols))
+    X[rng.random(X.shape) < missing] = np.nan
+    return X
+
+
+def _verbose_reference(X, max_iter, tol):
+    """Per round change, scaled tolerance and early stop as printed by a verbose IterativeImputer."""
+    reference = IterativeImputer(estimator=Ridge(alpha=1.0), random_state=42, max_iter=max_iter, tol=tol, verbose=1)
+    log = StringIO()
+    with redirect_stdout(log):
+        imputed = reference.fit_transform(X)
+    changes = [(float(change), float(scaled)) for change, scaled in CHANGE_LINE.findall(log.getvalue())]
+    return imputed, changes, 'Early stopping criterion reached' in log.getvalue()
+
+
+@pytest.mark.filterwarnings('ignore::sklearn.exceptions.ConvergenceWarning')
+@pytest.mark.parametrize('max_iter, tol', [(20, 1e-3), (3, 1e-6), (20, 1e-1)])
+def test_round_changes_match_verbose_iterative_imputer(max_iter, tol):
+    X = _bin()
+    expected, changes, stopped = _verbose_reference(X, max_iter, tol)
+    imputed, stats = fit_transform_with_convergence(make_imputer('iterative_ridge', max_iter=max_iter, tol=tol), X)
+
+    np.testing.assert_array_equal(imputed, expected)
+    assert stats['n_iter'] == len(changes)
+    np.testing.assert_allclose(stats['deltas'], [change for change, _ in changes], rtol=1e-12)
+    assert stats['scaled_tolerance'] == pytest.approx(changes[0][1], rel=1e-12)
+    assert stats['converged'] == stopped
+
+
+def test_complete_bin_converges_in_one_round():
+    X = np.nan_to_num(_bin(), nan=50.0)
+    _, stats = fit_transform_with_convergence(make_imputer('iterative_ridge'), X)
+    assert stats['n_iter'] == 1 and stats['converged'] and stats['deltas'] == [0.0]
+
+
+def test_saved_model_transforms_like_iterative_imputer():
+    X, new_rows = _bin(seed=1), _bin(seed=2, rows=30)
+    tracked = TrackedIterativeImputer(estimator=Ridge(alpha=1.0), random_state=42).fit(X)
+    plain = IterativeImputer(estimator=Ridge(alpha=1.0), random_state=42).fit(X)
+    np.testing.assert_array_equal(tracked.transform(new_rows), plain.transform(new_rows))
+    assert tracked._round_start is None
+
+
+@pytest.mark.parametrize('backend', ['knn', 'softimpute'])
+def test_backend_fills_every_missing_value(backend):
+    X, new_rows = _bin(seed=3), _bin(seed=4, rows=30)
+    # A column no row of the bin observed still gets values
+    X[:, 0] = np.nan
+    imputer = make_imputer(backend)
+    imputed = imputer.fit_transform(X)
+
+    assert imputed.shape == X.shape and not np.isnan(imputed).any()
+    observed = ~np.isnan(X)
+    np.testing.assert_array_equal(imputed[observed], X[observed])
+    transformed = imputer.transform(new_rows)
+    assert transformed.shape == new_rows.shape and not np.isnan(transformed).any()
+
+
+@pytest.mark.parametrize('backend', ['knn', 'softimpute'])
+def test_backend_reports_convergence_where_it_iterates(backend):
+    _, stats = fit_transform_with_convergence(make_imputer(backend), _bin(seed=5))
+    assert stats['scaled_tolerance'] is None
+    if backend == 'softimpute':
+        assert stats['n_iter'] == len(stats['deltas']) and stats['converged']
+    else:
+        assert stats['n_iter'] is None and stats['converged'] is None
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError, match='Unknown imputer backend'):
+        make_imputer('mice')
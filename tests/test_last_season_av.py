@@ -0,0 +1,74 @@
+"""
+Vectorized last_season_av attachment against the original per-season loop with apply_rookie_av.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from nfl_data_loader.workflows.transforms.players.player import apply_rookie_av
+
+from src.store.approximate_value import ApproximateValueStore
+from src.transforms.madden_registry import _attach_last_season_av
+
+
+# ---------- Reference (original per-season loop) ----------------------------
+def _legacy_attach_last_season_av(pre_season_registry, av_store):
+    registries = []
+    for season in pre_season_registry.season.unique():
+        df = pre_season_registry[pre_season_registry.season == season].copy()
+        df['is_rookie'] = (df['rookie_season'] == season) & (df.yearspro == 0)
+        av_df = av_store.season(season - 1)[['player_id', 'approximate_value']].rename(
+            columns={'player_id': 'pfr_id', 'approximate_value': 'last_season_av'})
+        df = pd.merge(df, av_df, on='pfr_id', how='left')
+
+        rookie_approx_value_df = df[df['is_rookie'] == True].copy()
+        rookie_approx_value_df.draft_round = rookie_approx_value_df.draft_round.fillna(8)
+        rookie_approx_value_df.draft_pick = rookie_approx_value_df.draft_pick.fillna(rookie_approx_value_df.draft_pick.max() + 1)
+        rookie_approx_value_df = rookie_approx_value_df.apply(apply_rookie_av, axis=1)
+
+        df = df[df['is_rookie'] == False].copy()
+        df = pd.concat([df, rookie_approx_value_df], ignore_index=True).drop_duplicates(subset=['player_id'], keep='first')
+        registries.append(df)
+    return pd.concat(registries, ignore_index=True)
+
+
+# ---------- Fixture ---------------------------------------------------------
+SEASONS = [2004, 2002, 2003]
+
+
+@pytest.fixture
+def av_store(tmp_path):
+    rng = np.random.default_rng(3)
+    for season in [2001, 2002, 2003]:
+        rows = [{'player_id': f'PFR{i:02d}', 'name': f'P {i}', 'team': 'kan', 'season': season, 'approximate_value': int(rng.integers(0, 15))}
+                for i in range(0, 40, 2)]
+        # Traded mid season: one row per team
+        rows += [{'player_id': pfr_id, 'name': pfr_id, 'team': 'nyj', 'season': season, 'approximate_value': 1} for pfr_id in ['PFR04', 'PFR06']]
+        pd.DataFrame(rows).to_csv(tmp_path / f'{season}.csv', index=False)
+    return ApproximateValueStore(root_path=tmp_path)
+
+
+def _pre_season_registry():
+    rng = np.random.default_rng(11)
+    rows = []
+    for season in SEASONS:
+        for i in range(40):
+            rookie_season = season if i % 4 == 0 else season - int(rng.integers(1, 4))
+            drafted = i % 8 != 0
+            rows.append({
+                'player_id': f'00-{i:04d}',
+                'pfr_id': f'PFR{i:02d}' if i % 5 else None,
+                'season': season,
+                'rookie_season': rookie_season,
+                'yearspro': 0 if rookie_season == season else season - rookie_season,
+                'draft_round': float(rng.integers(1, 8)) if drafted else np.nan,
+                'draft_pick': float(i // 4 + 1) if drafted else np.nan,
+                'fullname': f'Player {i}',
+            })
+    return pd.DataFrame(rows)
+
+
+def test_attach_last_season_av_matches_per_season_loop(av_store):
+    registry = _pre_season_registry()
+    expected = _legacy_attach_last_season_av(registry, av_store)
+    actual = _attach_last_season_av(registry, av_store)
+    pd.testing.assert_frame_equal(actual[expected.columns], expected, check_dtype=False)
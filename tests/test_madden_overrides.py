@@ -0,0 +1,66 @@
+"""
+Override table ordering: specificity decides, blanks never overwrite, rules match the raw fullname.
+"""
+import pandas as pd
+import pytest
+
+from src.transforms.madden_overrides import apply_overrides, load_overrides, override_match_totals, write_override_report
+
+
+def _table(tmp_path, rows):
+    path = tmp_path / 'overrides.csv'
+    columns = ['fullname', 'season', 'team', 'new_fullname', 'position_group', 'position', 'reason']
+    pd.DataFrame(rows, columns=columns).to_csv(path, index=False)
+    return load_overrides(path)
+
+
+def _roster():
+    return pd.DataFrame({
+        'fullname': ['J.Doe', 'J.Doe', 'J.Doe'],
+        'season': [2001, 2002, 2002],
+        'team': ['KC', 'KC', 'NE'],
+        'position_group': ['o_line', 'o_line', 'o_line'],
+        'position': ['LT', 'LT', 'LT'],
+    })
+
+
+def test_most_specific_rule_wins_per_column(tmp_path):
+    overrides = _table(tmp_path, [
+        ['J.Doe', '', '', 'John Doe', 'd_line', 'DT', ''],
+        ['J.Doe', '', 'NE', '', 'd_field', '', ''],
+        ['J.Doe', '2002', '', '', 'o_pass', '', ''],
+        ['J.Doe', '2002', 'NE', '', '', 'TE', ''],
+    ])
+    df, report = apply_overrides(_roster(), overrides)
+    # Renamed by the fullname rule, the season / team rules still match the raw name
+    assert df['fullname'].tolist() == ['John Doe'] * 3
+    # fullname < fullname+team < fullname+season < fullname+season+team; the blank position_group of the last rule
+    # keeps the season rule's value
+    assert df['position_group'].tolist() == ['d_line', 'o_pass', 'o_pass']
+    assert df['position'].tolist() == ['DT', 'DT', 'TE']
+    assert report['matched_rows'].tolist() == [3, 1, 2, 1]
+
+
+def test_duplicate_keys_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        _table(tmp_path, [
+            ['J.Doe', '2002', '', '', 'd_line', '', ''],
+            ['J.Doe', '2002', '', '', 'o_line', '', ''],
+        ])
+
+
+def test_report_keeps_rules_that_matched_nothing(tmp_path):
+    overrides = _table(tmp_path, [
+        ['J.Doe', '2002', 'NE', '', '', 'TE', ''],
+        ['R.Gone', '2002', '', 'Retired Player', '', '', 'renamed in the raw export'],
+    ])
+    _, report = apply_overrides(_roster(), overrides)
+    reports = tmp_path / 'reports'
+    write_override_report(report, 2002, root_path=reports)
+    write_override_report(report, 2003, root_path=reports)
+
+    totals = override_match_totals(reports).set_index('fullname')
+    assert totals.loc['J.Doe', 'matched_rows'] == 2
+    assert totals.loc['J.Doe', 'seasons'] == [2002, 2003]
+    assert totals.loc['R.Gone', 'matched_rows'] == 0
+    assert totals.loc['R.Gone', 'seasons'] == []
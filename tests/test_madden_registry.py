@@ -0,0 +1,125 @@
+"""
+MaddenRegistry matching on a small synthetic league: incremental rematching against a full rematch.
+"""
+from functools import partial
+
+import pandas as pd
+import pytest
+
+from src.transforms import madden_registry
+from src.transforms.madden_registry import MaddenRegistry, _first_mode, read_registry_matches, write_registry_matches
+from src.transforms.registry_report import CascadeReport
+
+SEASONS = [2001, 2002, 2003]
+
+# player_id, fullname, position_group, birthdate, seasons on the roster
+PLAYERS = [
+    ('00-01', 'Tom Brady', 'quarterback', '1977-08-03', SEASONS),
+    ('00-02', 'Marcus Allen-Smith', 'o_rush', '1980-02-11', SEASONS),
+    ('00-03', 'Jerome Bettis', 'o_rush', '1972-02-16', SEASONS),
+    ('00-04', 'Walter Jones', 'o_line', None, [2003]),
+    ('00-05', 'Ed Reed', 'd_field', '1978-09-11', [2002, 2003]),
+    ('00-06', 'Ray Lewis', 'd_lb', '1975-05-15', SEASONS),
+]
+# madden_id, fullname, position_group, birthdate, seasons in Madden
+MADDEN = [
+    ('TOMBRADY_19770803', 'Tom Brady', 'quarterback', '1977-08-03', SEASONS),
+    ('MARCUSALLENSMITH_19800211', 'Marcus Allen Smith', 'o_rush', '1980-02-11', SEASONS),
+    ('J.BETTIS_o_rush', 'J.Bettis', 'o_rush', None, [2001]),
+    ('JEROMEBETTIS_19720216', 'Jerome Bettis', 'o_rush', '1972-02-16', [2002, 2003]),
+    ('WALTERJONES_o_line', 'Walter Jones', 'o_line', None, [2001, 2002]),
+    ('RAYLEWIS_19750515', 'Ray Lewis', 'd_lb', '1975-05-15', SEASONS),
+]
+
+
+def _rosters():
+    rows = [
+        {'player_id': player_id, 'season': season, 'fullname': name, 'team': 'BAL', 'high_pos_group': group,
+         'position_group': group, 'position': group, 'jerseynumber': 10 + i, 'yearspro': season - 2000,
+         'birthdate': birthdate}
+        for i, (player_id, name, group, birthdate, seasons) in enumerate(PLAYERS) for season in seasons
+    ]
+    return pd.DataFrame(rows)
+
+
+def _staged(madden):
+    rows = [
+        {'madden_id': madden_id, 'season': season, 'fullname': name, 'team': 'BAL', 'high_pos_group': group,
+         'position_group': group, 'position': group, 'jerseynumber': None, 'yearspro': None, 'age': None,
+         'birthdate': birthdate, 'overallrating': 80.0}
+        for madden_id, name, group, birthdate, seasons in madden for season in seasons
+    ]
+    return pd.DataFrame(rows)
+
+
+def _registry(madden):
+    registry = MaddenRegistry.__new__(MaddenRegistry)
+    registry.fuzzy_workers = 1
+    registry.report = CascadeReport()
+    registry._name_index = None
+    registry.staged_madden_ratings = _staged(madden)
+    registry.nflverse_player_rosters = _rosters()
+    return registry
+
+
+@pytest.fixture
+def matches_path(tmp_path, monkeypatch):
+    path = tmp_path / 'matches.parquet'
+    monkeypatch.setattr(madden_registry, 'find_year_for_season', lambda: SEASONS[-1])
+    monkeypatch.setattr(madden_registry, 'read_registry_matches', partial(read_registry_matches, path=path))
+    monkeypatch.setattr(madden_registry, 'write_registry_matches', partial(write_registry_matches, path=path))
+    return path
+
+
+def _build(madden, rematch_seasons=None):
+    """Per-season matches, unmatched rows and the registry including the cross season ties."""
+    registry = _registry(madden)
+    matches, unmatched = registry.mapper(rematch_seasons=rematch_seasons, workers=1)
+    pairs = _first_mode(matches, 'player_id', 'madden_id').reset_index().drop_duplicates(['madden_id'])
+    pairs = pd.concat([pairs, registry.match_across_seasons(unmatched, pairs).drop(columns=['stage'])])
+    return (
+        matches.sort_values(['season', 'madden_id', 'player_id']).reset_index(drop=True)[['season', 'madden_id', 'player_id', 'stage']],
+        sorted(zip(unmatched['season'], unmatched['madden_id'])),
+        pairs.sort_values(['madden_id', 'player_id']).reset_index(drop=True),
+    )
+
+
+def test_incremental_rematch_equals_full_rematch(matches_path):
+    _build(MADDEN)
+    # 2002 restaged: Ed Reed appears, Walter Jones drops out
+    changed = [row for row in MADDEN if row[0] != 'WALTERJONES_o_line'] + [
+        ('WALTERJONES_o_line', 'Walter Jones', 'o_line', None, [2001]),
+        ('EDREED_19780911', 'Ed Reed', 'd_field', '1978-09-11', [2002]),
+    ]
+    incremental = _build(changed, rematch_seasons=[2002])
+
+    matches_path.unlink()
+    full = _build(changed)
+
+    pd.testing.assert_frame_equal(incremental[0], full[0])
+    assert incremental[1] == full[1]
+    pd.testing.assert_frame_equal(incremental[2], full[2])
+    # The fixture exercises reuse, new matches and a cross season tie
+    assert 'EDREED_19780911' in set(full[0]['madden_id'])
+    assert ('00-04', 'WALTERJONES_o_line') in set(zip(full[2]['player_id'], full[2]['madden_id']))
+
+
+def test_unchanged_rerun_reuses_matches(matches_path):
+    first = _build(MADDEN)
+    second = _build(MADDEN, rematch_seasons=[])
+    pd.testing.assert_frame_equal(first[0], second[0])
+    assert first[1] == second[1]
+
+
+def test_parallel_matching_equals_sequential(matches_path):
+    registry = _registry(MADDEN)
+    sequential, sequential_unmatched = registry.mapper(workers=1)
+    sequential_records = registry.report.records
+
+    registry = _registry(MADDEN)
+    parallel, parallel_unmatched = registry.mapper(workers=2)
+
+    pd.testing.assert_frame_equal(parallel, sequential)
+    pd.testing.assert_frame_equal(parallel_unmatched, sequential_unmatched)
+    drop_seconds = lambda records: [{k: v for k, v in record.items() if k != 'seconds'} for record in records]
+    assert drop_seconds(registry.report.records) == drop_seconds(sequential_records)
@@ -0,0 +1,109 @@
+"""
+Incremental rebuilds of the stage DAG: which season files are rewritten when one upstream season changes.
+"""
+import pandas as pd
+import pytest
+
+import madden_runner
+from madden_runner import dataset_madden_meta, madden_runner as run_dag, processed_madden_meta, stage_madden_meta
+
+SEASONS = [2001, 2002, 2003]
+
+
+def _write_stage(season, value):
+    pd.DataFrame({'season': [season], 'value': [value]}).to_parquet(f'./data/madden/stage/{season}.parquet', index=False)
+
+
+def _all_seasons_builder(update_seasons, workers=None):
+    """Cross-season builder: every season depends on every stage season (like the registry / imputer)."""
+    stage = pd.concat([pd.read_parquet(f'./data/madden/stage/{season}.parquet') for season in SEASONS])
+    total = stage['value'].sum()
+    return {season: pd.DataFrame({'season': [season], 'total': [total]}) for season in SEASONS}
+
+
+def _per_season_builder(update_seasons, workers=None):
+    return {season: pd.read_parquet(f'./data/madden/stage/{season}.parquet') for season in update_seasons}
+
+
+def _meta(name, builder, cross_season):
+    return {
+        'name': name,
+        'start_season': 2001,
+        'raw_obj': builder,
+        'file_format': 'parquet',
+        'upstream': [{'path': './data/madden/stage/{season}.parquet'}],
+        'code': [],
+        'cross_season': cross_season,
+    }
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for layer in ['stage', 'derived']:
+        (tmp_path / 'data' / 'madden' / layer).mkdir(parents=True)
+    for season in SEASONS:
+        _write_stage(season, 1)
+    return tmp_path / 'data' / 'madden'
+
+
+def _mtimes(store):
+    return {season: (store / 'derived' / f'{season}.parquet').stat().st_mtime_ns for season in SEASONS}
+
+
+def _rebuild_after_changing_2002(store, meta):
+    run_dag(metas=[meta])
+    before = _mtimes(store)
+    _write_stage(2002, 5)
+    run_dag(metas=[meta])
+    after = _mtimes(store)
+    return sorted(season for season in SEASONS if after[season] != before[season])
+
+
+def test_cross_season_stage_rewrites_every_recomputed_season(store):
+    rewritten = _rebuild_after_changing_2002(store, _meta('derived', _all_seasons_builder, cross_season=True))
+    assert rewritten == SEASONS
+    for season in SEASONS:
+        assert pd.read_parquet(store / 'derived' / f'{season}.parquet')['total'].item() == 7
+
+
+def test_per_season_stage_rewrites_only_the_changed_season(store):
+    rewritten = _rebuild_after_changing_2002(store, _meta('derived', _per_season_builder, cross_season=False))
+    assert rewritten == [2002]
+
+
+def test_unchanged_inputs_skip_the_builder(store):
+    meta = _meta('derived', _all_seasons_builder, cross_season=True)
+    run_dag(metas=[meta])
+    calls = []
+    meta['raw_obj'] = lambda seasons, workers=None: calls.append(seasons) or {}
+    run_dag(metas=[meta])
+    assert calls == []
+
+
+def test_refresh_latest_season_rebuilds_it_with_unchanged_inputs(store):
+    meta = dict(_meta('derived', _per_season_builder, cross_season=False), refresh_latest_season=True)
+    run_dag(metas=[meta])
+    calls = []
+    meta['raw_obj'] = lambda seasons, workers=None: calls.append(seasons) or _per_season_builder(seasons)
+    run_dag(metas=[meta])
+    assert calls == [[2003]]
+
+
+def test_cross_season_stages_are_flagged():
+    assert processed_madden_meta['cross_season'] and dataset_madden_meta['cross_season']
+    assert not stage_madden_meta.get('cross_season')
+    # processed joins the nflverse rosters, dataset only reads processed files
+    assert processed_madden_meta['refresh_latest_season'] and not dataset_madden_meta.get('refresh_latest_season')
+
+
+def test_code_fingerprints_follow_builder_imports():
+    assert {'src/transforms/madden_overrides.py', 'src/transforms/madden_overrides.csv'} <= set(stage_madden_meta['code'])
+    assert {
+        'src/transforms/name_index.py',
+        'src/store/approximate_value.py',
+        'src/extracts/nflverse.py',
+        'src/store/madden_store.py',
+    } <= set(processed_madden_meta['code'])
+    assert {'src/modeling/imputer_backends.py', 'src/modeling/imputer_report.py'} <= set(dataset_madden_meta['code'])
+    assert madden_runner.FEATURE_STORE_METAS[-1] is dataset_madden_meta
@@ -0,0 +1,37 @@
+"""
+Assembly of checkpointed PFR team seasons into approximate_value frames.
+"""
+import pandas as pd
+import pytest
+
+from src.extracts import pfr
+
+
+@pytest.fixture
+def checkpoints(tmp_path, monkeypatch):
+    monkeypatch.setattr(pfr, 'CHECKPOINT_DIR', tmp_path)
+    return tmp_path
+
+
+def _fail_teams(monkeypatch, failing):
+    def fetch(team_str, season, session, limiter):
+        if team_str in failing:
+            raise ValueError(f'{team_str} {season} failed')
+        df = pd.DataFrame([{'player_id': f'{team_str}01', 'name': 'A', 'team': team_str, 'season': season, 'approximate_value': 3}])
+        path = pfr._checkpoint_path(season, team_str)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(path, index=False)
+        return df
+
+    monkeypatch.setattr(pfr, '_fetch_and_checkpoint', fetch)
+
+
+def test_partial_season_keeps_the_completed_teams(checkpoints, monkeypatch):
+    _fail_teams(monkeypatch, {'kan'})
+    frames = pfr.get_approximate_values([2020], workers=1, allow_partial=True)
+    assert len(frames[2020]) == len(pfr.NFL_SR_ABBR_LIST) - 1
+
+
+def test_season_where_every_team_failed_is_skipped(checkpoints, monkeypatch):
+    _fail_teams(monkeypatch, set(pfr.NFL_SR_ABBR_LIST))
+    assert pfr.get_approximate_values([2020], workers=1, allow_partial=True) == {}
@@ -0,0 +1,117 @@
+"""
+Vectorized MaddenRegistry birthdate, age and madden_id passes against the original row-wise passes.
+"""
+import numpy as np
+import pandas as pd
+
+from src.transforms.madden_registry import NFL_SEASON_OPENERS, MaddenRegistry, _age_on_season_start, _first_mode
+
+
+# ---------- Reference (original row-wise) implementation -------------------
+def _legacy_age_on_season_start(birthdate, season):
+    if pd.isna(birthdate) or season not in NFL_SEASON_OPENERS:
+        return pd.NA
+    start = pd.to_datetime(NFL_SEASON_OPENERS[season])
+    return int((start - birthdate.normalize()).days // 365)
+
+
+def _legacy_madden_id(row):
+    name = str(row['fullname']).strip().upper().replace(' ', '')
+    if pd.notna(row.get("birthdate")):
+        return f"{name}_{pd.to_datetime(row['birthdate']).strftime('%Y%m%d')}"
+    return f"{name}_{row['position_group']}"
+
+
+def _legacy_birthdate_pool(staged):
+    birthdate_pool = staged[staged['birthdate'].notna()].copy()
+    birthdate_pool['birthdate'] = pd.to_datetime(birthdate_pool['birthdate'], format='mixed').dt.strftime('%Y-%m-%d')
+    pool = birthdate_pool.groupby("madden_id")["birthdate"].agg(lambda s: s.mode().iloc[0])
+    birthdate = staged["birthdate"].fillna(staged["madden_id"].map(pool))
+    return pd.to_datetime(birthdate).dt.strftime("%Y-%m-%d")
+
+
+def _legacy_age_pool(staged):
+    stage = staged.copy()
+    stage["birthdate"] = pd.to_datetime(stage["birthdate"], errors='coerce')
+    missing_age_with_birthdate = stage['age'].isna() & stage['birthdate'].notna()
+    stage.loc[missing_age_with_birthdate, 'age'] = stage.loc[missing_age_with_birthdate].apply(
+        lambda row: _legacy_age_on_season_start(row.birthdate, row.season), axis=1
+    )
+    known_ages = stage[stage['age'].notna()].sort_values('season').groupby('madden_id')[['season', 'age']].first().reset_index()
+    age_lookup = {row['madden_id']: (row['season'], row['age']) for _, row in known_ages.iterrows()}
+
+    def infer_age_from_known(row):
+        if pd.notna(row['age']):
+            return row['age']
+        data = age_lookup.get(row['madden_id'])
+        if not data:
+            return pd.NA
+        known_season, known_age = data
+        return known_age + (row['season'] - known_season)
+
+    stage['age'] = stage.apply(infer_age_from_known, axis=1)
+    return pd.to_numeric(stage['age'], errors='coerce').astype('Int64')
+
+
+# ---------- Fixture ---------------------------------------------------------
+def _staged():
+    rng = np.random.default_rng(7)
+    names = ['Tom Brady', 'Ray Lewis ', 'Ed Reed', 'Walter Jones', 'DJ Moore', 'Jerome Bettis']
+    rows = []
+    for i in range(300):
+        name = names[i % len(names)]
+        season = int(rng.integers(1999, 2027))
+        birthdate = rng.choice([None, '1977-08-03', '1977-08-04', '1980-02-29', '1975-05-15', '1979-12-31'])
+        rows.append({
+            'madden_id': f"{name.strip().upper().replace(' ', '')}_{i % 4}",
+            'season': season,
+            'fullname': name,
+            'position_group': rng.choice(['quarterback', 'd_lb', 'o_line']),
+            'birthdate': birthdate,
+            'age': rng.choice([np.nan, np.nan, 24.0, 31.0]),
+        })
+    return pd.DataFrame(rows)
+
+
+def _registry(staged):
+    registry = MaddenRegistry.__new__(MaddenRegistry)
+    registry.staged_madden_ratings = staged.copy()
+    registry.base_ratings = staged.copy()
+    return registry
+
+
+def test_first_mode_matches_mode_iloc_0():
+    df = _staged().dropna(subset=['birthdate'])
+    expected = df.groupby('madden_id')['birthdate'].agg(lambda s: s.mode().iloc[0])
+    pd.testing.assert_series_equal(_first_mode(df, 'madden_id', 'birthdate'), expected, check_names=False)
+
+
+def test_age_on_season_start_matches_row_wise():
+    df = _staged()
+    birthdates = pd.to_datetime(df['birthdate'], format='mixed')
+    expected = [_legacy_age_on_season_start(b, s) for b, s in zip(birthdates, df['season'])]
+    actual = _age_on_season_start(birthdates, df['season'])
+    assert [None if pd.isna(v) else int(v) for v in actual] == [None if pd.isna(v) else v for v in expected]
+
+
+def test_birthdate_pool_matches_row_wise():
+    staged = _staged()
+    registry = _registry(staged)
+    registry.apply_birthdate_pool()
+    pd.testing.assert_series_equal(registry.staged_madden_ratings['birthdate'], _legacy_birthdate_pool(staged))
+
+
+def test_age_pool_matches_row_wise():
+    registry = _registry(_staged())
+    registry.apply_birthdate_pool()
+    staged = registry.staged_madden_ratings.copy()
+    registry.apply_age_pool()
+    pd.testing.assert_series_equal(registry.staged_madden_ratings['age'], _legacy_age_pool(staged))
+
+
+def test_madden_uid_matches_row_wise():
+    registry = _registry(_staged())
+    registry.apply_birthdate_pool()
+    expected = registry.staged_madden_ratings.apply(_legacy_madden_id, axis=1)
+    registry.apply_madden_uid()
+    pd.testing.assert_series_equal(registry.staged_madden_ratings['madden_id'], expected, check_names=False)